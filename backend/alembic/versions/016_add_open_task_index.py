@@ -0,0 +1,31 @@
+"""add partial index for open tasks
+
+The dashboard and chat context repeatedly ask for a team's tasks that are not
+done. A partial index over just those rows stays small as completed tasks pile
+up. Status is a native enum storing member names, hence 'DONE'. Built
+CONCURRENTLY so task writes are not blocked while the index builds.
+
+Revision ID: 016_add_open_task_index
+Revises: 015_add_notifications
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '016_add_open_task_index'
+down_revision = '015_add_notifications'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_open ON tasks (team_id) "
+            "WHERE status != 'DONE'"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_open")
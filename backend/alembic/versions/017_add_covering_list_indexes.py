@@ -0,0 +1,35 @@
+"""add covering indexes for task and meeting list queries
+
+Lets Postgres answer the "team tasks by status ordered by due date" and
+"team meetings newest first" list queries with index-only scans. Built
+CONCURRENTLY so writes are not blocked while the indexes build.
+
+Revision ID: 017_add_covering_list_indexes
+Revises: 016_add_open_task_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '017_add_covering_list_indexes'
+down_revision = '016_add_open_task_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_status_due "
+            "ON tasks (team_id, status, due_date) INCLUDE (title, priority, assignee_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meeting_team_created "
+            "ON meetings (team_id, created_at) INCLUDE (title, status)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_meeting_team_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_status_due")
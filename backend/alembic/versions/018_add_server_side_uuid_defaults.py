@@ -0,0 +1,36 @@
+"""add server-side UUID defaults to primary keys
+
+Gives every String(36) primary key a gen_random_uuid() default so rows
+inserted outside the ORM (bulk Core inserts, SQL scripts, data fixes) get an
+id from Postgres. The models keep their Python-side uuid4 default, which
+SQLAlchemy applies before the INSERT, so ORM objects still know their id
+without a RETURNING round trip.
+
+Revision ID: 018_add_server_side_uuid_defaults
+Revises: 017_add_covering_list_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '018_add_server_side_uuid_defaults'
+down_revision = '017_add_covering_list_indexes'
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    'teams', 'users', 'tasks', 'meetings', 'action_items', 'integrations',
+    'messages', 'emails', 'direct_messages', 'calendar_preferences',
+    'team_invitations', 'task_comments', 'notifications',
+)
+
+
+def upgrade():
+    # gen_random_uuid() is built in from PG13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()::text")
+
+
+def downgrade():
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,29 @@
+"""add full-text index on meeting summaries
+
+GIN index over to_tsvector('english', summary) so the chat assistant can rank
+a team's meetings by relevance to the question in the database.
+
+Revision ID: 019_add_meeting_summary_fts_index
+Revises: 018_add_server_side_uuid_defaults
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '019_add_meeting_summary_fts_index'
+down_revision = '018_add_server_side_uuid_defaults'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meeting_summary_fts ON meetings "
+            "USING gin (to_tsvector('english', summary))"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_meeting_summary_fts")
@@ -0,0 +1,32 @@
+"""add composite task indexes for analytics predicates
+
+Backs the (team_id, created_at), (team_id, status, updated_at) and
+(assignee_id, status, due_date) filters used by the analytics and chat
+aggregates. Meetings are already covered by idx_meeting_team_created.
+Built CONCURRENTLY so task writes are not blocked while the indexes build.
+
+Revision ID: 020_add_analytics_task_indexes
+Revises: 019_add_meeting_summary_fts_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '020_add_analytics_task_indexes'
+down_revision = '019_add_meeting_summary_fts_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_created ON tasks (team_id, created_at)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_status_updated ON tasks (team_id, status, updated_at)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_assignee_status_due ON tasks (assignee_id, status, due_date)")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_assignee_status_due")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_status_updated")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_created")
@@ -0,0 +1,34 @@
+"""ensure per-user unique index on emails.gmail_message_id
+
+Email sync deduplicates server-side with INSERT ... ON CONFLICT DO NOTHING on
+(user_id, gmail_message_id). The emails table was originally created by
+create_all, so databases created before the model's unique constraint existed
+may lack it. Remove any duplicates, then add the unique index if missing.
+
+Revision ID: 021_add_emails_user_message_unique_index
+Revises: 020_add_analytics_task_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '021_add_emails_user_message_unique_index'
+down_revision = '020_add_analytics_task_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "DELETE FROM emails a USING emails b "
+        "WHERE a.user_id = b.user_id AND a.gmail_message_id = b.gmail_message_id "
+        "AND (a.created_at, a.id) > (b.created_at, b.id)"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_emails_user_gmail_id "
+        "ON emails (user_id, gmail_message_id)"
+    )
+
+
+def downgrade():
+    # The unique constraint is part of the model; nothing to undo
+    pass
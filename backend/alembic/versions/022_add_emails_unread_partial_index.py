@@ -0,0 +1,29 @@
+"""add partial index for unread email counts
+
+Backs the unread FILTER in the email stats aggregate and unread listings
+without indexing the read majority of the mailbox.
+
+Revision ID: 022_add_emails_unread_partial_index
+Revises: 021_add_emails_user_message_unique_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '022_add_emails_unread_partial_index'
+down_revision = '021_add_emails_user_message_unique_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_user_unread "
+            "ON emails (user_id) WHERE is_read = false"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_user_unread")
@@ -0,0 +1,36 @@
+"""add trigram indexes for email subject/sender search
+
+list_emails filters with ILIKE '%term%' on subject and sender. A leading
+wildcard cannot use a btree, so back both columns with pg_trgm GIN indexes.
+Built CONCURRENTLY so syncing users are not blocked while the index builds.
+
+Revision ID: 023_add_emails_trigram_indexes
+Revises: 022_add_emails_unread_partial_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '023_add_emails_trigram_indexes'
+down_revision = '022_add_emails_unread_partial_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_subject_trgm "
+            "ON emails USING gin (subject gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_sender_trgm "
+            "ON emails USING gin (sender gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_sender_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_subject_trgm")
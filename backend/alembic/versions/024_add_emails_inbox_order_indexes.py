@@ -0,0 +1,45 @@
+"""add inbox-ordered email indexes
+
+list_emails pages through WHERE user_id = ? ORDER BY received_at DESC.
+Replace ix_emails_user_received with (user_id, received_at DESC, id DESC),
+which also gives keyset pagination a unique ordering, and add a partial
+variant for the unread view. The partial one supersedes ix_emails_user_unread.
+
+Revision ID: 024_add_emails_inbox_order_indexes
+Revises: 023_add_emails_trigram_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '024_add_emails_inbox_order_indexes'
+down_revision = '023_add_emails_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_user_received_desc "
+            "ON emails (user_id, received_at DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_user_unread_received "
+            "ON emails (user_id, received_at DESC) WHERE is_read = false"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_user_received")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_user_unread")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_user_unread "
+            "ON emails (user_id) WHERE is_read = false"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emails_user_received "
+            "ON emails (user_id, received_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_user_unread_received")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emails_user_received_desc")
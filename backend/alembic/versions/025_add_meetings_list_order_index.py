@@ -0,0 +1,35 @@
+"""add newest-first meetings list index
+
+get_meetings pages through WHERE team_id = ? ORDER BY created_at DESC, id DESC
+with a keyset cursor. Replace idx_meeting_team_created with
+(team_id, created_at DESC, id DESC), keeping the INCLUDE (title, status)
+columns the analytics date-range aggregates read from it.
+
+Revision ID: 025_add_meetings_list_order_index
+Revises: 024_add_emails_inbox_order_indexes
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '025_add_meetings_list_order_index'
+down_revision = '024_add_emails_inbox_order_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meeting_team_created_desc "
+            "ON meetings (team_id, created_at DESC, id DESC) INCLUDE (title, status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_meeting_team_created")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meeting_team_created "
+            "ON meetings (team_id, created_at) INCLUDE (title, status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_meeting_team_created_desc")
@@ -0,0 +1,30 @@
+"""add action_items.meeting_id index
+
+selectinload(Meeting.action_items) runs WHERE meeting_id IN (...) for every
+meetings page, and ON DELETE CASCADE from meetings looks rows up the same
+way; without an index both scan the whole table. The meetings list side is
+covered by idx_meeting_team_created_desc and idx_meeting_team_status.
+
+Revision ID: 026_add_action_items_meeting_index
+Revises: 025_add_meetings_list_order_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '026_add_action_items_meeting_index'
+down_revision = '025_add_meetings_list_order_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_action_items_meeting_id "
+            "ON action_items (meeting_id)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_action_items_meeting_id")
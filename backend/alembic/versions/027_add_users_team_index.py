@@ -0,0 +1,29 @@
+"""add users.team_id index
+
+Team member lookups (assignee matching, team user id lists, ON DELETE
+CASCADE from teams) all filter users by team_id, which had no index, so
+each one scanned the whole users table.
+
+Revision ID: 027_add_users_team_index
+Revises: 026_add_action_items_meeting_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '027_add_users_team_index'
+down_revision = '026_add_action_items_meeting_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_team_id "
+            "ON users (team_id)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_team_id")
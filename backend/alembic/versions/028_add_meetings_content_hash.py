@@ -0,0 +1,32 @@
+"""add meetings.content_hash
+
+SHA-256 of the uploaded recording. upload_meeting looks up a completed
+meeting of the same team with the same hash and copies its results instead
+of transcribing identical audio again. Not unique: re-uploading a recording
+is allowed, it just doesn't cost another transcription.
+
+Revision ID: 028_add_meetings_content_hash
+Revises: 027_add_users_team_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '028_add_meetings_content_hash'
+down_revision = '027_add_users_team_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE meetings ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_meeting_team_content_hash "
+            "ON meetings (team_id, content_hash)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_meeting_team_content_hash")
+    op.execute("ALTER TABLE meetings DROP COLUMN IF EXISTS content_hash")
@@ -0,0 +1,35 @@
+"""add newest-first tasks list index
+
+get_tasks pages through WHERE team_id = ? ORDER BY created_at DESC, id DESC
+with a keyset cursor. Replace idx_task_team_created with
+(team_id, created_at DESC, id DESC); the analytics created_at range counts
+scan it just as well in either direction.
+
+Revision ID: 029_add_tasks_list_order_index
+Revises: 028_add_meetings_content_hash
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '029_add_tasks_list_order_index'
+down_revision = '028_add_meetings_content_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_created_desc "
+            "ON tasks (team_id, created_at DESC, id DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_created")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_created "
+            "ON tasks (team_id, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_created_desc")
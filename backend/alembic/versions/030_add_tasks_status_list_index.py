@@ -0,0 +1,45 @@
+"""add status-filtered tasks list index, drop redundant (team_id, status)
+
+get_tasks with ?status= runs WHERE team_id = ? AND status = ?
+ORDER BY created_at DESC, id DESC LIMIT n. idx_task_team_created_desc
+makes Postgres walk every team row newest-first, discarding other
+statuses. The (team_id, status, due_date) index matches the filter but means
+sorting all of the status's rows. (team_id, status, created_at DESC, id DESC)
+returns the page, and each keyset cursor continuation, straight off the index.
+
+idx_task_team_status (team_id, status) is a strict prefix of this index,
+idx_task_team_status_updated and the covering (team_id, status, due_date)
+index, so it only costs writes; drop it. The stats GROUP BY and its overdue
+count are served by the covering index, which 017 named
+idx_task_team_open_due although it is not partial; rename it to
+idx_task_team_status_due on databases that have the old name.
+
+Revision ID: 030_add_tasks_status_list_index
+Revises: 029_add_tasks_list_order_index
+Create Date: 2026-10-16
+"""
+from alembic import op
+
+revision = '030_add_tasks_status_list_index'
+down_revision = '029_add_tasks_list_order_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER INDEX IF EXISTS idx_task_team_open_due RENAME TO idx_task_team_status_due")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_status_created_desc "
+            "ON tasks (team_id, status, created_at DESC, id DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_status")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_task_team_status "
+            "ON tasks (team_id, status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_task_team_status_created_desc")
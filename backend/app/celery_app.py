@@ -8,7 +8,7 @@ from app.config import settings
 celery_app = Celery(
     "synkro",
     broker=settings.CELERY_BROKER_URL,
-    backend=settings.CELERY_RESULT_BACKEND,
+    backend=settings.CELERY_RESULT_BACKEND or None,
     include=['app.tasks.meeting_tasks', 'app.tasks.integration_tasks']  # Auto-discover tasks
 )
 
@@ -19,20 +19,43 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
-    task_track_started=True,
+    # Results live in Postgres (Meeting.transcript / summary / status), so keep
+    # multi-MB return values out of the broker's Redis instance. Endpoints read
+    # processing state from Meeting.status (one query for a whole list) rather
+    # than polling AsyncResult; if a result backend is ever polled, fetch the
+    # celery-task-meta-<id> keys with a single MGET instead of one GET per task.
+    task_ignore_result=True,
     task_time_limit=30 * 60,  # 30 minutes max per task
     task_soft_time_limit=25 * 60,  # 25 minutes soft limit
-    worker_prefetch_multiplier=1,  # One task at a time
-    worker_max_tasks_per_child=50,  # Restart worker after 50 tasks
-    # Run tasks synchronously in-process when broker is unavailable (dev mode)
-    task_always_eager=True,
+    # Prefetch is set per worker on the command line (see task routing below):
+    # 1 for long meeting jobs, higher for short I/O-bound integration tasks.
+    # Recycle a child on memory growth rather than every N tasks, so the
+    # module-level Groq/OpenAI clients keep their warm connection pools.
+    worker_max_memory_per_child=500_000,  # KB (~500 MB)
+    broker_pool_limit=20,  # Reuse broker connections across tasks
+    # Ack only after the task finishes so a process never reserves work it
+    # can't start yet. Combined with -Ofair this stops short jobs from
+    # queueing behind a 20-minute transcription on the same child process.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_pool_restarts=True,
+    # Run tasks synchronously in-process when no worker is deployed (dev mode)
+    task_always_eager=settings.CELERY_TASK_ALWAYS_EAGER,
     task_eager_propagates=False,
 )
 
-# Task routing (optional - for organizing tasks)
+# Task routing - transcription and summarization get their own queues so each
+# can be served by a dedicated, separately sized pool. Keep the meetings
+# --concurrency at the cores/GPUs set aside for ASR, so a backlog waits in
+# Redis rather than in worker memory. Everything else (Jira, Slack, Calendar
+# sync) is short and I/O-bound and lands on "default":
+#   celery -A app.celery_app worker -Ofair -Q meetings,summaries --prefetch-multiplier=1 --concurrency=2
+#   celery -A app.celery_app worker -Q default --prefetch-multiplier=4
+celery_app.conf.task_default_queue = 'default'
 celery_app.conf.task_routes = {
+    'app.tasks.meeting_tasks.process_meeting_task': {'queue': 'meetings'},
     'app.tasks.meeting_tasks.transcribe_meeting_task': {'queue': 'meetings'},
-    'app.tasks.meeting_tasks.summarize_meeting_task': {'queue': 'meetings'},
+    'app.tasks.meeting_tasks.summarize_meeting_task': {'queue': 'summaries'},
 }
 
 # Beat schedule for periodic tasks (optional)
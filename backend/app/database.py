@@ -2,8 +2,11 @@
 Database configuration and session management.
 Uses async SQLAlchemy for PostgreSQL.
 """
+from sqlalchemy import event, create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, DeclarativeBase
+from sqlalchemy.pool import NullPool
 from typing import AsyncGenerator
 
 from app.config import settings
@@ -13,16 +16,48 @@ from app.config import settings
 engine_kwargs = {
     "echo": settings.ENVIRONMENT == "development",
     "future": True,
+    # Batch executemany-style INSERTs into multi-row VALUES statements
+    "insertmanyvalues_page_size": 1000,
 }
 
-# Add pooling only for non-SQLite databases
-if not settings.DATABASE_URL.startswith("sqlite"):
+# Add pooling only for non-SQLite databases. Behind PgBouncer a second pool
+# would just pin server connections, so each session opens its own.
+if settings.DB_PGBOUNCER:
+    engine_kwargs["poolclass"] = NullPool
+elif not settings.DATABASE_URL.startswith("sqlite"):
     engine_kwargs.update({
+        # Test each connection on checkout: Neon suspends idle computes and
+        # drops their sockets, which nothing on the client side notices
+        # (tcp_keepalives_idle below is a server setting). The recycle keeps
+        # connections from outliving a suspend cycle in the first place.
         "pool_pre_ping": True,
-        "pool_size": 10,
-        "max_overflow": 20,
+        "pool_recycle": 600,
+        # A pool big enough for bursts means overflow connections (closed on
+        # return) are rare, so requests reuse connections whose prepared
+        # statement caches are warm; LIFO keeps those in rotation
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        # Fail fast when the pool is exhausted rather than hang for 30s
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_use_lifo": True,
     })
 
+# asyncpg: cache prepared statements per connection and fix session settings
+# up front so each new connection doesn't renegotiate them. PgBouncer in
+# transaction mode can't do either: statements prepared on one server
+# connection don't exist on the next, and it rejects unknown startup params.
+if "+asyncpg" in settings.DATABASE_URL and settings.DB_PGBOUNCER:
+    engine_kwargs["connect_args"] = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+    }
+elif "+asyncpg" in settings.DATABASE_URL:
+    engine_kwargs["connect_args"] = {
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off", "timezone": "UTC", "tcp_keepalives_idle": "30"},
+    }
+
 engine = create_async_engine(settings.database_url_async, **engine_kwargs)
 
 # Create async session factory
@@ -34,8 +69,54 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Synchronous engine shared by all Celery tasks in a process. Built on first
+# use so the API process never opens a second pool (or imports psycopg2).
+_sync_engine = None
+
+
+def get_sync_engine() -> Engine:
+    """Get the process-wide synchronous engine (lazy initialization)"""
+    global _sync_engine
+    if _sync_engine is None:
+        sync_kwargs = {"pool_pre_ping": True}
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            # A prefork child runs one task at a time; keep its pool small
+            sync_kwargs.update({"pool_size": 5, "max_overflow": 5})
+        _sync_engine = create_engine(settings.database_url_sync, **sync_kwargs)
+    return _sync_engine
+
+
 # Base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """Declarative base; models may use Column() or typed Mapped[] attributes"""
+    pass
+
+
+# Track whether a session has written anything, so get_db can skip the COMMIT
+# for read-only requests. Flushes and Core UPDATE/INSERT/DELETE statements
+# don't leave anything in session.new/dirty/deleted, hence the flag.
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_write_statement(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_write_flag(session):
+    session.info.pop("has_writes", None)
+
+
+def _has_pending_writes(session: AsyncSession) -> bool:
+    return bool(
+        session.new or session.dirty or session.deleted
+        or session.sync_session.info.get("has_writes")
+    )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -51,7 +132,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            if session.in_transaction():
+            if session.in_transaction() and _has_pending_writes(session):
                 await session.commit()
         except Exception:
             await session.rollback()
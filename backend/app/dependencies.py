@@ -1,18 +1,81 @@
 """
 FastAPI dependencies for authentication and authorization.
 """
+import hashlib
+import time
+import uuid
+from typing import Any, Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.database import get_db
 from app.models import User
+from app.utils.cache import cache_get_json, cache_set_json
 from app.utils.security import verify_token
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Column snapshots of recently authenticated (active) users, keyed by user id,
+# stored with the user's version token from Redis. Lets hot users skip the
+# per-request SELECT; a hit is only served while the token in Redis still
+# matches, so a role change or deactivation in any worker is seen by all.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Version tokens outlive the local snapshots; a missing token forces a reload
+USER_VERSION_TTL = 24 * 60 * 60
+
+
+def _user_version_key(user_id: str) -> str:
+    return f"user_version:{user_id}"
+
+
+# Verified access-token claims, keyed by a BLAKE2b digest of the token, so
+# repeat requests skip the JWT signature check. The TTL is well under the
+# access-token lifetime and each hit re-checks "exp".
+_token_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
+
+
+def _verify_access_token(token: str) -> Optional[dict[str, Any]]:
+    """verify_token() for access tokens, memoized for a few seconds."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _token_cache.pop(key, None)
+        return None
+
+    payload = verify_token(token, token_type="access")
+    if payload is not None:
+        _token_cache[key] = payload
+    return payload
+
+
+async def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user's cached snapshot in every process after their row is modified."""
+    _user_cache.pop(user_id, None)
+    await cache_set_json(_user_version_key(user_id), uuid.uuid4().hex, USER_VERSION_TTL)
+
+
+async def _current_user_version(user_id: str) -> Optional[str]:
+    """Read the user's version token, creating one if Redis has none."""
+    key = _user_version_key(user_id)
+    version = await cache_get_json(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not await cache_set_json(key, version, USER_VERSION_TTL):
+            return None
+    return version
+
+
+def _snapshot_user(user: User) -> dict[str, Any]:
+    return {attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs}
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -38,7 +101,7 @@ async def get_current_user(
     )
 
     token = credentials.credentials
-    payload = verify_token(token, token_type="access")
+    payload = _verify_access_token(token)
 
     if payload is None:
         raise credentials_exception
@@ -47,9 +110,24 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        version, columns = cached
+        # Without Redis the token can't be checked, so fall through to the DB
+        if version == await cache_get_json(_user_version_key(user_id)):
+            # Rebuild the row from the snapshot and attach it to this session
+            # without a round trip, so handlers can still modify and commit it
+            user = User(**columns)
+            make_transient_to_detached(user)
+            return await db.merge(user, load=False)
+        _user_cache.pop(user_id, None)
+
+    # Read the token before the row, so a change committed in between leaves
+    # the snapshot stale-tagged rather than cached under the newer token
+    version = await _current_user_version(user_id)
+
+    # Primary-key lookup: checks the session identity map before querying
+    user = await db.get(User, user_id)
 
     if user is None:
         raise credentials_exception
@@ -60,6 +138,8 @@ async def get_current_user(
             detail="User account is inactive"
         )
 
+    if version is not None:
+        _user_cache[user_id] = (version, _snapshot_user(user))
     return user
 
 
@@ -5,10 +5,12 @@ Main FastAPI application entry point
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.database import init_db, close_db
+from app.utils.http_client import close_http_client
 from app.routers import auth, tasks, meetings, chat, integrations, analytics, emails, messages
 from app.routers import admin
 from app.routers import slack_webhooks
@@ -25,38 +27,40 @@ async def lifespan(app: FastAPI):
     print(f"[*] Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f"[*] Environment: {settings.ENVIRONMENT}")
 
-    # Check critical configuration
-    print("\n[*] Configuration Check:")
-
-    # AI API Keys (for meeting transcription + summarization)
-    if settings.GROQ_API_KEY:
-        print("    [OK] Groq API Key: Configured (FREE transcription + summarization)")
-    elif settings.OPENAI_API_KEY:
-        print("    [OK] OpenAI API Key: Configured (paid)")
-    else:
-        print("    [X] No AI API Key configured!")
-        print("      WARNING: Meeting transcription will not work!")
-        print("      Get a FREE key at: https://console.groq.com/keys")
-
-    # Storage configuration
-    if settings.use_s3:
-        print("    [OK] Storage: AWS S3")
-    elif settings.use_cloudinary:
-        print("    [OK] Storage: Cloudinary")
-    else:
-        print("    [!] Storage: Local filesystem (development only)")
-
-    # Database
-    db_type = "PostgreSQL" if "postgresql" in settings.DATABASE_URL else "SQLite"
-    print(f"    [OK] Database: {db_type}")
-
-    # Redis/Celery
-    if settings.REDIS_URL:
-        print("    [OK] Redis: Configured")
-    else:
-        print("    [X] Redis: Not configured (background tasks disabled)")
-
-    print("")
+    # Configuration summary is only useful on a developer console
+    if settings.ENVIRONMENT == "development":
+        # Check critical configuration
+        print("\n[*] Configuration Check:")
+
+        # AI API Keys (for meeting transcription + summarization)
+        if settings.GROQ_API_KEY:
+            print("    [OK] Groq API Key: Configured (FREE transcription + summarization)")
+        elif settings.OPENAI_API_KEY:
+            print("    [OK] OpenAI API Key: Configured (paid)")
+        else:
+            print("    [X] No AI API Key configured!")
+            print("      WARNING: Meeting transcription will not work!")
+            print("      Get a FREE key at: https://console.groq.com/keys")
+
+        # Storage configuration
+        if settings.use_s3:
+            print("    [OK] Storage: AWS S3")
+        elif settings.use_cloudinary:
+            print("    [OK] Storage: Cloudinary")
+        else:
+            print("    [!] Storage: Local filesystem (development only)")
+
+        # Database
+        db_type = "PostgreSQL" if "postgresql" in settings.DATABASE_URL else "SQLite"
+        print(f"    [OK] Database: {db_type}")
+
+        # Redis/Celery
+        if settings.REDIS_URL:
+            print("    [OK] Redis: Configured")
+        else:
+            print("    [X] Redis: Not configured (background tasks disabled)")
+
+        print("")
 
     # Initialize database - create tables on startup
     try:
@@ -68,6 +72,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("[*] Shutting down application")
+    await close_http_client()
     await close_db()
 
 
@@ -79,6 +84,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -102,10 +108,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset cursor for list endpoints that keep a bare-list body (GET /api/tasks)
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Add GZip middleware for response compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
 # Include routers
 app.include_router(auth.router)
@@ -174,10 +182,19 @@ async def api_status():
 
 
 if __name__ == "__main__":
+    # Production runs under gunicorn (see Procfile):
+    #   gunicorn app.main:app -k uvicorn.workers.UvicornWorker -w $((2*CPU+1))
+    import os
+    import sys
     import uvicorn
+    is_dev = settings.ENVIRONMENT == "development"
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.ENVIRONMENT == "development"
+        reload=is_dev,
+        workers=None if is_dev else os.cpu_count(),
+        # uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
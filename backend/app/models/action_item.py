@@ -1,13 +1,19 @@
 """ActionItem model - extracted action items from meetings/messages"""
-from sqlalchemy import Column, String, Text, Float, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Text, Float, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 import uuid
 import enum
 
 from app.database import Base
 
 
+if TYPE_CHECKING:
+    from app.models.meeting import Meeting
+    from app.models.message import Message
+
+
 class ActionItemStatus(str, enum.Enum):
     """Action item processing status"""
     PENDING = "pending"
@@ -19,26 +25,26 @@ class ActionItem(Base):
     """Action Item model - extracted from meetings or messages"""
     __tablename__ = "action_items"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    description = Column(Text, nullable=False)
-    assignee_mentioned = Column(String(255), nullable=True)  # Name/email mentioned
-    deadline_mentioned = Column(DateTime, nullable=True)  # Extracted deadline
-    confidence_score = Column(Float, default=0.0)  # AI confidence (0-1)
-    status = Column(SQLEnum(ActionItemStatus), default=ActionItemStatus.PENDING, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    assignee_mentioned: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Name/email mentioned
+    deadline_mentioned: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Extracted deadline
+    confidence_score: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # AI confidence (0-1)
+    status: Mapped[ActionItemStatus] = mapped_column(SQLEnum(ActionItemStatus), default=ActionItemStatus.PENDING, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     # Speaker diarization fields
-    speaker_label = Column(String(50), nullable=True)    # e.g. "Speaker A" — who said it
-    assigned_by = Column(String(255), nullable=True)     # speaker who assigned the task
-    context_type = Column(String(30), nullable=True)     # task_assignment|warning|completion|progress|question|decision
+    speaker_label: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)    # e.g. "Speaker A" — who said it
+    assigned_by: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)     # speaker who assigned the task
+    context_type: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)     # task_assignment|warning|completion|progress|question|decision
 
     # Foreign Keys
-    meeting_id = Column(String(36), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=True)
-    message_id = Column(String(36), ForeignKey("messages.id", ondelete="CASCADE"), nullable=True)
-    task_id = Column(String(36), ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True)
+    meeting_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=True, index=True)
+    message_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("messages.id", ondelete="CASCADE"), nullable=True)
+    task_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
-    meeting = relationship("Meeting", back_populates="action_items")
-    message = relationship("Message", back_populates="action_items")
+    meeting: Mapped[Optional["Meeting"]] = relationship("Meeting", back_populates="action_items")
+    message: Mapped[Optional["Message"]] = relationship("Message", back_populates="action_items")
 
     def __repr__(self):
         return f"<ActionItem {self.description[:50]}>"
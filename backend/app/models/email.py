@@ -1,5 +1,6 @@
 """Email model - stores synced Gmail emails"""
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.orm import deferred
 from datetime import datetime
 import uuid
 
@@ -17,7 +18,9 @@ class Email(Base):
     sender = Column(String(500), default="")
     to = Column(String(500), default="")
     body_preview = Column(String(500), default="")
-    body = Column(Text, default="")
+    # Deferred: full bodies are only read by the single-email view, which
+    # undefers it; every other select(Email) leaves the TEXT column behind
+    body = deferred(Column(Text, default=""))
     received_at = Column(DateTime, nullable=True)
     is_read = Column(Boolean, default=False)
     is_flagged = Column(Boolean, default=False)
@@ -33,7 +36,14 @@ class Email(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     __table_args__ = (
-        Index("ix_emails_user_received", "user_id", "received_at"),
+        # Matches the inbox ordering (newest first, id as tiebreaker) so a page
+        # is read straight off the index with no sort
+        Index("ix_emails_user_received_desc", "user_id", received_at.desc(), id.desc()),
+        # Same for the unread view; also serves unread counts
+        Index(
+            "ix_emails_user_unread_received", "user_id", received_at.desc(),
+            postgresql_where=text("is_read = false"),
+        ),
         # Per-user deduplication: same message ID is fine across different users
         UniqueConstraint("user_id", "gmail_message_id", name="uq_emails_user_gmail_id"),
     )
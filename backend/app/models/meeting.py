@@ -1,13 +1,20 @@
 """Meeting model - represents recorded/scheduled meetings"""
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
 import uuid
 import enum
 
 from app.database import Base
 
 
+if TYPE_CHECKING:
+    from app.models.action_item import ActionItem
+    from app.models.team import Team
+    from app.models.user import User
+
+
 class MeetingStatus(str, enum.Enum):
     """Meeting processing status"""
     AWAITING_UPLOAD = "awaiting_upload"  # Created from Zoom webhook, waiting for file
@@ -22,39 +29,47 @@ class Meeting(Base):
     """Meeting model"""
     __tablename__ = "meetings"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    title = Column(String(500), nullable=False)
-    scheduled_at = Column(DateTime, nullable=True)
-    duration_minutes = Column(Integer, nullable=True)
-    recording_url = Column(String(1000), nullable=True)  # S3 URL or Cloudinary URL
-    transcript = Column(Text, nullable=True)
-    diarized_transcript = Column(Text, nullable=True)  # JSON: [{speaker, start, end, text, context_type}]
-    speaker_names = Column(Text, nullable=True)         # JSON: {"Speaker A": "Alice", "Speaker B": "Bob"}
-    summary = Column(Text, nullable=True)
-    status = Column(SQLEnum(MeetingStatus), default=MeetingStatus.SCHEDULED, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    recording_url: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)  # S3 URL or Cloudinary URL
+    transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    diarized_transcript: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON: [{speaker, start, end, text, context_type}]
+    speaker_names: Mapped[Optional[str]] = mapped_column(Text, nullable=True)         # JSON: {"Speaker A": "Alice", "Speaker B": "Bob"}
+    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    status: Mapped[MeetingStatus] = mapped_column(SQLEnum(MeetingStatus), default=MeetingStatus.SCHEDULED, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Zoom integration fields
-    zoom_meeting_id = Column(String(100), nullable=True, index=True)
-    zoom_recording_id = Column(String(100), nullable=True)  # dedup guard
+    zoom_meeting_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    zoom_recording_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # dedup guard
+
+    # SHA-256 of the uploaded recording; identical re-uploads reuse results
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Google Calendar integration fields
-    calendar_event_id = Column(String(500), nullable=True)
-    google_meet_link = Column(String(500), nullable=True)
+    calendar_event_id: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    google_meet_link: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Foreign Keys
-    team_id = Column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
-    created_by_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    team_id: Mapped[str] = mapped_column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    created_by_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
-    team = relationship("Team", back_populates="meetings")
-    creator = relationship("User", back_populates="meetings_created")
-    action_items = relationship("ActionItem", back_populates="meeting", cascade="all, delete-orphan")
+    team: Mapped["Team"] = relationship("Team", back_populates="meetings")
+    creator: Mapped[Optional["User"]] = relationship("User", back_populates="meetings_created")
+    action_items: Mapped[List["ActionItem"]] = relationship("ActionItem", back_populates="meeting", cascade="all, delete-orphan")
 
     # Indexes
     __table_args__ = (
         Index('idx_meeting_team_status', 'team_id', 'status'),
+        Index('idx_meeting_team_content_hash', 'team_id', 'content_hash'),
+        Index(
+            'idx_meeting_team_created_desc', 'team_id', created_at.desc(), id.desc(),
+            postgresql_include=['title', 'status'],
+        ),
     )
 
     def __repr__(self):
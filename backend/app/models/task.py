@@ -1,13 +1,20 @@
 """Task model - represents a work item"""
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
 import uuid
 import enum
 
 from app.database import Base
 
 
+if TYPE_CHECKING:
+    from app.models.task_comment import TaskComment
+    from app.models.team import Team
+    from app.models.user import User
+
+
 class TaskStatus(str, enum.Enum):
     """Task status"""
     TODO = "todo"
@@ -36,50 +43,63 @@ class Task(Base):
     """Task model"""
     __tablename__ = "tasks"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=True)
-    status = Column(SQLEnum(TaskStatus), default=TaskStatus.TODO, nullable=False)
-    priority = Column(SQLEnum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
-    due_date = Column(DateTime, nullable=True)
-    estimated_hours = Column(Integer, nullable=True)
-    source_type = Column(SQLEnum(TaskSourceType), default=TaskSourceType.MANUAL, nullable=False)
-    source_id = Column(String(36), nullable=True)  # ID of meeting/message/etc
-    external_id = Column(String(255), nullable=True)  # ID from external system (Jira, etc)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    status: Mapped[TaskStatus] = mapped_column(SQLEnum(TaskStatus), default=TaskStatus.TODO, nullable=False)
+    priority: Mapped[TaskPriority] = mapped_column(SQLEnum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    estimated_hours: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    source_type: Mapped[TaskSourceType] = mapped_column(SQLEnum(TaskSourceType), default=TaskSourceType.MANUAL, nullable=False)
+    source_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # ID of meeting/message/etc
+    external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # ID from external system (Jira, etc)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Foreign Keys
-    assignee_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    created_by_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    team_id = Column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
+    assignee_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    created_by_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    team_id: Mapped[str] = mapped_column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
 
     # Relationships
-    assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_tasks")
-    creator = relationship("User", foreign_keys=[created_by_id], back_populates="created_tasks")
-    team = relationship("Team", back_populates="tasks")
+    assignee: Mapped[Optional["User"]] = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_tasks")
+    creator: Mapped[Optional["User"]] = relationship("User", foreign_keys=[created_by_id], back_populates="created_tasks")
+    team: Mapped["Team"] = relationship("Team", back_populates="tasks")
 
     # Google Calendar sync
-    calendar_event_id = Column(String(500), nullable=True)
-    calendar_synced_at = Column(DateTime, nullable=True)
+    calendar_event_id: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    calendar_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Google Meet auto-generation
-    is_meeting_task = Column(Boolean, default=False, nullable=False, server_default="false")
-    google_meet_link = Column(String(500), nullable=True)
-    meeting_scheduled_at = Column(DateTime, nullable=True)
-    meeting_duration_minutes = Column(Integer, default=60, nullable=False, server_default="60")
+    is_meeting_task: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, server_default="false")
+    google_meet_link: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    meeting_scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    meeting_duration_minutes: Mapped[int] = mapped_column(Integer, default=60, nullable=False, server_default="60")
 
     # Jira bi-directional sync
-    jira_synced_at = Column(DateTime, nullable=True)
-    jira_sync_error = Column(Text, nullable=True)
+    jira_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    jira_sync_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Comments (Synkro + Jira-synced)
-    comments = relationship("TaskComment", back_populates="task", cascade="all, delete-orphan", order_by="TaskComment.created_at")
+    comments: Mapped[List["TaskComment"]] = relationship("TaskComment", back_populates="task", cascade="all, delete-orphan", order_by="TaskComment.created_at")
 
     # Indexes for common queries
     __table_args__ = (
         Index('idx_task_status_assignee', 'status', 'assignee_id'),
-        Index('idx_task_team_status', 'team_id', 'status'),
+        # Partial index for the frequent "open tasks for a team" lookups
+        Index('idx_task_team_open', 'team_id', postgresql_where=text("status != 'DONE'")),
+        # Covering index for team/status lookups ordered by due date; as its
+        # (team_id, status) prefix it also serves the stats GROUP BY
+        Index(
+            'idx_task_team_status_due', 'team_id', 'status', 'due_date',
+            postgresql_include=['title', 'priority', 'assignee_id'],
+        ),
+        # Analytics / chat aggregates: period counts, completions, per-assignee load
+        Index('idx_task_team_created_desc', 'team_id', created_at.desc(), id.desc()),
+        # Task list filtered by status, in the same keyset order
+        Index('idx_task_team_status_created_desc', 'team_id', 'status', created_at.desc(), id.desc()),
+        Index('idx_task_team_status_updated', 'team_id', 'status', 'updated_at'),
+        Index('idx_task_assignee_status_due', 'assignee_id', 'status', 'due_date'),
     )
 
     def __repr__(self):
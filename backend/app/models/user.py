@@ -1,13 +1,22 @@
 """User model - represents a team member"""
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
 import uuid
 import enum
 
 from app.database import Base
 
 
+if TYPE_CHECKING:
+    from app.models.calendar_preference import CalendarPreferences
+    from app.models.integration import Integration
+    from app.models.meeting import Meeting
+    from app.models.task import Task
+    from app.models.team import Team
+
+
 class UserRole(str, enum.Enum):
     """User role hierarchy within a software house"""
     ADMIN = "admin"                    # Full access: upload meetings, manage users
@@ -22,40 +31,40 @@ class User(Base):
     """User model"""
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    password_hash = Column(String(255), nullable=False)
-    full_name = Column(String(255), nullable=False)
-    avatar_url = Column(String(500), nullable=True)
-    timezone = Column(String(50), default="UTC")
-    role = Column(SQLEnum(UserRole, values_callable=lambda x: [e.value for e in x]), default=UserRole.DEVELOPER, nullable=False)
-    is_active = Column(Boolean, default=True, nullable=False)
-    is_verified = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
+    full_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    avatar_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    timezone: Mapped[Optional[str]] = mapped_column(String(50), default="UTC")
+    role: Mapped[UserRole] = mapped_column(SQLEnum(UserRole, values_callable=lambda x: [e.value for e in x]), default=UserRole.DEVELOPER, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Password reset fields
-    password_reset_token = Column(String(255), nullable=True)
-    password_reset_expires = Column(DateTime, nullable=True)
+    password_reset_token: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    password_reset_expires: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Foreign Keys
-    team_id = Column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=True)
+    team_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), nullable=True, index=True)
 
     # Relationships
-    team = relationship("Team", back_populates="members")
-    created_tasks = relationship(
+    team: Mapped[Optional["Team"]] = relationship("Team", back_populates="members")
+    created_tasks: Mapped[List["Task"]] = relationship(
         "Task",
         foreign_keys="Task.created_by_id",
         back_populates="creator"
     )
-    assigned_tasks = relationship(
+    assigned_tasks: Mapped[List["Task"]] = relationship(
         "Task",
         foreign_keys="Task.assignee_id",
         back_populates="assignee"
     )
-    integrations = relationship("Integration", back_populates="user", cascade="all, delete-orphan")
-    meetings_created = relationship("Meeting", back_populates="creator")
-    calendar_preferences = relationship("CalendarPreferences", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    integrations: Mapped[List["Integration"]] = relationship("Integration", back_populates="user", cascade="all, delete-orphan")
+    meetings_created: Mapped[List["Meeting"]] = relationship("Meeting", back_populates="creator")
+    calendar_preferences: Mapped[Optional["CalendarPreferences"]] = relationship("CalendarPreferences", back_populates="user", uselist=False, cascade="all, delete-orphan")
 
     @property
     def is_admin(self) -> bool:
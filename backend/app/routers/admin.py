@@ -8,7 +8,7 @@ from app.database import get_db
 from app.models import User, Team
 from app.models.user import UserRole
 from app.schemas.user import UserResponse
-from app.dependencies import get_current_admin_user
+from app.dependencies import get_current_admin_user, invalidate_cached_user
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -142,6 +142,7 @@ async def update_user_role(
 
     user.role = role_map[role]
     await db.commit()
+    await invalidate_cached_user(user_id)
     await db.refresh(user)
 
     return {"message": f"User role updated to {role}", "user_id": user_id, "new_role": role}
@@ -174,6 +175,7 @@ async def toggle_user_active(
 
     user.is_active = not user.is_active
     await db.commit()
+    await invalidate_cached_user(user_id)
 
     return {
         "message": f"User {'activated' if user.is_active else 'deactivated'}",
@@ -209,6 +211,7 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    await invalidate_cached_user(user_id)
 
     return None
 
@@ -232,5 +235,7 @@ async def delete_all_users_except_admin(
         await db.delete(user)
 
     await db.commit()
+    for user in users_to_delete:
+        await invalidate_cached_user(user.id)
 
     return {"message": f"Deleted {count} users. Admin account preserved.", "deleted_count": count}
@@ -1,16 +1,32 @@
 """Analytics endpoints - workload, productivity, and team insights"""
+import asyncio
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, case
-from typing import Optional
+from sqlalchemy import select, func, and_, case, literal, union_all
+from typing import Any, Awaitable, Callable, Dict, Optional
 from datetime import datetime, timedelta
 
 from app.database import get_db
 from app.models import User, Task, Meeting, ActionItem, TaskStatus, TaskPriority
 from app.dependencies import get_current_user
+from app.utils.cache import cache_get_json, cache_set_json
 
 router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
 
+# Dashboards poll these endpoints and every team member sees the same numbers,
+# so responses are shared per team for a short window
+ANALYTICS_CACHE_TTL = 120  # seconds
+
+
+async def _cached(cache_key: str, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Serve a response from the analytics cache, computing and storing it on a miss."""
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return cached
+    response = await compute()
+    await cache_set_json(cache_key, response, ANALYTICS_CACHE_TTL)
+    return response
+
 
 @router.get("/workload")
 async def get_workload_analytics(
@@ -19,68 +35,43 @@ async def get_workload_analytics(
     db: AsyncSession = Depends(get_db),
 ):
     """Get workload analytics for the team."""
-    since = datetime.utcnow() - timedelta(days=days)
-
-    # Tasks by status
-    status_result = await db.execute(
-        select(Task.status, func.count(Task.id))
-        .where(
-            and_(
-                Task.team_id == current_user.team_id,
-                Task.created_at >= since,
-            )
-        )
-        .group_by(Task.status)
+    return await _cached(
+        f"analytics:workload:{current_user.team_id}:{days}",
+        lambda: _compute_workload(db, current_user.team_id, days),
     )
-    tasks_by_status = {row[0].value: row[1] for row in status_result.all()}
 
-    # Tasks by priority
-    priority_result = await db.execute(
-        select(Task.priority, func.count(Task.id))
-        .where(
-            and_(
-                Task.team_id == current_user.team_id,
-                Task.created_at >= since,
-            )
-        )
-        .group_by(Task.priority)
-    )
-    tasks_by_priority = {row[0].value: row[1] for row in priority_result.all()}
 
-    # Overdue tasks
-    overdue_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.team_id == current_user.team_id,
-                Task.due_date < datetime.utcnow(),
-                Task.status != TaskStatus.DONE,
-            )
-        )
-    )
-    overdue_count = overdue_result.scalar() or 0
-
-    # Tasks completed in period
-    completed_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.team_id == current_user.team_id,
-                Task.status == TaskStatus.DONE,
-                Task.updated_at >= since,
-            )
+async def _compute_workload(db: AsyncSession, team_id: str, days: int) -> Dict[str, Any]:
+    since = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+
+    # One pass over the team's tasks: per (status, priority) bucket, count
+    # tasks created in the period, completed in the period, and overdue.
+    # The bucket set is tiny (statuses x priorities), so folding it into the
+    # response dicts in Python is cheaper than extra round trips.
+    result = await db.execute(
+        select(
+            Task.status,
+            Task.priority,
+            func.sum(case((Task.created_at >= since, 1), else_=0)).label("in_period"),
+            func.sum(case((and_(Task.status == TaskStatus.DONE, Task.updated_at >= since), 1), else_=0)).label("completed"),
+            func.sum(case((and_(Task.due_date < now, Task.status != TaskStatus.DONE), 1), else_=0)).label("overdue"),
         )
+        .where(Task.team_id == team_id)
+        .group_by(Task.status, Task.priority)
     )
-    completed_count = completed_result.scalar() or 0
 
-    # Total tasks in period
-    total_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.team_id == current_user.team_id,
-                Task.created_at >= since,
-            )
-        )
-    )
-    total_count = total_result.scalar() or 0
+    tasks_by_status: dict = {}
+    tasks_by_priority: dict = {}
+    total_count = completed_count = overdue_count = 0
+    for row in result.all():
+        in_period = int(row.in_period or 0)
+        if in_period:
+            tasks_by_status[row.status.value] = tasks_by_status.get(row.status.value, 0) + in_period
+            tasks_by_priority[row.priority.value] = tasks_by_priority.get(row.priority.value, 0) + in_period
+        total_count += in_period
+        completed_count += int(row.completed or 0)
+        overdue_count += int(row.overdue or 0)
 
     completion_rate = round((completed_count / total_count * 100), 1) if total_count > 0 else 0
 
@@ -101,69 +92,45 @@ async def get_team_workload(
     db: AsyncSession = Depends(get_db),
 ):
     """Get workload distribution across team members."""
-    # Get team members
-    members_result = await db.execute(
-        select(User).where(User.team_id == current_user.team_id)
+    return await _cached(
+        f"analytics:team-workload:{current_user.team_id}",
+        lambda: _compute_team_workload(db, current_user.team_id),
     )
-    members = members_result.scalars().all()
-
-    workload = []
-    for member in members:
-        # Active tasks (not done)
-        active_result = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.assignee_id == member.id,
-                    Task.status != TaskStatus.DONE,
-                )
-            )
-        )
-        active_count = active_result.scalar() or 0
-
-        # Completed tasks (last 30 days)
-        done_result = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.assignee_id == member.id,
-                    Task.status == TaskStatus.DONE,
-                    Task.updated_at >= datetime.utcnow() - timedelta(days=30),
-                )
-            )
-        )
-        done_count = done_result.scalar() or 0
-
-        # Overdue tasks
-        overdue_result = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.assignee_id == member.id,
-                    Task.due_date < datetime.utcnow(),
-                    Task.status != TaskStatus.DONE,
-                )
-            )
-        )
-        overdue_count = overdue_result.scalar() or 0
-
-        # Estimated hours
-        hours_result = await db.execute(
-            select(func.sum(Task.estimated_hours)).where(
-                and_(
-                    Task.assignee_id == member.id,
-                    Task.status != TaskStatus.DONE,
-                )
-            )
+
+
+async def _compute_team_workload(db: AsyncSession, team_id: str) -> Dict[str, Any]:
+    # Members and their task aggregates in one query: LEFT JOIN keeps members
+    # with no tasks, whose CASE sums come out as 0
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=30)
+    result = await db.execute(
+        select(
+            User.id,
+            User.full_name,
+            User.email,
+            func.sum(case((Task.status != TaskStatus.DONE, 1), else_=0)).label("active"),
+            func.sum(case((and_(Task.status == TaskStatus.DONE, Task.updated_at >= cutoff), 1), else_=0)).label("done_30d"),
+            func.sum(case((and_(Task.due_date < now, Task.status != TaskStatus.DONE), 1), else_=0)).label("overdue"),
+            func.sum(case((Task.status != TaskStatus.DONE, Task.estimated_hours), else_=0)).label("hours"),
         )
-        estimated_hours = hours_result.scalar() or 0
-
-        workload.append({
-            "user_id": member.id,
-            "full_name": member.full_name,
-            "email": member.email,
-            "active_tasks": active_count,
-            "completed_tasks_30d": done_count,
-            "overdue_tasks": overdue_count,
-            "estimated_hours_remaining": float(estimated_hours),
-        })
+        .select_from(User)
+        .outerjoin(Task, Task.assignee_id == User.id)
+        .where(User.team_id == team_id)
+        .group_by(User.id, User.full_name, User.email)
+    )
+
+    workload = [
+        {
+            "user_id": row.id,
+            "full_name": row.full_name,
+            "email": row.email,
+            "active_tasks": int(row.active or 0),
+            "completed_tasks_30d": int(row.done_30d or 0),
+            "overdue_tasks": int(row.overdue or 0),
+            "estimated_hours_remaining": float(row.hours or 0),
+        }
+        for row in result.all()
+    ]
 
     # Sort by active tasks descending
     workload.sort(key=lambda x: x["active_tasks"], reverse=True)
@@ -178,13 +145,20 @@ async def get_meeting_insights(
     db: AsyncSession = Depends(get_db),
 ):
     """Get meeting analytics and insights."""
+    return await _cached(
+        f"analytics:meeting-insights:{current_user.team_id}:{days}",
+        lambda: _compute_meeting_insights(db, current_user.team_id, days),
+    )
+
+
+async def _compute_meeting_insights(db: AsyncSession, team_id: str, days: int) -> Dict[str, Any]:
     since = datetime.utcnow() - timedelta(days=days)
 
     # Total meetings
     total_result = await db.execute(
         select(func.count(Meeting.id)).where(
             and_(
-                Meeting.team_id == current_user.team_id,
+                Meeting.team_id == team_id,
                 Meeting.created_at >= since,
             )
         )
@@ -195,7 +169,7 @@ async def get_meeting_insights(
     completed_result = await db.execute(
         select(func.count(Meeting.id)).where(
             and_(
-                Meeting.team_id == current_user.team_id,
+                Meeting.team_id == team_id,
                 Meeting.status == "completed",
                 Meeting.created_at >= since,
             )
@@ -209,7 +183,7 @@ async def get_meeting_insights(
         .join(Meeting, ActionItem.meeting_id == Meeting.id)
         .where(
             and_(
-                Meeting.team_id == current_user.team_id,
+                Meeting.team_id == team_id,
                 Meeting.created_at >= since,
             )
         )
@@ -222,7 +196,7 @@ async def get_meeting_insights(
         .join(Meeting, ActionItem.meeting_id == Meeting.id)
         .where(
             and_(
-                Meeting.team_id == current_user.team_id,
+                Meeting.team_id == team_id,
                 Meeting.created_at >= since,
                 ActionItem.status == "converted",
             )
@@ -234,7 +208,7 @@ async def get_meeting_insights(
     duration_result = await db.execute(
         select(func.avg(Meeting.duration_minutes)).where(
             and_(
-                Meeting.team_id == current_user.team_id,
+                Meeting.team_id == team_id,
                 Meeting.created_at >= since,
                 Meeting.duration_minutes.isnot(None),
             )
@@ -262,46 +236,97 @@ async def get_productivity_trend(
     db: AsyncSession = Depends(get_db),
 ):
     """Get daily task completion trend."""
-    since = datetime.utcnow() - timedelta(days=days)
+    return await _cached(
+        f"analytics:productivity-trend:{current_user.team_id}:{days}",
+        lambda: _compute_productivity_trend(db, current_user.team_id, days),
+    )
 
-    # Get tasks created and completed by date
-    # We'll build daily buckets
-    trend = []
-    for i in range(days):
-        day_start = (datetime.utcnow() - timedelta(days=days - 1 - i)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        day_end = day_start + timedelta(days=1)
-
-        # Tasks created that day
-        created_result = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.team_id == current_user.team_id,
-                    Task.created_at >= day_start,
-                    Task.created_at < day_end,
-                )
+
+async def _compute_productivity_trend(db: AsyncSession, team_id: str, days: int) -> Dict[str, Any]:
+    first_day = (datetime.utcnow() - timedelta(days=days - 1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+    # Bucket by calendar day in the database. Created and completed counts
+    # come back from one UNION ALL, so the whole trend is a single round trip.
+    created_day = func.date(Task.created_at)
+    completed_day = func.date(Task.updated_at)
+    buckets = union_all(
+        select(literal("created").label("kind"), created_day.label("day"), func.count(Task.id).label("n"))
+        .where(
+            and_(
+                Task.team_id == team_id,
+                Task.created_at >= first_day,
             )
         )
-        created = created_result.scalar() or 0
-
-        # Tasks completed that day
-        completed_result = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.team_id == current_user.team_id,
-                    Task.status == TaskStatus.DONE,
-                    Task.updated_at >= day_start,
-                    Task.updated_at < day_end,
-                )
+        .group_by(created_day),
+        select(literal("completed").label("kind"), completed_day.label("day"), func.count(Task.id).label("n"))
+        .where(
+            and_(
+                Task.team_id == team_id,
+                Task.status == TaskStatus.DONE,
+                Task.updated_at >= first_day,
             )
         )
-        completed = completed_result.scalar() or 0
+        .group_by(completed_day),
+    )
+    counts = {"created": {}, "completed": {}}
+    for kind, day, n in (await db.execute(buckets)).all():
+        counts[kind][str(day)] = n
+    created_by_day, completed_by_day = counts["created"], counts["completed"]
 
+    trend = []
+    for i in range(days):
+        day = (first_day + timedelta(days=i)).strftime("%Y-%m-%d")
         trend.append({
-            "date": day_start.strftime("%Y-%m-%d"),
-            "created": created,
-            "completed": completed,
+            "date": day,
+            "created": created_by_day.get(day, 0),
+            "completed": completed_by_day.get(day, 0),
         })
 
     return {"trend": trend, "period_days": days}
+
+
+@router.get("/summary")
+async def get_analytics_summary(
+    days: int = Query(default=30, ge=1, le=365),
+    trend_days: int = Query(default=14, ge=1, le=90),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    All dashboard analytics in one response: workload, team workload,
+    meeting insights and productivity trend, computed concurrently.
+    """
+    team_id = current_user.team_id
+
+    async def _on_own_session(compute, *args) -> Dict[str, Any]:
+        # An AsyncSession can't serve concurrent awaits; give each section its own
+        async with AsyncSession(db.bind, expire_on_commit=False) as session:
+            return await compute(session, *args)
+
+    workload, team_workload, meeting_insights, trend = await asyncio.gather(
+        _cached(
+            f"analytics:workload:{team_id}:{days}",
+            lambda: _on_own_session(_compute_workload, team_id, days),
+        ),
+        _cached(
+            f"analytics:team-workload:{team_id}",
+            lambda: _on_own_session(_compute_team_workload, team_id),
+        ),
+        _cached(
+            f"analytics:meeting-insights:{team_id}:{days}",
+            lambda: _on_own_session(_compute_meeting_insights, team_id, days),
+        ),
+        _cached(
+            f"analytics:productivity-trend:{team_id}:{trend_days}",
+            lambda: _on_own_session(_compute_productivity_trend, team_id, trend_days),
+        ),
+    )
+
+    return {
+        "workload": workload,
+        "team_workload": team_workload,
+        "meeting_insights": meeting_insights,
+        "productivity_trend": trend,
+    }
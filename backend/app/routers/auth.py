@@ -1,9 +1,11 @@
 """Authentication endpoints - register, login, refresh, me, forgot/reset password"""
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import secrets
+import uuid
 from datetime import datetime, timedelta
 
 from app.database import get_db
@@ -15,17 +17,26 @@ from app.schemas.user import (
     InviteCreateRequest, InviteValidateResponse, InviteResponse
 )
 from app.utils.security import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_and_update_password_async,
     create_access_token,
     create_refresh_token,
     verify_token
 )
-from app.dependencies import get_current_user, get_current_admin_user
+from app.dependencies import get_current_user, get_current_admin_user, invalidate_cached_user
 from app.models.team_invitation import TeamInvitation
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
+# Verified against when the email is unknown, so a failed login costs about
+# the same hashing work whether or not the account exists (no timing oracle).
+# Kept as bcrypt at passlib's default 12 rounds, like the legacy hashes, while
+# most accounts still hold those: bcrypt costs roughly 3x argon2 here, so an
+# argon2 dummy would single out every pre-migration account. Accounts already
+# upgraded to argon2 answer faster than unknown emails; switch this to
+# get_password_hash() once bcrypt hashes are the minority.
+_DUMMY_PASSWORD_HASH = CryptContext(schemes=["bcrypt"]).hash(secrets.token_urlsafe(16))
+
 # Valid roles that can be chosen during registration
 VALID_REGISTRATION_ROLES = {
     "admin", "project_manager", "team_lead",
@@ -44,11 +55,10 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     - **role**: User role (admin, project_manager, team_lead, senior_developer, developer, intern)
     - **invite_token**: Optional invite token — joins the inviting admin's team and uses the invited role
     """
-    # Check if email already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
+    # Check if email already exists (id probe; no need to load the row)
+    result = await db.execute(select(User.id).where(User.email == user_data.email).limit(1))
 
-    if existing_user:
+    if result.first() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -97,9 +107,8 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
 
         # Enforce single admin: only one admin can exist in the system
         if user_role == UserRole.ADMIN:
-            result = await db.execute(select(User).where(User.role == UserRole.ADMIN).limit(1))
-            existing_admin = result.scalar_one_or_none()
-            if existing_admin:
+            result = await db.execute(select(User.id).where(User.role == UserRole.ADMIN).limit(1))
+            if result.first() is not None:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail="An administrator already exists. Please choose a different role to register."
@@ -109,23 +118,21 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         team_id = user_data.team_id
         if team_id:
             # Validate the provided team_id
-            result = await db.execute(select(Team).where(Team.id == team_id))
-            team = result.scalar_one_or_none()
-            if not team:
+            result = await db.execute(select(Team.id).where(Team.id == team_id).limit(1))
+            if result.first() is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Team not found"
                 )
         elif user_role != UserRole.ADMIN:
             # Non-admin: join the admin's team if one exists, otherwise create a new team
-            result = await db.execute(select(User).where(User.role == UserRole.ADMIN).limit(1))
-            admin_user = result.scalar_one_or_none()
-            if admin_user and admin_user.team_id:
-                team_id = admin_user.team_id
+            result = await db.execute(select(User.team_id).where(User.role == UserRole.ADMIN).limit(1))
+            admin_team_id = result.scalar_one_or_none()
+            if admin_team_id:
+                team_id = admin_team_id
             else:
                 # No admin yet, create a personal team
                 from app.models import TeamPlan
-                import uuid
                 new_team = Team(
                     id=str(uuid.uuid4()),
                     name=f"{user_data.full_name}'s Team",
@@ -133,12 +140,10 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
                     settings={}
                 )
                 db.add(new_team)
-                await db.flush()
                 team_id = new_team.id
         else:
             # Admin: create a new team for the organization
             from app.models import TeamPlan
-            import uuid
             new_team = Team(
                 id=str(uuid.uuid4()),
                 name=f"{user_data.full_name}'s Team",
@@ -146,12 +151,14 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
                 settings={}
             )
             db.add(new_team)
-            await db.flush()
             team_id = new_team.id
 
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
+    # Ids are generated client-side, so the team, user and integration rows
+    # can all be inserted by the single flush at commit
     new_user = User(
+        id=str(uuid.uuid4()),
         email=user_data.email,
         password_hash=hashed_password,
         full_name=user_data.full_name,
@@ -160,11 +167,9 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     )
 
     db.add(new_user)
-    await db.flush()  # get new_user.id before commit
 
     # Auto-provision Slack integration for every new user (demo mode)
     try:
-        import uuid as _uuid
         from app.models import Integration, IntegrationPlatform
         from app.utils.security import encrypt_value
         from app.config import settings as _settings
@@ -172,7 +177,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         if _slack_token:
             _enc = encrypt_value(_slack_token)
             _slack_int = Integration(
-                id=str(_uuid.uuid4()),
+                id=str(uuid.uuid4()),
                 user_id=new_user.id,
                 platform=IntegrationPlatform.SLACK,
                 access_token=_enc,
@@ -191,8 +196,8 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     if invitation:
         invitation.used_at = datetime.utcnow()
 
+    # No refresh: every column has a Python-side default, populated on flush
     await db.commit()
-    await db.refresh(new_user)
 
     return new_user
 
@@ -217,8 +222,12 @@ async def login(
     result = await db.execute(select(User).where(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    # Verify credentials
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # Verify credentials (always run one hash check)
+    password_ok, new_hash = await verify_and_update_password_async(
+        form_data.password,
+        user.password_hash if user else _DUMMY_PASSWORD_HASH,
+    )
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -231,6 +240,11 @@ async def login(
             detail="User account is inactive"
         )
 
+    # Upgrade legacy bcrypt hashes to argon2 now that we have the plaintext
+    if new_hash:
+        user.password_hash = new_hash
+        await invalidate_cached_user(user.id)
+
     # Create tokens
     access_token = create_access_token(data={"sub": user.id})
     refresh_token = create_refresh_token(data={"sub": user.id})
@@ -328,6 +342,7 @@ async def update_profile(
         setattr(current_user, field, value)
 
     await db.commit()
+    await invalidate_cached_user(current_user.id)
     await db.refresh(current_user)
 
     return current_user
@@ -401,11 +416,12 @@ async def reset_password(
         )
 
     # Update password
-    user.password_hash = get_password_hash(request.new_password)
+    user.password_hash = await get_password_hash_async(request.new_password)
     user.password_reset_token = None
     user.password_reset_expires = None
 
     await db.commit()
+    await invalidate_cached_user(user.id)
 
     return {"message": "Password reset successfully. You can now log in with your new password."}
 
@@ -1,14 +1,16 @@
 """AI Chat interface - natural language queries about tasks and meetings"""
+import asyncio
+import re
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, func, case, literal_column
+from sqlalchemy.orm import aliased
 from pydantic import BaseModel
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable
 
 from app.database import get_db
-from app.models import User, Task, Meeting, TaskStatus
+from app.models import User, Task, Meeting, ActionItem, TaskStatus
 from app.models.user import UserRole
 from app.dependencies import get_current_user
 from app.services.ai_service import chat_query_enhanced
@@ -38,44 +40,56 @@ def _now() -> datetime:
     return datetime.utcnow()
 
 
+_TASK_WORDS = [
+    "task", "tasks", "work", "working", "assigned", "assign", "todo",
+    "to-do", "doing", "progress", "plate", "complete", "done", "blocked",
+    "pending", "backlog", "ticket", "issue", "story", "sprint", "feature",
+    "bug", "fix", "finish", "deliver", "show", "list", "what is",
+    "what are", "has", "have",
+]
+_TEAM_WORDS = [
+    "team", "who", "member", "everyone", "all tasks", "workload",
+    "balance", "busiest", "most tasks", "least tasks", "assigned to",
+    "teammate", "colleague", "everybody",
+]
+_MEETING_WORDS = [
+    "meeting", "meetings", "decided", "discussed", "summary", "transcript",
+    "action item", "standup", "sprint review", "retro", "retrospective",
+    "decision", "notes", "recap", "last meeting", "recent meeting",
+]
+_STATS_WORDS = [
+    "how many", "count", "total", "number", "stats", "statistics",
+    "overview", "breakdown", "status", "report", "summary",
+]
+
+
+def _keyword_re(words: List[str]) -> "re.Pattern[str]":
+    """One case-insensitive alternation matching any keyword as a substring."""
+    return re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+
+
+# Compiled once: each intent is a single regex scan of the query instead of
+# one substring search per keyword
+_INTENT_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "wants_tasks": _keyword_re(_TASK_WORDS + _STATS_WORDS),
+    "wants_team": _keyword_re(_TEAM_WORDS),
+    "wants_meetings": _keyword_re(_MEETING_WORDS),
+    "wants_stats": _keyword_re(_STATS_WORDS),
+    "wants_overdue": _keyword_re(["overdue", "late", "past due", "missed"]),
+    "wants_own": _keyword_re(["my ", "mine", " i ", "me ", "plate", "i have", "i need", "i am", "i'm"]),
+    "wants_today": _keyword_re(["today"]),
+    "wants_week": _keyword_re(["week", "this week", "weekly", "7 days"]),
+    "wants_high_priority": _keyword_re(["high", "urgent", "critical", "important", "asap"]),
+    "wants_blocked": _keyword_re(["blocked", "blocker", "stuck", "cannot proceed"]),
+    "wants_in_progress": _keyword_re(["in progress", "in-progress", "working on", "ongoing", "current"]),
+}
+
+
 def _detect_intent(query: str) -> Dict[str, bool]:
     """Score each domain by keyword presence in the query."""
-    q = query.lower()
-
-    task_words = [
-        "task", "tasks", "work", "working", "assigned", "assign", "todo",
-        "to-do", "doing", "progress", "plate", "complete", "done", "blocked",
-        "pending", "backlog", "ticket", "issue", "story", "sprint", "feature",
-        "bug", "fix", "finish", "deliver", "show", "list", "what is",
-        "what are", "has", "have",
-    ]
-    team_words = [
-        "team", "who", "member", "everyone", "all tasks", "workload",
-        "balance", "busiest", "most tasks", "least tasks", "assigned to",
-        "teammate", "colleague", "everybody",
-    ]
-    meeting_words = [
-        "meeting", "meetings", "decided", "discussed", "summary", "transcript",
-        "action item", "standup", "sprint review", "retro", "retrospective",
-        "decision", "notes", "recap", "last meeting", "recent meeting",
-    ]
-    stats_words = [
-        "how many", "count", "total", "number", "stats", "statistics",
-        "overview", "breakdown", "status", "report", "summary",
-    ]
-
     return {
-        "wants_tasks": any(w in q for w in task_words) or any(w in q for w in stats_words),
-        "wants_team": any(w in q for w in team_words),
-        "wants_meetings": any(w in q for w in meeting_words),
-        "wants_stats": any(w in q for w in stats_words),
-        "wants_overdue": any(w in q for w in ["overdue", "late", "past due", "missed"]),
-        "wants_own": any(w in q for w in ["my ", "mine", " i ", "me ", "plate", "i have", "i need", "i am", "i'm"]),
-        "wants_today": "today" in q,
-        "wants_week": any(w in q for w in ["week", "this week", "weekly", "7 days"]),
-        "wants_high_priority": any(w in q for w in ["high", "urgent", "critical", "important", "asap"]),
-        "wants_blocked": any(w in q for w in ["blocked", "blocker", "stuck", "cannot proceed"]),
-        "wants_in_progress": any(w in q for w in ["in progress", "in-progress", "working on", "ongoing", "current"]),
+        intent: pattern.search(query) is not None
+        for intent, pattern in _INTENT_PATTERNS.items()
     }
 
 
@@ -163,8 +177,13 @@ async def build_context(
         }
     }
 
+    # Decide which sections are needed, then fetch them concurrently. Each
+    # fetcher is independent and read-only; an AsyncSession can't be shared
+    # across concurrent awaits, so every section gets its own session.
+    fetchers: Dict[str, Callable[[AsyncSession], Awaitable[Any]]] = {}
+
     # Always include a lightweight personal snapshot (counts only)
-    ctx["my_task_snapshot"] = await get_my_task_snapshot(user, db)
+    fetchers["my_task_snapshot"] = lambda s: get_my_task_snapshot(user, s)
 
     wants_task_detail = (
         intent["wants_tasks"]
@@ -181,29 +200,36 @@ async def build_context(
     # ── Admin: query about a specific named team member ──────────────────────
     if is_admin and mentioned_member is not None:
         # Fetch that member's tasks directly — this is the primary context
-        ctx["specific_member_tasks"] = await get_member_tasks(
-            mentioned_member, db, intent
+        fetchers["specific_member_tasks"] = lambda s: get_member_tasks(
+            mentioned_member, s, intent
         )
         # Also load team workload so admin can compare
-        ctx["team_workload"] = await get_team_workload(user, db)
+        fetchers["team_workload"] = lambda s: get_team_workload(user, s)
 
     # ── Admin: general team-wide query (no specific name, but "team" keyword) ─
     elif is_admin and intent["wants_team"]:
-        ctx["team_workload"] = await get_team_workload(user, db)
+        fetchers["team_workload"] = lambda s: get_team_workload(user, s)
         if wants_task_detail:
-            ctx["all_team_tasks"] = await get_all_team_tasks(user, db, intent)
+            fetchers["all_team_tasks"] = lambda s: get_all_team_tasks(user, s, intent)
 
     # ── Admin: task query not scoped to self and no specific name mentioned ───
     elif is_admin and wants_task_detail and not intent["wants_own"]:
-        ctx["all_team_tasks"] = await get_all_team_tasks(user, db, intent)
+        fetchers["all_team_tasks"] = lambda s: get_all_team_tasks(user, s, intent)
 
     # ── Personal task detail (admin asking about self, or any non-admin) ─────
     if wants_task_detail and (intent["wants_own"] or not is_admin):
-        ctx["my_tasks"] = await get_my_tasks_detailed(user, db, intent)
+        fetchers["my_tasks"] = lambda s: get_my_tasks_detailed(user, s, intent)
 
     # ── Meetings context (available to everyone) ──────────────────────────────
     if intent["wants_meetings"]:
-        ctx["meetings"] = await get_meetings_context(user, db)
+        fetchers["meetings"] = lambda s: get_meetings_context(user, s, raw_query)
+
+    async def _fetch(fetcher: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with AsyncSession(db.bind, expire_on_commit=False) as session:
+            return await fetcher(session)
+
+    results = await asyncio.gather(*(_fetch(f) for f in fetchers.values()))
+    ctx.update(zip(fetchers.keys(), results))
 
     return ctx
 
@@ -214,23 +240,26 @@ async def build_context(
 
 async def get_my_task_snapshot(user: User, db: AsyncSession) -> Dict[str, Any]:
     """Quick count of the current user's tasks by status."""
+    return await _task_snapshot(user.id, db)
+
+
+async def _task_snapshot(assignee_id: str, db: AsyncSession) -> Dict[str, Any]:
+    """Per-status counts plus overdue for one assignee, in a single query."""
     counts_result = await db.execute(
-        select(Task.status, func.count(Task.id))
-        .where(Task.assignee_id == user.id)
-        .group_by(Task.status)
-    )
-    counts = {row[0].value: row[1] for row in counts_result}
-
-    overdue_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.assignee_id == user.id,
-                Task.due_date < _now(),
-                Task.status != TaskStatus.DONE,
-            )
+        select(
+            Task.status,
+            func.count(Task.id),
+            func.sum(case((Task.due_date < _now(), 1), else_=0)),
         )
+        .where(Task.assignee_id == assignee_id)
+        .group_by(Task.status)
     )
-    overdue = overdue_result.scalar() or 0
+    counts: Dict[str, int] = {}
+    overdue = 0
+    for status, count, due_passed in counts_result:
+        counts[status.value] = count
+        if status != TaskStatus.DONE:
+            overdue += int(due_passed or 0)
 
     return {
         "todo": counts.get("todo", 0),
@@ -253,17 +282,8 @@ async def get_my_tasks_detailed(
     filters = [Task.assignee_id == user.id]
     _apply_intent_filters(filters, intent)
 
-    q = (
-        select(Task)
-        .where(and_(*filters))
-        .options(selectinload(Task.creator))
-        .order_by(Task.due_date.asc().nullslast(), Task.created_at.desc())
-        .limit(30)
-    )
-    result = await db.execute(q)
-    tasks = result.scalars().all()
-
-    task_list = [_format_task(t, show_assignee=False) for t in tasks]
+    result = await db.execute(_task_rows_query(filters, limit=30))
+    task_list = [_format_task(t, show_assignee=False) for t in result]
     if intent["wants_high_priority"] and not intent["wants_blocked"] and not intent["wants_in_progress"]:
         task_list = [t for t in task_list if t["priority"] in ("high", "urgent")]
 
@@ -284,54 +304,16 @@ async def get_member_tasks(
     filters = [Task.assignee_id == member.id]
     _apply_intent_filters(filters, intent)
 
-    q = (
-        select(Task)
-        .where(and_(*filters))
-        .options(selectinload(Task.creator))
-        .order_by(Task.due_date.asc().nullslast(), Task.created_at.desc())
-        .limit(50)
-    )
-    result = await db.execute(q)
-    tasks = result.scalars().all()
-
-    task_list = [_format_task(t, show_assignee=False) for t in tasks]
+    result = await db.execute(_task_rows_query(filters, limit=50))
+    task_list = [_format_task(t, show_assignee=False) for t in result]
     if intent["wants_high_priority"] and not intent["wants_blocked"] and not intent["wants_in_progress"]:
         task_list = [t for t in task_list if t["priority"] in ("high", "urgent")]
 
-    # Status snapshot for this member
-    counts_result = await db.execute(
-        select(Task.status, func.count(Task.id))
-        .where(Task.assignee_id == member.id)
-        .group_by(Task.status)
-    )
-    counts = {row[0].value: row[1] for row in counts_result}
-
-    overdue_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.assignee_id == member.id,
-                Task.due_date < _now(),
-                Task.status != TaskStatus.DONE,
-            )
-        )
-    )
-
     return {
         "member_name": member.full_name,
         "member_email": member.email,
         "member_role": member.role.value,
-        "snapshot": {
-            "todo": counts.get("todo", 0),
-            "in_progress": counts.get("in_progress", 0),
-            "done": counts.get("done", 0),
-            "blocked": counts.get("blocked", 0),
-            "overdue": overdue_result.scalar() or 0,
-            "total_active": (
-                counts.get("todo", 0)
-                + counts.get("in_progress", 0)
-                + counts.get("blocked", 0)
-            ),
-        },
+        "snapshot": await _task_snapshot(member.id, db),
         "tasks": task_list,
         "count": len(task_list),
         "filter_applied": _describe_filter(intent),
@@ -345,17 +327,8 @@ async def get_all_team_tasks(
     filters = [Task.team_id == user.team_id]
     _apply_intent_filters(filters, intent)
 
-    q = (
-        select(Task)
-        .where(and_(*filters))
-        .options(selectinload(Task.assignee), selectinload(Task.creator))
-        .order_by(Task.due_date.asc().nullslast(), Task.created_at.desc())
-        .limit(50)
-    )
-    result = await db.execute(q)
-    tasks = result.scalars().all()
-
-    task_list = [_format_task(t, show_assignee=True) for t in tasks]
+    result = await db.execute(_task_rows_query(filters, limit=50, with_assignee=True))
+    task_list = [_format_task(t, show_assignee=True) for t in result]
     if intent["wants_high_priority"] and not intent["wants_blocked"] and not intent["wants_in_progress"]:
         task_list = [t for t in task_list if t["priority"] in ("high", "urgent")]
 
@@ -375,59 +348,95 @@ async def get_all_team_tasks(
 
 async def get_team_workload(user: User, db: AsyncSession) -> List[Dict[str, Any]]:
     """Admin only: per-member active task count and overdue count."""
-    members_result = await db.execute(
-        select(User).where(User.team_id == user.team_id)
-    )
-    members = members_result.scalars().all()
-
-    workload = []
-    for m in members:
-        active_res = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(Task.assignee_id == m.id, Task.status != TaskStatus.DONE)
-            )
+    # Members joined to their open tasks in one grouped query; the LEFT JOIN
+    # keeps members with nothing open (count 0)
+    result = await db.execute(
+        select(
+            User.full_name,
+            User.email,
+            User.role,
+            func.count(Task.id).label("active"),
+            func.sum(case((Task.due_date < _now(), 1), else_=0)).label("overdue"),
         )
-        overdue_res = await db.execute(
-            select(func.count(Task.id)).where(
-                and_(
-                    Task.assignee_id == m.id,
-                    Task.due_date < _now(),
-                    Task.status != TaskStatus.DONE,
-                )
-            )
+        .select_from(User)
+        .outerjoin(
+            Task,
+            and_(Task.assignee_id == User.id, Task.status != TaskStatus.DONE),
         )
-        workload.append({
-            "name": m.full_name,
-            "email": m.email,
-            "role": m.role.value,
-            "active_tasks": active_res.scalar() or 0,
-            "overdue_tasks": overdue_res.scalar() or 0,
-        })
+        .where(User.team_id == user.team_id)
+        .group_by(User.id, User.full_name, User.email, User.role)
+    )
+
+    workload = [
+        {
+            "name": row.full_name,
+            "email": row.email,
+            "role": row.role.value,
+            "active_tasks": row.active,
+            "overdue_tasks": int(row.overdue or 0),
+        }
+        for row in result.all()
+    ]
 
     workload.sort(key=lambda x: x["active_tasks"], reverse=True)
     return workload
 
 
-async def get_meetings_context(user: User, db: AsyncSession) -> Dict[str, Any]:
-    """Recent completed team meetings with summaries and action items."""
-    meetings_result = await db.execute(
-        select(Meeting)
-        .where(
-            and_(
-                Meeting.team_id == user.team_id,
-                Meeting.status == "completed",
-            )
+async def get_meetings_context(
+    user: User, db: AsyncSession, raw_query: str = ""
+) -> Dict[str, Any]:
+    """
+    Recent completed team meetings with summaries and action items.
+    On PostgreSQL, meetings whose summaries match words from the question are
+    ranked first using the full-text index; otherwise newest first.
+    """
+    q = select(
+        Meeting.id,
+        Meeting.title,
+        Meeting.created_at,
+        Meeting.duration_minutes,
+        func.substr(Meeting.summary, 1, 1200).label("summary"),
+    ).where(
+        and_(
+            Meeting.team_id == user.team_id,
+            Meeting.status == "completed",
         )
-        .options(selectinload(Meeting.action_items))
-        .order_by(Meeting.created_at.desc())
-        .limit(5)
     )
-    meetings = meetings_result.scalars().all()
 
-    meeting_list = []
-    for m in meetings:
-        action_items = [
-            {
+    meetings = []
+    terms = _search_terms(raw_query)
+    if terms and db.get_bind().dialect.name == "postgresql":
+        # Must match the idx_meeting_summary_fts expression to use the index
+        english = literal_column("'english'")
+        summary_vector = func.to_tsvector(english, Meeting.summary)
+        ts_query = func.to_tsquery(english, " | ".join(terms))
+        ranked_result = await db.execute(
+            q.where(summary_vector.op("@@")(ts_query))
+            .order_by(func.ts_rank(summary_vector, ts_query).desc(), Meeting.created_at.desc())
+            .limit(5)
+        )
+        meetings = ranked_result.all()
+
+    if not meetings:
+        meetings_result = await db.execute(
+            q.order_by(Meeting.created_at.desc()).limit(5)
+        )
+        meetings = meetings_result.all()
+
+    items_by_meeting: Dict[str, list] = {m.id: [] for m in meetings}
+    if items_by_meeting:
+        items_result = await db.execute(
+            select(
+                ActionItem.meeting_id,
+                ActionItem.description,
+                ActionItem.assignee_mentioned,
+                ActionItem.deadline_mentioned,
+                ActionItem.status,
+                ActionItem.context_type,
+            ).where(ActionItem.meeting_id.in_(list(items_by_meeting)))
+        )
+        for ai in items_result:
+            items_by_meeting[ai.meeting_id].append({
                 "description": ai.description,
                 "assignee": ai.assignee_mentioned,
                 "deadline": (
@@ -437,15 +446,17 @@ async def get_meetings_context(user: User, db: AsyncSession) -> Dict[str, Any]:
                 ),
                 "status": ai.status.value,
                 "context_type": ai.context_type,
-            }
-            for ai in (m.action_items or [])
-        ]
+            })
+
+    meeting_list = []
+    for m in meetings:
+        action_items = items_by_meeting[m.id]
         meeting_list.append({
             "id": m.id,
             "title": m.title,
             "date": m.created_at.strftime("%Y-%m-%d"),
             "duration_minutes": m.duration_minutes,
-            "summary": m.summary[:1200] if m.summary else None,
+            "summary": m.summary or None,
             "action_items": action_items,
             "action_items_count": len(action_items),
         })
@@ -460,6 +471,15 @@ async def get_meetings_context(user: User, db: AsyncSession) -> Dict[str, Any]:
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _search_terms(query: str) -> List[str]:
+    """Distinct alphanumeric words (3+ chars) from a query, safe for to_tsquery."""
+    terms: List[str] = []
+    for word in re.findall(r"[a-z0-9]+", query.lower()):
+        if len(word) >= 3 and word not in terms:
+            terms.append(word)
+    return terms[:12]
+
+
 def _apply_intent_filters(filters: list, intent: Dict[str, bool]) -> None:
     """Mutate a filters list with time/status constraints from intent."""
     if intent["wants_overdue"]:
@@ -480,7 +500,37 @@ def _apply_intent_filters(filters: list, intent: Dict[str, bool]) -> None:
         filters.append(Task.status == TaskStatus.IN_PROGRESS)
 
 
-def _format_task(task: Task, show_assignee: bool) -> Dict[str, Any]:
+def _task_rows_query(filters: list, limit: int, with_assignee: bool = False):
+    """
+    Column-only task select for chat context: just the fields _format_task
+    reports, with creator/assignee names joined in instead of loaded objects.
+    """
+    creator = aliased(User)
+    columns = [
+        Task.id,
+        Task.title,
+        func.substr(Task.description, 1, 200).label("description"),
+        Task.status,
+        Task.priority,
+        Task.due_date,
+        Task.source_type,
+        creator.full_name.label("creator_name"),
+    ]
+    q = select(*columns).outerjoin(creator, Task.created_by_id == creator.id)
+    if with_assignee:
+        assignee = aliased(User)
+        q = q.add_columns(
+            assignee.full_name.label("assignee_name"),
+            assignee.email.label("assignee_email"),
+        ).outerjoin(assignee, Task.assignee_id == assignee.id)
+    return (
+        q.where(and_(*filters))
+        .order_by(Task.due_date.asc().nullslast(), Task.created_at.desc())
+        .limit(limit)
+    )
+
+
+def _format_task(task, show_assignee: bool) -> Dict[str, Any]:
     now = _now()
     is_overdue = (
         task.due_date is not None
@@ -490,17 +540,17 @@ def _format_task(task: Task, show_assignee: bool) -> Dict[str, Any]:
     d: Dict[str, Any] = {
         "id": task.id,
         "title": task.title,
-        "description": task.description[:200] if task.description else None,
+        "description": task.description or None,
         "status": task.status.value,
         "priority": task.priority.value,
         "due_date": task.due_date.strftime("%Y-%m-%d") if task.due_date else None,
         "is_overdue": is_overdue,
         "source": task.source_type.value,
-        "created_by": task.creator.full_name if task.creator else None,
+        "created_by": task.creator_name,
     }
     if show_assignee:
-        d["assignee"] = task.assignee.full_name if task.assignee else "Unassigned"
-        d["assignee_email"] = task.assignee.email if task.assignee else None
+        d["assignee"] = task.assignee_name or "Unassigned"
+        d["assignee_email"] = task.assignee_email
     return d
 
 
@@ -1,64 +1,146 @@
 """Email endpoints - list, detail, stats, sync from Gmail"""
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, insert, update, and_, or_, func, tuple_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import undefer
 from typing import List, Optional
 from datetime import datetime, timedelta, timezone
+import asyncio
 import uuid
 import logging
 
+from cachetools import TTLCache
+
 from app.database import get_db
 from app.models import User, Email, Integration, IntegrationPlatform
 from app.models.task import Task, TaskStatus, TaskPriority, TaskSourceType
 from app.dependencies import get_current_user
+from app.schemas.email import EmailListResponse
+from app.services.gmail_service import fetch_emails, delete_email_from_gmail, get_active_gmail_integration
+from app.utils.cache import cache_get_json, cache_set_json, cache_delete
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.responses import UTCORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/emails", tags=["Emails"])
 
+# Stats only change when this user's mail is synced, seeded or deleted, and
+# those paths drop the entry; the TTL just bounds staleness from elsewhere
+EMAIL_STATS_CACHE_TTL = 60  # seconds
+
+# How long a finished sync's status stays pollable
+SYNC_JOB_TTL = 3600  # seconds
+
+# Sync jobs run in this process (BackgroundTasks), so their state is kept
+# here as well as in Redis. Polls that land on the same worker read it
+# directly, and without Redis ("No Redis" local mode) it is the only copy.
+_local_sync_jobs: TTLCache = TTLCache(maxsize=1000, ttl=SYNC_JOB_TTL)
+
 
-@router.post("/sync")
+def _stats_cache_key(user_id: str) -> str:
+    return f"email-stats:{user_id}"
+
+
+@router.post("/sync", status_code=202)
 async def sync_emails(
+    background_tasks: BackgroundTasks,
     limit: int = Query(default=30, le=50),
     days: int = Query(default=7, le=30),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Sync emails from Gmail into the database.
-    Deduplicates by gmail_message_id.
+    Start a Gmail sync for the current user.
+
+    IMAP fetch and task extraction take seconds, so they run after the
+    response; poll GET /sync/{job_id} for progress and the final counts.
     """
-    from app.services.gmail_service import fetch_emails
-
-    # Get active Gmail integration
-    result = await db.execute(
-        select(Integration).where(
-            and_(
-                Integration.user_id == current_user.id,
-                Integration.platform == IntegrationPlatform.GMAIL,
-                Integration.is_active == True,
-            )
-        )
-    )
-    integration = result.scalar_one_or_none()
+    # Check the integration up front so "not connected" is still an immediate error
+    integration = await get_active_gmail_integration(db, current_user.id)
 
     if not integration:
         raise HTTPException(status_code=404, detail="Gmail not connected. Go to Settings to connect.")
 
-    email_addr = integration.platform_metadata.get("email", "")
-    app_password = integration.access_token
+    job_id = uuid.uuid4().hex
+    await _set_sync_job(job_id, current_user.id, "queued")
+    background_tasks.add_task(
+        _do_sync, job_id, current_user.id, current_user.team_id, integration.id, limit, days
+    )
+    return {"job_id": job_id, "status": "queued"}
+
+
+@router.get("/sync/{job_id}")
+async def get_sync_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """Get the status of a sync started with POST /sync."""
+    job = _local_sync_jobs.get(job_id)
+    job = dict(job) if job else await cache_get_json(_sync_job_key(job_id))
+    if not job or job.get("user_id") != current_user.id:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    job.pop("user_id", None)
+    return {"job_id": job_id, **job}
+
+
+def _sync_job_key(job_id: str) -> str:
+    return f"email-sync:{job_id}"
+
+
+async def _set_sync_job(job_id: str, user_id: str, status: str, **fields) -> None:
+    job = {"user_id": user_id, "status": status, **fields}
+    _local_sync_jobs[job_id] = job
+    # Shared copy for polls served by other workers; best effort
+    await cache_set_json(_sync_job_key(job_id), job, SYNC_JOB_TTL)
+
 
+async def _do_sync(job_id: str, user_id: str, team_id: str, integration_id: str, limit: int, days: int):
+    """Background task: fetch from Gmail off the event loop, then ingest."""
+    from app.database import AsyncSessionLocal
+
+    await _set_sync_job(job_id, user_id, "running")
     try:
-        raw_emails = fetch_emails(
-            email_addr=email_addr,
-            app_password=app_password,
-            limit=limit,
-            since_days=days,
-        )
+        async with AsyncSessionLocal() as db:
+            integration = await db.get(Integration, integration_id)
+            if not integration or not integration.is_active:
+                await _set_sync_job(job_id, user_id, "failed", detail="Gmail not connected. Go to Settings to connect.")
+                return
+
+            try:
+                # imaplib is blocking; keep the event loop free while it runs
+                raw_emails = await asyncio.to_thread(
+                    fetch_emails,
+                    email_addr=integration.platform_metadata.get("email", ""),
+                    app_password=integration.access_token,
+                    limit=limit,
+                    since_days=days,
+                )
+            except Exception as e:
+                await _set_sync_job(job_id, user_id, "failed", detail=f"Failed to fetch emails: {str(e)}")
+                return
+
+            summary = await _ingest_emails(db, user_id, team_id, integration, raw_emails)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch emails: {str(e)}")
+        logger.exception("Email sync job %s failed", job_id)
+        await _set_sync_job(job_id, user_id, "failed", detail=f"Sync failed: {str(e)}")
+        return
+
+    await _set_sync_job(job_id, user_id, "completed", **summary)
 
+
+async def _ingest_emails(
+    db: AsyncSession,
+    user_id: str,
+    team_id: str,
+    integration: Integration,
+    raw_emails: List[dict],
+) -> dict:
+    """
+    Store fetched emails, deduplicating by gmail_message_id, and auto-create
+    tasks from the new ones.
+    """
     from app.services.ai_service import extract_task_from_email
 
     new_count = 0
@@ -66,52 +148,88 @@ async def sync_emails(
     new_email_ids: list[tuple[str, dict]] = []  # (email_db_id, raw_email)
     created_tasks: list[Task] = []
 
+    # Most of a re-sync window is mail we already have. Look up only this
+    # batch's ids (an index range probe on uq_emails_user_gmail_id) so known
+    # messages are never re-sent; ON CONFLICT below still covers a concurrent sync.
+    incoming_ids = {
+        (raw.get("gmail_message_id", "") or "").strip() for raw in raw_emails
+    } - {""}
+    existing_ids: set[str] = set()
+    if incoming_ids:
+        existing_ids = set((await db.execute(
+            select(Email.gmail_message_id).where(
+                Email.user_id == user_id,
+                Email.gmail_message_id.in_(incoming_ids),
+            )
+        )).scalars().all())
+
+    # Build every row first, then insert them in one multi-row statement
+    rows: list[dict] = []
+    raw_by_msg_id: dict[str, dict] = {}
+    synced_at = datetime.utcnow()
     for raw in raw_emails:
         # Normalize Message-ID: strip any whitespace/newlines from header folding
         msg_id = (raw.get("gmail_message_id", "") or "").strip()
-        if not msg_id:
+        if not msg_id or msg_id in raw_by_msg_id or msg_id in existing_ids:
             continue
 
         # Parse received_at and normalize to naive UTC (DB uses TIMESTAMP WITHOUT TIME ZONE)
+        # (fromisoformat accepts a trailing "Z" natively on Python 3.11+)
         received_at = None
-        if raw.get("received_at"):
+        if ts := raw.get("received_at"):
             try:
-                dt = datetime.fromisoformat(raw["received_at"].replace("Z", "+00:00"))
+                dt = datetime.fromisoformat(ts)
                 if dt.tzinfo is not None:
                     dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
                 received_at = dt
-            except Exception:
+            except (TypeError, ValueError):
                 received_at = None
 
-        email_db_id = str(uuid.uuid4())
-
-        # Use INSERT ... ON CONFLICT DO NOTHING so duplicate syncs never raise errors
-        stmt = pg_insert(Email).values(
-            id=email_db_id,
-            gmail_message_id=msg_id,
-            subject=raw.get("subject", "")[:1000],
-            sender=raw.get("sender", "")[:500],
-            to=raw.get("to", "")[:500],
-            body_preview=raw.get("body_preview", "")[:500],
-            body=raw.get("body", ""),
-            received_at=received_at,
-            is_read=raw.get("is_read", False),
-            is_flagged=raw.get("is_flagged", False),
-            ai_classification=None,
-            ai_summary=None,
-            user_id=current_user.id,
-            integration_id=integration.id,
-            created_at=datetime.utcnow(),
-        ).on_conflict_do_nothing(constraint="uq_emails_user_gmail_id")
-
+        raw_by_msg_id[msg_id] = raw
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "gmail_message_id": msg_id,
+            "subject": raw.get("subject", "")[:1000],
+            "sender": raw.get("sender", "")[:500],
+            "to": raw.get("to", "")[:500],
+            "body_preview": raw.get("body_preview", "")[:500],
+            "body": raw.get("body", ""),
+            "received_at": received_at,
+            "is_read": raw.get("is_read", False),
+            "is_flagged": raw.get("is_flagged", False),
+            "ai_classification": None,
+            "ai_summary": None,
+            "user_id": user_id,
+            "integration_id": integration.id,
+            "created_at": synced_at,
+        })
+
+    if rows:
+        # ON CONFLICT DO NOTHING so duplicate syncs never raise errors;
+        # RETURNING reports exactly which messages were new
+        stmt = (
+            pg_insert(Email)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["user_id", "gmail_message_id"])
+            .returning(Email.id, Email.gmail_message_id)
+        )
         result = await db.execute(stmt)
-        if result.rowcount > 0:
+        for email_db_id, msg_id in result.all():
             new_count += 1
-            new_email_ids.append((email_db_id, raw))
-
-    # Update last synced
-    integration.last_synced_at = datetime.utcnow()
+            new_email_ids.append((email_db_id, raw_by_msg_id[msg_id]))
+
+    # Update last synced in the same transaction as the insert; a Core UPDATE
+    # skips the ORM flush. The naive UTC value is computed here rather than
+    # with now(), which would follow the session timezone (not pinned to UTC
+    # behind PgBouncer)
+    await db.execute(
+        update(Integration)
+        .where(Integration.id == integration.id)
+        .values(last_synced_at=synced_at)
+    )
     await db.commit()
+    if new_count:
+        await cache_delete(_stats_cache_key(user_id))
 
     # Auto-extract tasks from newly synced emails using AI
     for email_db_id, raw in new_email_ids:
@@ -146,9 +264,9 @@ async def sync_emails(
                     status=TaskStatus.TODO,
                     priority=priority,
                     due_date=due_date,
-                    assignee_id=current_user.id,
-                    created_by_id=current_user.id,
-                    team_id=current_user.team_id,
+                    assignee_id=user_id,
+                    created_by_id=user_id,
+                    team_id=team_id,
                     source_type=TaskSourceType.AI,
                     source_id=email_db_id,
                 )
@@ -169,7 +287,7 @@ async def sync_emails(
         try:
             from app.services.jira_service import JiraService
             team_user_ids_result = await db.execute(
-                select(User.id).where(User.team_id == current_user.team_id)
+                select(User.id).where(User.team_id == team_id)
             )
             team_user_ids = [row[0] for row in team_user_ids_result.all()]
             jira_int_result = await db.execute(
@@ -215,7 +333,7 @@ async def sync_emails(
         except Exception as _e:
             logger.error("Auto Jira sync batch failed for email sync: %s", _e)
 
-    logger.info(f"Synced {new_count} new emails, auto-created {tasks_created} tasks for user {current_user.id}")
+    logger.info(f"Synced {new_count} new emails, auto-created {tasks_created} tasks for user {user_id}")
 
     return {
         "message": f"Synced {new_count} new emails" + (f", created {tasks_created} task(s) from email content" if tasks_created else ""),
@@ -225,18 +343,33 @@ async def sync_emails(
     }
 
 
-@router.get("")
+@router.get("", response_model=EmailListResponse)
 async def list_emails(
-    limit: int = Query(default=20, le=50),
-    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=50),
+    cursor: Optional[str] = None,
     is_read: Optional[bool] = None,
     is_flagged: Optional[bool] = None,
     search: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List synced emails with filters and pagination."""
-    query = select(Email).where(Email.user_id == current_user.id)
+    """
+    List synced emails with filters, newest first.
+
+    Keyset-paginated: pass the previous page's next_cursor as cursor to get
+    the following page. next_cursor is null on the last page.
+    """
+    # Explicit columns: the list never shows body, which can be many KB per row
+    query = select(
+        Email.id,
+        Email.subject,
+        Email.sender,
+        Email.body_preview,
+        Email.received_at,
+        Email.is_read,
+        Email.is_flagged,
+        Email.ai_classification,
+    ).where(Email.user_id == current_user.id)
 
     if is_read is not None:
         query = query.where(Email.is_read == is_read)
@@ -247,24 +380,35 @@ async def list_emails(
             Email.subject.ilike(f"%{search}%") | Email.sender.ilike(f"%{search}%")
         )
 
-    query = query.order_by(desc(Email.received_at)).limit(limit).offset(offset)
+    if cursor:
+        # Resume strictly after the cursor row in (received_at DESC NULLS FIRST,
+        # id DESC) order, so the scan starts at the right index position
+        # instead of walking and discarding earlier pages
+        cursor_received, cursor_id = decode_cursor(cursor)
+        if cursor_received is None:
+            query = query.where(or_(
+                and_(Email.received_at.is_(None), Email.id < cursor_id),
+                Email.received_at.isnot(None),
+            ))
+        else:
+            query = query.where(
+                tuple_(Email.received_at, Email.id) < tuple_(cursor_received, cursor_id)
+            )
+
+    # NULLS FIRST is Postgres' default for DESC; spelled out so every backend
+    # agrees with the cursor logic above
+    query = query.order_by(Email.received_at.desc().nulls_first(), Email.id.desc()).limit(limit)
 
     result = await db.execute(query)
-    emails = result.scalars().all()
+    emails = result.all()
 
-    return [
-        {
-            "id": e.id,
-            "subject": e.subject,
-            "sender": e.sender,
-            "body_preview": e.body_preview,
-            "received_at": e.received_at.isoformat() + "Z" if e.received_at else None,
-            "is_read": e.is_read,
-            "is_flagged": e.is_flagged,
-            "ai_classification": e.ai_classification,
-        }
-        for e in emails
-    ]
+    next_cursor = (
+        encode_cursor(emails[-1].received_at, emails[-1].id) if len(emails) == limit else None
+    )
+
+    # Rows go straight to EmailListResponse; pydantic-core builds and
+    # serializes the items without a hand-written dict per row
+    return {"emails": emails, "next_cursor": next_cursor}
 
 
 @router.get("/stats")
@@ -273,109 +417,127 @@ async def email_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """Get email statistics."""
-    base = select(func.count()).select_from(Email).where(Email.user_id == current_user.id)
-
-    total = (await db.execute(base)).scalar() or 0
-    unread = (await db.execute(base.where(Email.is_read == False))).scalar() or 0
-    flagged = (await db.execute(base.where(Email.is_flagged == True))).scalar() or 0
-
-    return {"total": total, "unread": unread, "flagged": flagged}
-
-
-@router.post("/seed-demo")
-async def seed_demo_emails(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """Insert dummy test emails for demo/testing purposes."""
-    now = datetime.utcnow()
-
-    demo_emails = [
+    cache_key = _stats_cache_key(current_user.id)
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    # One scan of the user's rows; FILTER splits out the unread/flagged counts
+    row = (await db.execute(
+        select(
+            func.count().label("total"),
+            func.count().filter(Email.is_read == False).label("unread"),
+            func.count().filter(Email.is_flagged == True).label("flagged"),
+        ).where(Email.user_id == current_user.id)
+    )).one()
+
+    stats = {"total": row.total, "unread": row.unread, "flagged": row.flagged}
+    await cache_set_json(cache_key, stats, EMAIL_STATS_CACHE_TTL)
+    return stats
+
+
+# Static part of the demo inbox as (age, fields); ids, recipient and
+# received_at (now - age) are filled in per request
+_DEMO_EMAILS = tuple(
+    (em.pop("age"), em)
+    for em in [
         {
-            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
             "subject": "Sprint Planning - Q1 Review",
             "sender": "Sarah Chen <sarah.chen@company.com>",
-            "to": current_user.email,
             "body_preview": "Hi team, let's review our Q1 progress and plan for the next sprint. Please bring your updates...",
             "body": "Hi team,\n\nLet's review our Q1 progress and plan for the next sprint.\n\nPlease bring your updates on:\n- Current task completion rates\n- Any blockers or dependencies\n- Priorities for next sprint\n\nMeeting is scheduled for Thursday at 2pm.\n\nBest,\nSarah",
-            "received_at": now - timedelta(hours=1),
+            "age": timedelta(hours=1),
             "is_read": False,
             "is_flagged": True,
             "ai_classification": "action_required",
         },
         {
-            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
             "subject": "Bug Report: Login page crash on mobile",
             "sender": "Dev Team <devteam@company.com>",
-            "to": current_user.email,
             "body_preview": "A critical bug has been reported in the login page. Users on iOS 17 are experiencing crashes when...",
             "body": "A critical bug has been reported in the login page.\n\nUsers on iOS 17 are experiencing crashes when tapping the password field. This affects approximately 15% of our mobile users.\n\nSteps to reproduce:\n1. Open app on iOS 17 device\n2. Navigate to login\n3. Tap password field\n4. App crashes\n\nPriority: HIGH\nAssigned to: Frontend Team\n\nPlease investigate ASAP.",
-            "received_at": now - timedelta(hours=3),
+            "age": timedelta(hours=3),
             "is_read": False,
             "is_flagged": True,
             "ai_classification": "urgent",
         },
         {
-            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
             "subject": "Weekly Standup Notes - Feb 10",
             "sender": "Ali Khan <ali.khan@company.com>",
-            "to": current_user.email,
             "body_preview": "Here are the notes from today's standup. Backend: API refactor complete. Frontend: Dashboard redesign in progress...",
             "body": "Here are the notes from today's standup:\n\nBackend Team:\n- API refactor complete\n- Database migration scripts ready\n- Performance testing scheduled for Wednesday\n\nFrontend Team:\n- Dashboard redesign 70% complete\n- New component library integrated\n- Mobile responsive fixes in progress\n\nDevOps:\n- CI/CD pipeline updated\n- Staging environment refreshed\n\nNext standup: Wednesday 10am",
-            "received_at": now - timedelta(hours=6),
+            "age": timedelta(hours=6),
             "is_read": True,
             "is_flagged": False,
             "ai_classification": "fyi",
         },
         {
-            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
             "subject": "Invoice #INV-2024-0342 Attached",
             "sender": "Billing <billing@cloudhost.io>",
-            "to": current_user.email,
             "body_preview": "Your monthly invoice for January 2024 is ready. Total: $127.50. Payment due by Feb 28...",
             "body": "Your monthly invoice for January 2024 is ready.\n\nPlan: Team Pro\nPeriod: Jan 1 - Jan 31, 2024\nTotal: $127.50\n\nPayment due by: Feb 28, 2024\n\nView and pay your invoice online at: https://billing.cloudhost.io/invoices\n\nThank you for your business!\n\n- CloudHost Billing Team",
-            "received_at": now - timedelta(days=1),
+            "age": timedelta(days=1),
             "is_read": True,
             "is_flagged": False,
             "ai_classification": "billing",
         },
         {
-            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
             "subject": "Re: API Integration Questions",
             "sender": "Mike Johnson <mike.j@partnerco.com>",
-            "to": current_user.email,
             "body_preview": "Thanks for the detailed docs! One more question - does your webhook support retry logic for failed deliveries?",
             "body": "Thanks for the detailed docs! One more question - does your webhook support retry logic for failed deliveries?\n\nWe're planning to go live next week and want to make sure we handle edge cases properly.\n\nAlso, is there a sandbox environment we can test against?\n\nThanks,\nMike",
-            "received_at": now - timedelta(days=1, hours=5),
+            "age": timedelta(days=1, hours=5),
             "is_read": False,
             "is_flagged": False,
             "ai_classification": "needs_reply",
         },
     ]
+)
 
-    count = 0
-    for em_data in demo_emails:
-        email_record = Email(
-            gmail_message_id=em_data["gmail_message_id"],
-            subject=em_data["subject"],
-            sender=em_data["sender"],
-            to=em_data["to"],
-            body_preview=em_data["body_preview"],
-            body=em_data["body"],
-            received_at=em_data["received_at"],
-            is_read=em_data["is_read"],
-            is_flagged=em_data["is_flagged"],
-            ai_classification=em_data["ai_classification"],
-            user_id=current_user.id,
-            integration_id=None,
-        )
-        db.add(email_record)
-        count += 1
+
+@router.post("/seed-demo")
+async def seed_demo_emails(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Insert dummy test emails for demo/testing purposes."""
+    now = datetime.utcnow()
+
+    rows = [
+        {
+            **em_data,
+            "id": str(uuid.uuid4()),
+            "gmail_message_id": f"demo-{uuid.uuid4().hex[:12]}",
+            "to": current_user.email,
+            "received_at": now - age,
+            "user_id": current_user.id,
+            "integration_id": None,
+            "created_at": now,
+        }
+        for age, em_data in _DEMO_EMAILS
+    ]
+    await db.execute(insert(Email), rows)
+    count = len(rows)
 
     await db.commit()
+    await cache_delete(_stats_cache_key(current_user.id))
     return {"message": f"Created {count} demo emails", "count": count}
 
 
+async def _get_owned_email(db: AsyncSession, email_id: str, user_id: str, *options) -> Email:
+    """Load an email by primary key (with loader options), 404ing unless it belongs to user_id."""
+    # Ids are always UUIDs; reject anything else without a round trip
+    try:
+        uuid.UUID(email_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Email not found")
+
+    email_record = await db.get(Email, email_id, options=options)
+    if not email_record or email_record.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Email not found")
+    return email_record
+
+
 @router.delete("/{email_id}")
 async def delete_email(
     email_id: str,
@@ -383,34 +545,16 @@ async def delete_email(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete an email from the database and from Gmail."""
-    result = await db.execute(
-        select(Email).where(
-            and_(Email.id == email_id, Email.user_id == current_user.id)
-        )
-    )
-    email_record = result.scalar_one_or_none()
-
-    if not email_record:
-        raise HTTPException(status_code=404, detail="Email not found")
+    email_record = await _get_owned_email(db, email_id, current_user.id)
 
     gmail_deleted = False
 
     # Only attempt Gmail deletion for real (non-demo) emails
     if email_record.gmail_message_id and not email_record.gmail_message_id.startswith("demo-"):
         # Get Gmail integration credentials
-        integ_result = await db.execute(
-            select(Integration).where(
-                and_(
-                    Integration.user_id == current_user.id,
-                    Integration.platform == IntegrationPlatform.GMAIL,
-                    Integration.is_active == True,
-                )
-            )
-        )
-        integration = integ_result.scalar_one_or_none()
+        integration = await get_active_gmail_integration(db, current_user.id)
 
         if integration:
-            from app.services.gmail_service import delete_email_from_gmail
             email_addr = integration.platform_metadata.get("email", "")
             app_password = integration.access_token
             try:
@@ -420,6 +564,7 @@ async def delete_email(
 
     await db.delete(email_record)
     await db.commit()
+    await cache_delete(_stats_cache_key(current_user.id))
 
     return {"message": "Email deleted", "gmail_deleted": gmail_deleted}
 
@@ -431,17 +576,9 @@ async def get_email(
     db: AsyncSession = Depends(get_db)
 ):
     """Get a single email with full body."""
-    result = await db.execute(
-        select(Email).where(
-            and_(Email.id == email_id, Email.user_id == current_user.id)
-        )
-    )
-    email_record = result.scalar_one_or_none()
-
-    if not email_record:
-        raise HTTPException(status_code=404, detail="Email not found")
+    email_record = await _get_owned_email(db, email_id, current_user.id, undefer(Email.body))
 
-    return {
+    return UTCORJSONResponse({
         "id": email_record.id,
         "gmail_message_id": email_record.gmail_message_id,
         "subject": email_record.subject,
@@ -449,10 +586,10 @@ async def get_email(
         "to": email_record.to,
         "body_preview": email_record.body_preview,
         "body": email_record.body,
-        "received_at": email_record.received_at.isoformat() + "Z" if email_record.received_at else None,
+        "received_at": email_record.received_at,
         "is_read": email_record.is_read,
         "is_flagged": email_record.is_flagged,
         "ai_classification": email_record.ai_classification,
         "ai_summary": email_record.ai_summary,
-        "created_at": email_record.created_at.isoformat() + "Z",
-    }
+        "created_at": email_record.created_at,
+    })
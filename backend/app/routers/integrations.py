@@ -26,7 +26,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import and_, select
@@ -41,6 +41,12 @@ from app.services import jira_service as jira_module
 from app.services import slack_service as slack_module
 from app.services import zoom_service as zoom_module
 from app.services import google_calendar_service as gcal_module
+from app.services.gmail_service import (
+    fetch_emails,
+    get_active_gmail_integration,
+    invalidate_gmail_integration,
+    test_connection,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/integrations", tags=["Integrations"])
@@ -228,8 +234,6 @@ async def connect_gmail(
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     """Connect a Gmail account using an App Password for IMAP access."""
-    from app.services.gmail_service import test_connection
-
     email_addr = request.email.strip()
     app_password = request.app_password.strip()
 
@@ -271,29 +275,19 @@ async def connect_gmail(
         db.add(integration)
 
     await db.commit()
+    await invalidate_gmail_integration(current_user.id)
     logger.info("Gmail connected for user %s (%s)", current_user.id, email_addr)
     return {"message": "Gmail connected successfully!", "email": email_addr}
 
 
 @router.get("/gmail/emails", summary="Fetch recent emails from connected Gmail")
 async def get_gmail_emails(
-    limit: int = 20,
-    days: int = 7,
+    limit: int = Query(default=20, ge=1, le=50),
+    days: int = Query(default=7, ge=1, le=30),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
-    from app.services.gmail_service import fetch_emails
-
-    result = await db.execute(
-        select(Integration).where(
-            and_(
-                Integration.user_id == current_user.id,
-                Integration.platform == IntegrationPlatform.GMAIL,
-                Integration.is_active == True,
-            )
-        )
-    )
-    integration = result.scalar_one_or_none()
+    integration = await get_active_gmail_integration(db, current_user.id)
 
     if not integration:
         raise HTTPException(
@@ -308,8 +302,8 @@ async def get_gmail_emails(
         emails = fetch_emails(
             email_addr=email_addr,
             app_password=app_password,
-            limit=min(limit, 50),
-            since_days=min(days, 30),
+            limit=limit,
+            since_days=days,
         )
         integration.last_synced_at = datetime.utcnow()
         await db.commit()
@@ -1612,6 +1606,8 @@ async def disconnect_integration(
 
     await db.delete(integration)
     await db.commit()
+    if integration.platform == IntegrationPlatform.GMAIL:
+        await invalidate_gmail_integration(current_user.id)
     logger.info(
         "Integration %s (%s) disconnected for user %s",
         integration_id,
@@ -1790,6 +1786,7 @@ async def test_zoom_connection(
 )
 async def zoom_webhook(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> Dict[str, Any]:
     """Handle Zoom webhook events.
@@ -1835,7 +1832,7 @@ async def zoom_webhook(
     if event == "meeting.ended":
         await _handle_meeting_ended(obj, db)
     elif event == "recording.completed":
-        await _handle_recording_completed(obj, db)
+        await _handle_recording_completed(obj, db, background_tasks)
 
     return {"status": "ok"}
 
@@ -1968,7 +1965,9 @@ async def _handle_meeting_ended(obj: Dict[str, Any], db: AsyncSession) -> None:
             await slack_svc.aclose()
 
 
-async def _handle_recording_completed(obj: Dict[str, Any], db: AsyncSession) -> None:
+async def _handle_recording_completed(
+    obj: Dict[str, Any], db: AsyncSession, background_tasks: BackgroundTasks
+) -> None:
     """Download the cloud recording and enqueue the processing pipeline (Track A)."""
     import uuid
 
@@ -2104,9 +2103,9 @@ async def _handle_recording_completed(obj: Dict[str, Any], db: AsyncSession) ->
 
     # Enqueue background processing
     try:
-        from app.tasks.meeting_tasks import process_meeting_background
-        process_meeting_background.delay(meeting.id)
-        logger.info("Enqueued process_meeting_background for meeting %s", meeting.id)
+        from app.routers.meetings import enqueue_meeting_processing
+        enqueue_meeting_processing(meeting.id, background_tasks)
+        logger.info("Enqueued processing for meeting %s", meeting.id)
     except Exception as exc:
         logger.error("Failed to enqueue processing for meeting %s: %s", meeting.id, exc)
 
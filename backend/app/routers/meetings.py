@@ -2,20 +2,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, BackgroundTasks
 from fastapi.responses import PlainTextResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, insert, update, exists, and_, or_, func, tuple_
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime, timedelta
 import asyncio
+import hashlib
 import tempfile
 import os
 import logging
 
+from app.config import settings
 from app.database import get_db
-from app.models import Meeting, User, ActionItem, MeetingStatus, Integration, IntegrationPlatform
-from app.schemas.meeting import MeetingResponse, MeetingUploadResponse, MeetingUpdate, SpeakerNamesUpdate
+from app.models import Meeting, User, ActionItem, ActionItemStatus, MeetingStatus, Integration, IntegrationPlatform
+from app.schemas.meeting import MeetingResponse, MeetingListResponse, MeetingUploadResponse, MeetingUpdate, SpeakerNamesUpdate
 from app.dependencies import get_current_user, get_current_admin_user
-from app.utils.storage import get_storage
+from app.utils.audio import SNIFF_BYTES, is_uncompressed_audio, looks_like_audio, transcode_for_asr
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.storage import get_storage, extract_key
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +30,87 @@ ALLOWED_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.webm', '.mp4', '.mpeg', '.mpga'}
 # Groq Whisper API limit
 MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB (Groq Whisper API limit)
 
+# Pipelines allowed to run at once in this process; further uploads wait
+# their turn instead of each holding a recording and model working set
+_processing_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_MEETING_JOBS)
+
+
+def _upload_size(file: UploadFile) -> int:
+    """Size of an uploaded file without reading it into memory."""
+    if file.size is not None:
+        return file.size
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+
+def _check_audio_content(file: UploadFile) -> None:
+    """Reject uploads whose bytes aren't an allowed audio container (400)."""
+    header = file.file.read(SNIFF_BYTES)
+    file.file.seek(0)
+    if not looks_like_audio(header):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File content is not a supported audio format"
+        )
+
+
+def _hash_upload(file_obj) -> str:
+    """SHA-256 hex digest of a file object, read in 1MB chunks and rewound."""
+    digest = hashlib.sha256()
+    while chunk := file_obj.read(1024 * 1024):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+async def _find_processed_duplicate(
+    db: AsyncSession, team_id: str, content_hash: str
+) -> Optional[Meeting]:
+    """Latest completed meeting of the team with identical recording bytes."""
+    result = await db.execute(
+        select(Meeting)
+        .where(
+            Meeting.team_id == team_id,
+            Meeting.content_hash == content_hash,
+            Meeting.status == MeetingStatus.COMPLETED,
+        )
+        .options(selectinload(Meeting.action_items))
+        .order_by(Meeting.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def enqueue_meeting_processing(meeting_id: str, background_tasks: BackgroundTasks) -> None:
+    """
+    Queue the processing pipeline for a meeting.
+
+    With a Celery worker deployed the job goes to the "meetings" queue and the
+    API process stays free for requests. Without one (eager mode) it runs in
+    this process after the response, as before.
+    """
+    from app.celery_app import celery_app
+
+    if celery_app.conf.task_always_eager:
+        background_tasks.add_task(process_meeting_background, meeting_id)
+    else:
+        from app.tasks.meeting_tasks import process_meeting_task
+        process_meeting_task.delay(meeting_id)
+
 
 async def process_meeting_background(meeting_id: str):
     """
     Background task: transcribe → diarize → context-analyse → summarise.
-    Runs inside FastAPI's async event loop (no Celery needed).
+    Runs inside FastAPI's async event loop (no Celery needed), at most
+    MAX_CONCURRENT_MEETING_JOBS at a time.
     """
+    async with _processing_slots:
+        await _process_meeting(meeting_id)
+
+
+async def _process_meeting(meeting_id: str):
     import json as _json
     from app.services.ai_service import transcribe_meeting_with_segments
     from app.services.diarization_service import diarize_audio, format_diarized_transcript
@@ -57,28 +136,34 @@ async def process_meeting_background(meeting_id: str):
                 await db.commit()
                 return
 
-            # ── Download audio ────────────────────────────────────────
+            # ── Fetch (WAV: downmix to 16 kHz mono) ───────────────────
+            # For WAV, ffmpeg reads straight from storage (local path or
+            # presigned URL), so the original is decoded as it streams in and
+            # only the smaller 16 kHz file is written locally. Compressed
+            # formats would not shrink and are downloaded as they are.
             storage = get_storage()
-            recording_url = meeting.recording_url
-            if recording_url.startswith('local://'):
-                key = recording_url.replace('local://', '')
-            elif '.amazonaws.com/' in recording_url:
-                key = recording_url.split('.amazonaws.com/')[-1]
-            elif 'cloudinary.com' in recording_url:
-                key = recording_url.split('/upload/')[-1]
-            else:
-                key = recording_url.split('.com/')[-1] if '.com/' in recording_url else recording_url
+            key = extract_key(meeting.recording_url)
+            source, source_size = await storage.get_read_source(key)
 
-            file_ext = os.path.splitext(key)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-                tmp_file_path = tmp_file.name
-
-            logger.info(f"[Meeting {meeting_id}] Downloading to {tmp_file_path}")
-            await storage.download_file(key, tmp_file_path)
-
-            file_size_mb = os.path.getsize(tmp_file_path) / (1024 * 1024)
+            file_size_mb = source_size / (1024 * 1024)
             logger.info(f"[Meeting {meeting_id}] File size: {file_size_mb:.2f}MB")
 
+            tmp_file_path = None
+            if is_uncompressed_audio(key):
+                tmp_file_path = await transcode_for_asr(source, source_size)
+            if tmp_file_path:
+                logger.info(
+                    f"[Meeting {meeting_id}] Resampled to 16 kHz mono: "
+                    f"{os.path.getsize(tmp_file_path) / (1024 * 1024):.2f}MB"
+                )
+            else:
+                # Compressed upload, no ffmpeg, or the original is already the smaller file
+                file_ext = os.path.splitext(key)[1]
+                with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
+                    tmp_file_path = tmp_file.name
+                logger.info(f"[Meeting {meeting_id}] Downloading to {tmp_file_path}")
+                await storage.download_file(key, tmp_file_path)
+
             # ── Transcribe (Whisper) ──────────────────────────────────
             logger.info(f"[Meeting {meeting_id}] Transcribing…")
             transcript, whisper_segments = await transcribe_meeting_with_segments(tmp_file_path)
@@ -164,7 +249,7 @@ async def process_meeting_background(meeting_id: str):
 
             # ── Action items ──────────────────────────────────────────
             action_items_data = summary_data.get("action_items", [])
-            created_count = 0
+            action_item_rows = []
             for item_data in action_items_data:
                 confidence = item_data.get("confidence", 0.0)
                 if confidence >= 0.6:
@@ -179,19 +264,21 @@ async def process_meeting_background(meeting_id: str):
                             )
                         except Exception:
                             pass
-                    action_item = ActionItem(
-                        meeting_id=meeting_id,
-                        description=item_data.get("description", ""),
-                        assignee_mentioned=item_data.get("assigned_to_name") or item_data.get("assignee"),
-                        deadline_mentioned=parsed_deadline,
-                        confidence_score=confidence,
-                        status="pending",
-                        speaker_label=item_data.get("speaker_label"),
-                        assigned_by=item_data.get("assigned_by"),
-                        context_type=item_data.get("context_type"),
-                    )
-                    db.add(action_item)
-                    created_count += 1
+                    action_item_rows.append({
+                        "meeting_id": meeting_id,
+                        "description": item_data.get("description", ""),
+                        "assignee_mentioned": item_data.get("assigned_to_name") or item_data.get("assignee"),
+                        "deadline_mentioned": parsed_deadline,
+                        "confidence_score": confidence,
+                        "status": ActionItemStatus.PENDING,
+                        "speaker_label": item_data.get("speaker_label"),
+                        "assigned_by": item_data.get("assigned_by"),
+                        "context_type": item_data.get("context_type"),
+                    })
+            created_count = len(action_item_rows)
+            if action_item_rows:
+                # One multi-row INSERT; no ORM objects or per-row flush
+                await db.execute(insert(ActionItem), action_item_rows)
 
             meeting.status = MeetingStatus.COMPLETED
             await db.commit()
@@ -330,13 +417,11 @@ async def process_meeting_background(meeting_id: str):
     except Exception as e:
         logger.error(f"[Meeting {meeting_id}] Processing failed: {str(e)}", exc_info=True)
         try:
-            from app.database import AsyncSessionLocal as FailSessionLocal
-            async with FailSessionLocal() as db:
-                result = await db.execute(select(Meeting).where(Meeting.id == meeting_id))
-                meeting = result.scalar_one_or_none()
-                if meeting:
-                    meeting.status = MeetingStatus.FAILED
-                    await db.commit()
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Meeting).where(Meeting.id == meeting_id).values(status=MeetingStatus.FAILED)
+                )
+                await db.commit()
         except Exception as db_err:
             logger.error(f"[Meeting {meeting_id}] Failed to update status: {str(db_err)}")
 
@@ -376,11 +461,8 @@ async def upload_meeting(
             detail=f"Unsupported file format. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-
     # Validate file size
+    file_size = _upload_size(file)
     if file_size > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
@@ -393,27 +475,27 @@ async def upload_meeting(
             detail="File is empty"
         )
 
-    try:
-        # Upload to storage
-        storage = get_storage()
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
+    _check_audio_content(file)
 
-        # Upload to cloud storage
-        with open(tmp_file_path, 'rb') as f:
+    try:
+        content_hash = await asyncio.to_thread(_hash_upload, file.file)
+
+        # Same recording already processed for this team: share its stored
+        # object and reuse its results instead of uploading, transcribing and
+        # summarising it again
+        duplicate = await _find_processed_duplicate(db, current_user.team_id, content_hash)
+        if duplicate and duplicate.recording_url:
+            recording_url = duplicate.recording_url
+        else:
+            # Stream the spooled upload straight to storage
+            storage = get_storage()
             recording_url = await storage.upload_file(
-                f,
+                file.file,
                 file.filename,
                 folder="meetings",
                 content_type=file.content_type
             )
 
-        # Clean up temp file
-        os.unlink(tmp_file_path)
-
         # Create meeting record
         new_meeting = Meeting(
             title=title,
@@ -421,16 +503,50 @@ async def upload_meeting(
             status=MeetingStatus.PROCESSING,
             team_id=current_user.team_id,
             created_by_id=current_user.id,
-            duration_minutes=None  # Will be calculated from audio
+            duration_minutes=None,  # Will be calculated from audio
+            content_hash=content_hash,
         )
 
+        if duplicate:
+            new_meeting.status = MeetingStatus.COMPLETED
+            new_meeting.duration_minutes = duplicate.duration_minutes
+            new_meeting.transcript = duplicate.transcript
+            new_meeting.diarized_transcript = duplicate.diarized_transcript
+            new_meeting.speaker_names = duplicate.speaker_names
+            new_meeting.summary = duplicate.summary
+
         db.add(new_meeting)
+        await db.flush()
+        if duplicate and duplicate.action_items:
+            await db.execute(insert(ActionItem), [
+                {
+                    "meeting_id": new_meeting.id,
+                    "description": item.description,
+                    "assignee_mentioned": item.assignee_mentioned,
+                    "deadline_mentioned": item.deadline_mentioned,
+                    "confidence_score": item.confidence_score,
+                    "status": ActionItemStatus.PENDING,
+                    "speaker_label": item.speaker_label,
+                    "assigned_by": item.assigned_by,
+                    "context_type": item.context_type,
+                }
+                for item in duplicate.action_items
+            ])
         await db.commit()
         await db.refresh(new_meeting)
 
+        if duplicate:
+            logger.info(f"Meeting {new_meeting.id} reuses results of identical recording {duplicate.id}")
+            return {
+                "id": new_meeting.id,
+                "title": new_meeting.title,
+                "status": new_meeting.status.value,
+                "message": "Identical recording already processed — results copied"
+            }
+
         # Trigger transcription in background using OpenAI Whisper API
         logger.info(f"Scheduling transcription for meeting {new_meeting.id}")
-        background_tasks.add_task(process_meeting_background, new_meeting.id)
+        enqueue_meeting_processing(new_meeting.id, background_tasks)
 
         return {
             "id": new_meeting.id,
@@ -440,10 +556,6 @@ async def upload_meeting(
         }
 
     except Exception as e:
-        # Clean up temp file if it exists
-        if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
-
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Upload failed: {str(e)}"
@@ -491,29 +603,25 @@ async def upload_recording_to_meeting(
             detail=f"Unsupported file format. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
         )
 
-    content = await file.read()
-    if len(content) == 0:
+    file_size = _upload_size(file)
+    if file_size == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File is empty")
-    if len(content) > MAX_FILE_SIZE:
+    if file_size > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum: {MAX_FILE_SIZE // (1024 * 1024)}MB",
         )
 
+    _check_audio_content(file)
+
     try:
         storage = get_storage()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        with open(tmp_path, "rb") as f:
-            recording_url = await storage.upload_file(
-                f,
-                file.filename or f"recording{file_ext}",
-                folder="meetings",
-                content_type=file.content_type,
-            )
-        os.unlink(tmp_path)
+        recording_url = await storage.upload_file(
+            file.file,
+            file.filename or f"recording{file_ext}",
+            folder="meetings",
+            content_type=file.content_type,
+        )
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -528,7 +636,7 @@ async def upload_recording_to_meeting(
     await db.commit()
 
     logger.info("Recording attached to meeting %s — queuing pipeline", meeting_id)
-    background_tasks.add_task(process_meeting_background, meeting_id)
+    enqueue_meeting_processing(meeting_id, background_tasks)
 
     return {
         "id": meeting.id,
@@ -538,13 +646,13 @@ async def upload_recording_to_meeting(
     }
 
 
-@router.get("", response_model=List[MeetingResponse])
+@router.get("", response_model=MeetingListResponse)
 async def get_meetings(
     status: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
-    limit: int = Query(default=20, le=100),
-    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -556,7 +664,7 @@ async def get_meetings(
     - **date_from**: Filter meetings created after this date
     - **date_to**: Filter meetings created before this date
     - **limit**: Maximum number of results (default 20, max 100)
-    - **offset**: Number of results to skip for pagination
+    - **cursor**: `next_cursor` from the previous page
     """
     # Build query - only show meetings from user's team
     query = select(Meeting).where(Meeting.team_id == current_user.team_id)
@@ -571,11 +679,18 @@ async def get_meetings(
     if date_to:
         query = query.where(Meeting.created_at <= date_to)
 
-    # Order by created_at descending
-    query = query.order_by(Meeting.created_at.desc())
+    if cursor:
+        # Resume strictly after the cursor row; the scan starts there on
+        # idx_meeting_team_created_desc instead of skipping earlier pages
+        cursor_created, cursor_id = decode_cursor(cursor)
+        if cursor_created is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            tuple_(Meeting.created_at, Meeting.id) < tuple_(cursor_created, cursor_id)
+        )
 
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
+    # Newest first; id breaks ties so every row has a unique position
+    query = query.order_by(Meeting.created_at.desc(), Meeting.id.desc()).limit(limit)
 
     # Load relationships
     query = query.options(selectinload(Meeting.action_items))
@@ -584,7 +699,10 @@ async def get_meetings(
     result = await db.execute(query)
     meetings = result.scalars().all()
 
-    return meetings
+    next_cursor = (
+        encode_cursor(meetings[-1].created_at, meetings[-1].id) if len(meetings) == limit else None
+    )
+    return {"meetings": meetings, "next_cursor": next_cursor}
 
 
 @router.get("/{meeting_id}", response_model=MeetingResponse)
@@ -621,6 +739,35 @@ async def get_meeting(
     return meeting
 
 
+@router.get("/{meeting_id}/status")
+async def get_meeting_status(
+    meeting_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Processing status of a meeting, for polling while it is in flight.
+
+    Reads two columns instead of the full row and its action items; fetch
+    GET /{meeting_id} once the status changes.
+    """
+    result = await db.execute(
+        select(Meeting.status, Meeting.duration_minutes).where(
+            Meeting.id == meeting_id,
+            Meeting.team_id == current_user.team_id,
+        )
+    )
+    row = result.one_or_none()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+
+    return {"id": meeting_id, "status": row.status.value, "duration_minutes": row.duration_minutes}
+
+
 @router.patch("/{meeting_id}", response_model=MeetingResponse)
 async def update_meeting(
     meeting_id: str,
@@ -633,14 +780,14 @@ async def update_meeting(
 
     Transcript and summary cannot be manually edited.
     """
-    # Get existing meeting
+    # Get existing meeting, with the action items the response needs
     result = await db.execute(
         select(Meeting).where(
             and_(
                 Meeting.id == meeting_id,
                 Meeting.team_id == current_user.team_id
             )
-        )
+        ).options(selectinload(Meeting.action_items))
     )
     meeting = result.scalar_one_or_none()
 
@@ -659,8 +806,9 @@ async def update_meeting(
     for field, value in update_data.items():
         setattr(meeting, field, value)
 
+    # Sessions don't expire on commit and updated_at is set client-side,
+    # so the instance is already current; no refresh needed
     await db.commit()
-    await db.refresh(meeting)
 
     # Sync to Google Calendar if meeting time/title changed, or if scheduled_at was
     # just set for the first time (creates the initial calendar event with Meet link)
@@ -684,9 +832,6 @@ async def update_meeting(
         except Exception as exc:
             logger.error("update_meeting: GCal sync failed for meeting %s: %s", meeting_id, exc)
 
-    # Load relationships
-    await db.refresh(meeting, ["action_items"])
-
     return meeting
 
 
@@ -816,26 +961,19 @@ async def delete_meeting(
         except Exception as exc:
             logger.warning("delete_meeting: GCal event deletion failed: %s", exc)
 
-    # Delete recording from storage
+    # Delete recording from storage, unless a duplicate upload shares it
+    shared = False
     if meeting.recording_url:
+        shared = await db.scalar(
+            select(exists().where(
+                Meeting.recording_url == meeting.recording_url,
+                Meeting.id != meeting.id,
+            ))
+        )
+    if meeting.recording_url and not shared:
         try:
             storage = get_storage()
-            # Extract key from URL based on storage type
-            recording_url = meeting.recording_url
-            if recording_url.startswith('local://'):
-                # Local storage format: local://meetings/filename.mp3
-                key = recording_url.replace('local://', '')
-            elif '.amazonaws.com/' in recording_url:
-                # S3 format: https://bucket.s3.region.amazonaws.com/meetings/filename.mp3
-                key = recording_url.split('.amazonaws.com/')[-1]
-            elif 'cloudinary.com' in recording_url:
-                # Cloudinary format
-                key = recording_url.split('/upload/')[-1]
-            else:
-                # Fallback
-                key = recording_url.split('.com/')[-1] if '.com/' in recording_url else recording_url
-
-            await storage.delete_file(key)
+            await storage.delete_file(extract_key(meeting.recording_url))
         except Exception as e:
             print(f"Failed to delete recording: {str(e)}")
             # Continue with database deletion even if file deletion fails
@@ -895,11 +1033,39 @@ async def retry_meeting_transcription(
 
     # Re-queue background task
     logger.info(f"Retrying transcription for meeting {meeting.id}")
-    background_tasks.add_task(process_meeting_background, meeting.id)
+    enqueue_meeting_processing(meeting.id, background_tasks)
 
     return {"id": meeting.id, "status": "processing", "message": "Transcription retry started"}
 
 
+async def _get_team_action_item(
+    db: AsyncSession, meeting_id: str, action_item_id: str, team_id: str
+) -> ActionItem:
+    """
+    Fetch an action item of a meeting owned by the team, or 404.
+
+    Meeting and team scoping are part of the WHERE clause, so an item from
+    another meeting or team is indistinguishable from a missing one.
+    """
+    result = await db.execute(
+        select(ActionItem)
+        .join(Meeting, ActionItem.meeting_id == Meeting.id)
+        .where(
+            ActionItem.id == action_item_id,
+            ActionItem.meeting_id == meeting_id,
+            Meeting.team_id == team_id,
+        )
+    )
+    action_item = result.scalar_one_or_none()
+
+    if not action_item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Action item not found"
+        )
+    return action_item
+
+
 @router.post("/{meeting_id}/action-items/{action_item_id}/convert", status_code=status.HTTP_201_CREATED)
 async def convert_action_item_to_task(
     meeting_id: str,
@@ -914,23 +1080,7 @@ async def convert_action_item_to_task(
     """
     from app.models import Task, TaskStatus, TaskPriority, TaskSourceType
 
-    # Get action item
-    result = await db.execute(
-        select(ActionItem).where(ActionItem.id == action_item_id)
-    )
-    action_item = result.scalar_one_or_none()
-
-    if not action_item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Action item not found"
-        )
-
-    if action_item.meeting_id != meeting_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Action item does not belong to this meeting"
-        )
+    action_item = await _get_team_action_item(db, meeting_id, action_item_id, current_user.team_id)
 
     if action_item.status.value == "converted":
         raise HTTPException(
@@ -953,21 +1103,29 @@ async def convert_action_item_to_task(
 
     # Try to assign to mentioned person
     if action_item.assignee_mentioned:
-        # Look up user by name or email
-        result = await db.execute(
-            select(User).where(
-                and_(
-                    User.team_id == current_user.team_id,
+        # Look up a team member by name or email: exact (case-insensitive)
+        # match first, substring only when nothing matches exactly
+        mentioned = action_item.assignee_mentioned.strip()
+        team_users = select(User.id).where(User.team_id == current_user.team_id).limit(1)
+        assignee_id = await db.scalar(
+            team_users.where(
+                or_(
+                    func.lower(User.full_name) == mentioned.lower(),
+                    func.lower(User.email) == mentioned.lower(),
+                )
+            )
+        )
+        if assignee_id is None:
+            assignee_id = await db.scalar(
+                team_users.where(
                     or_(
-                        User.full_name.ilike(f"%{action_item.assignee_mentioned}%"),
-                        User.email.ilike(f"%{action_item.assignee_mentioned}%")
+                        User.full_name.ilike(f"%{mentioned}%"),
+                        User.email.ilike(f"%{mentioned}%")
                     )
                 )
             )
-        )
-        assignee = result.scalar_one_or_none()
-        if assignee:
-            new_task.assignee_id = assignee.id
+        if assignee_id:
+            new_task.assignee_id = assignee_id
 
     db.add(new_task)
     await db.commit()
@@ -1034,23 +1192,7 @@ async def reject_action_item(
     """
     Reject an action item (mark as not relevant).
     """
-    # Get action item
-    result = await db.execute(
-        select(ActionItem).where(ActionItem.id == action_item_id)
-    )
-    action_item = result.scalar_one_or_none()
-
-    if not action_item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Action item not found"
-        )
-
-    if action_item.meeting_id != meeting_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Action item does not belong to this meeting"
-        )
+    action_item = await _get_team_action_item(db, meeting_id, action_item_id, current_user.team_id)
 
     # Update status
     action_item.status = "rejected"
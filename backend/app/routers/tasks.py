@@ -1,10 +1,10 @@
 """Task management endpoints - CRUD operations and statistics"""
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, delete, func, and_, or_, exists
+from sqlalchemy.orm import selectinload, joinedload, load_only
 from typing import List, Optional
 from datetime import datetime
 
@@ -13,64 +13,46 @@ from app.models import Task, User, TaskStatus, Integration, IntegrationPlatform
 from app.models.user import UserRole
 from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskStats
 from app.dependencies import get_current_user
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.cache import cache_get_json, cache_set_json, cache_delete
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 MANAGEMENT_ROLES = {UserRole.ADMIN}
 
+# Create/update/delete here drop the affected entries; the TTL bounds
+# staleness from other writers (integration syncs) and the overdue count,
+# which changes with the clock
+TASK_STATS_CACHE_TTL = 30  # seconds
 
-def _task_to_dict(task: Task) -> dict:
-    return {
-        "id": task.id,
-        "title": task.title,
-        "description": task.description,
-        "status": task.status.value,
-        "priority": task.priority.value,
-        "due_date": task.due_date,
-        "estimated_hours": task.estimated_hours,
-        "assignee_id": task.assignee_id,
-        "created_by_id": task.created_by_id,
-        "team_id": task.team_id,
-        "source_type": task.source_type.value,
-        "source_id": task.source_id,
-        "external_id": task.external_id,
-        "calendar_event_id": task.calendar_event_id,
-        "calendar_synced_at": task.calendar_synced_at,
-        "is_meeting_task": task.is_meeting_task,
-        "google_meet_link": task.google_meet_link,
-        "meeting_scheduled_at": task.meeting_scheduled_at,
-        "meeting_duration_minutes": task.meeting_duration_minutes,
-        "created_at": task.created_at,
-        "updated_at": task.updated_at,
-        "assignee": {
-            "id": task.assignee.id,
-            "full_name": task.assignee.full_name,
-            "email": task.assignee.email,
-            "avatar_url": task.assignee.avatar_url,
-        } if task.assignee else None,
-        "creator": {
-            "id": task.creator.id,
-            "full_name": task.creator.full_name,
-            "email": task.creator.email,
-        } if task.creator else None,
-    }
+
+def _stats_cache_key(team_id: str, assignee_id: Optional[str]) -> str:
+    return f"task-stats:{team_id}:{assignee_id or 'team'}"
+
+
+async def _invalidate_task_stats(team_id: str, *assignee_ids: Optional[str]) -> None:
+    """Drop the team-wide stats and those of every assignee a change touched."""
+    await cache_delete(_stats_cache_key(team_id, None))
+    for assignee_id in {a for a in assignee_ids if a}:
+        await cache_delete(_stats_cache_key(team_id, assignee_id))
 
 
 @router.get("", response_model=List[TaskResponse])
 async def get_tasks(
+    response: Response,
     status: Optional[str] = None,
     priority: Optional[str] = None,
     assignee_id: Optional[str] = None,
     due_before: Optional[datetime] = None,
     due_after: Optional[datetime] = None,
-    limit: int = Query(default=20, le=200),
-    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=200),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    Get tasks with optional filters.
+    Get tasks with optional filters, newest first.
 
     Query parameters:
     - **status**: Filter by status (todo, in_progress, done, blocked)
@@ -79,7 +61,8 @@ async def get_tasks(
     - **due_before**: Filter tasks due before this datetime
     - **due_after**: Filter tasks due after this datetime
     - **limit**: Maximum number of results (default 20, max 100)
-    - **offset**: Number of results to skip for pagination
+    - **cursor**: Value of the previous page's `X-Next-Cursor` response header;
+      the header is only set when another page may follow
     """
     is_manager = current_user.role in MANAGEMENT_ROLES
 
@@ -108,23 +91,44 @@ async def get_tasks(
     if due_after:
         query = query.where(Task.due_date >= due_after)
 
-    # Order by created_at descending
-    query = query.order_by(Task.created_at.desc())
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    # Load relationships
+    if cursor:
+        # Resume strictly after the cursor row instead of skipping rows
+        cursor_created, cursor_id = decode_cursor(cursor)
+        if cursor_created is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(or_(
+            Task.created_at < cursor_created,
+            and_(Task.created_at == cursor_created, Task.id < cursor_id),
+        ))
+
+    # Newest first; id breaks ties so every row has a unique position
+    query = query.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+
+    # Fetch only the columns TaskResponse renders (skips the jira_* sync
+    # bookkeeping and the users' password and reset-token columns)
     query = query.options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator)
+        load_only(
+            Task.id, Task.title, Task.description, Task.status, Task.priority,
+            Task.due_date, Task.estimated_hours, Task.assignee_id, Task.created_by_id,
+            Task.team_id, Task.source_type, Task.source_id, Task.external_id,
+            Task.calendar_event_id, Task.calendar_synced_at, Task.is_meeting_task,
+            Task.google_meet_link, Task.meeting_scheduled_at, Task.meeting_duration_minutes,
+            Task.created_at, Task.updated_at,
+        ),
+        # Many-to-one: LEFT JOIN users twice (aliased) in the same query
+        # instead of a follow-up SELECT ... IN per relationship
+        joinedload(Task.assignee).load_only(User.id, User.full_name, User.email, User.avatar_url),
+        joinedload(Task.creator).load_only(User.id, User.full_name, User.email),
     )
 
     # Execute query
     result = await db.execute(query)
     tasks = result.scalars().all()
 
-    return [_task_to_dict(t) for t in tasks]
+    if len(tasks) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(tasks[-1].created_at, tasks[-1].id)
+
+    return tasks
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -195,6 +199,7 @@ async def create_task(
     db.add(new_task)
     await db.commit()
     await db.refresh(new_task)
+    await _invalidate_task_stats(current_user.team_id, new_task.assignee_id)
 
     # Notify assignee if task is assigned to someone other than the creator
     if new_task.assignee_id and new_task.assignee_id != current_user.id:
@@ -303,7 +308,7 @@ async def create_task(
     )
     new_task = result.scalar_one()
 
-    return _task_to_dict(new_task)
+    return new_task
 
 
 @router.get("/stats", response_model=TaskStats)
@@ -319,33 +324,33 @@ async def get_task_stats(
     - Others: always scoped to their own tasks only.
     """
     is_manager = current_user.role in MANAGEMENT_ROLES
-    base_filter = [Task.team_id == current_user.team_id]
-
     if not is_manager:
-        base_filter.append(Task.assignee_id == current_user.id)
-    elif assignee_id:
+        assignee_id = current_user.id
+
+    cache_key = _stats_cache_key(current_user.team_id, assignee_id)
+    cached = await cache_get_json(cache_key)
+    if cached is not None:
+        return cached
+
+    base_filter = [Task.team_id == current_user.team_id]
+    if assignee_id:
         base_filter.append(Task.assignee_id == assignee_id)
 
-    # Count tasks by status
+    # Count tasks by status, with each group's overdue count, in one pass
     result = await db.execute(
         select(
             Task.status,
-            func.count(Task.id).label("count")
+            func.count(Task.id).label("count"),
+            func.count(Task.id).filter(
+                and_(Task.due_date < datetime.utcnow(), Task.status != TaskStatus.DONE)
+            ).label("overdue"),
         ).where(and_(*base_filter)).group_by(Task.status)
     )
-    status_counts = {row[0].value: row[1] for row in result}
-
-    # Count overdue tasks
-    result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                *base_filter,
-                Task.due_date < datetime.utcnow(),
-                Task.status != TaskStatus.DONE
-            )
-        )
-    )
-    overdue_count = result.scalar() or 0
+    status_counts = {}
+    overdue_count = 0
+    for task_status, count, overdue in result:
+        status_counts[task_status.value] = count
+        overdue_count += overdue
 
     total = sum(status_counts.values())
     todo = status_counts.get("todo", 0)
@@ -354,7 +359,7 @@ async def get_task_stats(
     blocked = status_counts.get("blocked", 0)
     completion_rate = (done / total * 100) if total > 0 else 0.0
 
-    return {
+    stats = {
         "total": total,
         "todo": todo,
         "in_progress": in_progress,
@@ -363,6 +368,8 @@ async def get_task_stats(
         "overdue": overdue_count,
         "completion_rate": round(completion_rate, 2)
     }
+    await cache_set_json(cache_key, stats, TASK_STATS_CACHE_TTL)
+    return stats
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -384,8 +391,8 @@ async def get_task(
 
     result = await db.execute(
         select(Task).where(and_(*conditions)).options(
-            selectinload(Task.assignee),
-            selectinload(Task.creator)
+            joinedload(Task.assignee),
+            joinedload(Task.creator)
         )
     )
     task = result.scalar_one_or_none()
@@ -396,7 +403,7 @@ async def get_task(
             detail="Task not found"
         )
 
-    return _task_to_dict(task)
+    return task
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
@@ -420,14 +427,23 @@ async def update_task(
     if not is_manager:
         conditions.append(Task.assignee_id == current_user.id)
 
-    result = await db.execute(select(Task).where(and_(*conditions)))
-    task = result.scalar_one_or_none()
+    # Check the new assignee's team membership in the same round-trip
+    query = select(Task).where(and_(*conditions))
+    if task_update.assignee_id is not None:
+        query = query.add_columns(
+            exists().where(and_(
+                User.id == task_update.assignee_id,
+                User.team_id == current_user.team_id
+            ))
+        )
+    row = (await db.execute(query)).first()
 
-    if not task:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    task = row[0]
 
     # Non-managers cannot reassign tasks
     if not is_manager and task_update.model_dump(exclude_unset=True).get("assignee_id") is not None:
@@ -437,21 +453,11 @@ async def update_task(
         )
 
     # Validate assignee if being updated
-    if task_update.assignee_id is not None:
-        result = await db.execute(
-            select(User).where(
-                and_(
-                    User.id == task_update.assignee_id,
-                    User.team_id == current_user.team_id
-                )
-            )
+    if task_update.assignee_id is not None and not row[1]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignee not found or not in your team"
         )
-        assignee = result.scalar_one_or_none()
-        if not assignee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Assignee not found or not in your team"
-            )
 
     # Update fields
     update_data = task_update.model_dump(exclude_unset=True)
@@ -462,6 +468,7 @@ async def update_task(
 
     await db.commit()
     await db.refresh(task)
+    await _invalidate_task_stats(current_user.team_id, old_assignee_id, task.assignee_id)
 
     # Notify new assignee when task is reassigned to someone other than the updater
     if "assignee_id" in update_data and task.assignee_id and task.assignee_id != old_assignee_id and task.assignee_id != current_user.id:
@@ -587,11 +594,17 @@ async def update_task(
         from app.config import settings as _s
         from app.services.google_calendar_service import GoogleCalendarService
 
-        # Resolve assignee email for Calendar invites
+        # Resolve assignee email (Calendar invites) and name (event text) here:
+        # task.assignee isn't loaded, and a lazy load fails under AsyncSession
         _assignee_email: Optional[str] = None
+        _assignee_name: Optional[str] = None
         if task.assignee_id:
-            _ae_result = await db.execute(select(User.email).where(User.id == task.assignee_id))
-            _assignee_email = _ae_result.scalar_one_or_none()
+            _ae_result = await db.execute(
+                select(User.email, User.full_name).where(User.id == task.assignee_id)
+            )
+            _ae_row = _ae_result.first()
+            if _ae_row:
+                _assignee_email, _assignee_name = _ae_row
         _attendees = [_assignee_email] if _assignee_email else []
 
         gcal_q = await db.execute(
@@ -649,7 +662,7 @@ async def update_task(
                         logger.info("update_task: generated Meet link %s for task %s", meet_link, task.id)
                 elif task.due_date and not task.is_meeting_task:
                     # Regular calendar sync (no Meet link)
-                    assignee_name = task.assignee.full_name if task.assignee else "Unassigned"
+                    assignee_name = _assignee_name or "Unassigned"
                     event_body = GoogleCalendarService.task_to_event(task, assignee_name, _s.FRONTEND_URL, user_timezone=user_tz)
                     if task.calendar_event_id:
                         await svc.update_event("primary", task.calendar_event_id, event_body)
@@ -678,7 +691,7 @@ async def update_task(
     )
     task = result.scalar_one()
 
-    return _task_to_dict(task)
+    return task
 
 
 @router.post("/{task_id}/generate-meet-link", response_model=TaskResponse)
@@ -738,7 +751,7 @@ async def generate_meet_link(
         )
     )
     task = result.scalar_one()
-    return _task_to_dict(task)
+    return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -756,24 +769,30 @@ async def delete_task(
             detail="Only managers can delete tasks"
         )
 
+    # Single DELETE ... RETURNING: no load into the session, and comments go
+    # through the FK's ON DELETE CASCADE instead of being loaded and deleted
+    # one by one by the ORM cascade
     result = await db.execute(
-        select(Task).where(
+        delete(Task).where(
             and_(
                 Task.id == task_id,
                 Task.team_id == current_user.team_id
             )
-        )
+        ).returning(Task.assignee_id, Task.calendar_event_id)
     )
-    task = result.scalar_one_or_none()
+    deleted = result.first()
 
-    if not task:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
+    assignee_id, calendar_event_id = deleted
+    await db.commit()
+    await _invalidate_task_stats(current_user.team_id, assignee_id)
 
     # Delete associated Google Calendar event if one exists
-    if task.calendar_event_id:
+    if calendar_event_id:
         try:
             gcal_q = await db.execute(
                 select(Integration).where(
@@ -787,13 +806,10 @@ async def delete_task(
                 from app.services.google_calendar_service import GoogleCalendarService
                 svc = GoogleCalendarService.from_integration(gcal_int)
                 try:
-                    await svc.delete_event("primary", task.calendar_event_id)
+                    await svc.delete_event("primary", calendar_event_id)
                 finally:
                     await svc.aclose()
         except Exception as exc:
             logger.warning("delete_task: GCal event deletion failed: %s", exc)
 
-    await db.delete(task)
-    await db.commit()
-
     return None
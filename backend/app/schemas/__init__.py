@@ -6,9 +6,10 @@ from app.schemas.user import (
 from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskStats
 from app.schemas.meeting import (
     MeetingCreate, MeetingUpdate, MeetingResponse,
-    MeetingUploadResponse, ActionItemResponse,
+    MeetingListResponse, MeetingUploadResponse, ActionItemResponse,
 )
 from app.schemas.integration import IntegrationResponse, IntegrationSyncResponse
+from app.schemas.email import EmailListItem, EmailListResponse
 from app.schemas.chat import ChatQuerySchema, ChatResponseSchema
 from app.schemas.analytics import (
     WorkloadAnalytics, TeamWorkloadResponse, MeetingInsights,
@@ -20,8 +21,9 @@ __all__ = [
     "Token", "TokenRefresh", "TokenPayload",
     "TaskCreate", "TaskUpdate", "TaskResponse", "TaskStats",
     "MeetingCreate", "MeetingUpdate", "MeetingResponse",
-    "MeetingUploadResponse", "ActionItemResponse",
+    "MeetingListResponse", "MeetingUploadResponse", "ActionItemResponse",
     "IntegrationResponse", "IntegrationSyncResponse",
+    "EmailListItem", "EmailListResponse",
     "ChatQuerySchema", "ChatResponseSchema",
     "WorkloadAnalytics", "TeamWorkloadResponse", "MeetingInsights",
     "ProductivityTrendResponse",
@@ -0,0 +1,31 @@
+"""Pydantic schemas for Email model"""
+from pydantic import BaseModel, field_serializer
+from datetime import datetime
+from typing import Optional, List
+
+
+class EmailListItem(BaseModel):
+    """Schema for an email in the inbox list (no body)"""
+    id: str
+    subject: Optional[str] = None
+    sender: Optional[str] = None
+    body_preview: Optional[str] = None
+    received_at: Optional[datetime] = None
+    is_read: Optional[bool] = None
+    is_flagged: Optional[bool] = None
+    ai_classification: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
+    @field_serializer('received_at')
+    def serialize_datetime(self, dt: Optional[datetime], _info):
+        """Serialize datetime to ISO format with UTC timezone"""
+        if dt is None:
+            return None
+        return dt.isoformat() + 'Z'
+
+
+class EmailListResponse(BaseModel):
+    """Schema for a page of the inbox list"""
+    emails: List[EmailListItem]
+    next_cursor: Optional[str] = None
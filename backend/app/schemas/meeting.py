@@ -88,6 +88,12 @@ class MeetingResponse(MeetingBase):
         return dt.isoformat() + 'Z' if not dt.isoformat().endswith('Z') else dt.isoformat()
 
 
+class MeetingListResponse(BaseModel):
+    """Schema for a page of the meetings list"""
+    meetings: List[MeetingResponse]
+    next_cursor: Optional[str] = None
+
+
 class MeetingUploadResponse(BaseModel):
     """Schema for meeting upload response"""
     id: str
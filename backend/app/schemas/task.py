@@ -1,6 +1,7 @@
 """Pydantic schemas for Task model"""
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime, timezone
+from enum import Enum
 from typing import Optional
 
 
@@ -123,6 +124,12 @@ class TaskResponse(TaskBase):
 
     model_config = {"from_attributes": True}
 
+    @field_validator("status", "priority", "source_type", mode="before")
+    @classmethod
+    def enum_value(cls, v):
+        """ORM rows carry TaskStatus/TaskPriority/TaskSourceType members."""
+        return v.value if isinstance(v, Enum) else v
+
 
 class TaskStats(BaseModel):
     """Schema for task statistics"""
@@ -11,10 +11,19 @@ from datetime import datetime, timedelta
 import logging
 import re
 
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.config import settings
+from app.models import Integration, IntegrationPlatform
+from app.utils.cache import cache_get_json, cache_set_json, cache_delete
 
 logger = logging.getLogger(__name__)
 
+# Only the integration id is cached, never the app password: a hit turns the
+# (user_id, platform) scan into a primary-key lookup
+GMAIL_INTEGRATION_CACHE_TTL = 300  # seconds
+
 
 def _decode_header_value(value: str) -> str:
     """Decode an email header value."""
@@ -250,3 +259,52 @@ def delete_email_from_gmail(email_addr: str, app_password: str, gmail_message_id
     except Exception as e:
         logger.error(f"Failed to delete email from Gmail: {e}")
         return False
+
+
+def _integration_cache_key(user_id: str) -> str:
+    return f"gmail-integration:{user_id}"
+
+
+async def get_active_gmail_integration(db: AsyncSession, user_id: str) -> Optional[Integration]:
+    """
+    Get the user's active Gmail integration, if any.
+
+    Args:
+        db: Database session
+        user_id: Owner of the integration
+
+    Returns:
+        The Integration row, or None if Gmail is not connected
+    """
+    cache_key = _integration_cache_key(user_id)
+    integration_id = await cache_get_json(cache_key)
+    if integration_id:
+        integration = await db.get(Integration, integration_id)
+        if (
+            integration
+            and integration.user_id == user_id
+            and integration.platform == IntegrationPlatform.GMAIL
+            and integration.is_active
+        ):
+            return integration
+
+    result = await db.execute(
+        select(Integration).where(
+            and_(
+                Integration.user_id == user_id,
+                Integration.platform == IntegrationPlatform.GMAIL,
+                Integration.is_active == True,
+            )
+        ).limit(1)
+    )
+    integration = result.scalar_one_or_none()
+    if integration:
+        await cache_set_json(cache_key, integration.id, GMAIL_INTEGRATION_CACHE_TTL)
+    elif integration_id:
+        await cache_delete(cache_key)
+    return integration
+
+
+async def invalidate_gmail_integration(user_id: str) -> None:
+    """Forget the cached Gmail integration id after connect/disconnect."""
+    await cache_delete(_integration_cache_key(user_id))
@@ -15,6 +15,7 @@ import httpx
 
 
 from app.config import settings
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -90,19 +91,18 @@ class GoogleCalendarService:
     @classmethod
     async def exchange_code(cls, code: str) -> Dict[str, Any]:
         """Exchange authorization code for access + refresh tokens."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                _GOOGLE_TOKEN_URL,
-                data={
-                    "code": code,
-                    "client_id": settings.GOOGLE_CLIENT_ID,
-                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    "redirect_uri": settings.GOOGLE_CALENDAR_REDIRECT_URI,
-                    "grant_type": "authorization_code",
-                },
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await get_http_client().post(
+            _GOOGLE_TOKEN_URL,
+            data={
+                "code": code,
+                "client_id": settings.GOOGLE_CLIENT_ID,
+                "client_secret": settings.GOOGLE_CLIENT_SECRET,
+                "redirect_uri": settings.GOOGLE_CALENDAR_REDIRECT_URI,
+                "grant_type": "authorization_code",
+            },
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     # ── Token refresh ────────────────────────────────────────────────────────
 
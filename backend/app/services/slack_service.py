@@ -25,6 +25,7 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.config import settings
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -200,17 +201,17 @@ class SlackService:
         Raises:
             ValueError: If Slack returns ``ok: false``.
         """
-        # Use a fresh client — no Authorization header needed for token exchange
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(
-                f"{_SLACK_API_BASE}oauth.v2.access",
-                data={
-                    "client_id": settings.SLACK_CLIENT_ID,
-                    "client_secret": settings.SLACK_CLIENT_SECRET,
-                    "code": code,
-                    "redirect_uri": settings.SLACK_REDIRECT_URI,
-                },
-            )
+        # Shared client rather than self._client — no Authorization header
+        # needed for token exchange
+        resp = await get_http_client().post(
+            f"{_SLACK_API_BASE}oauth.v2.access",
+            data={
+                "client_id": settings.SLACK_CLIENT_ID,
+                "client_secret": settings.SLACK_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": settings.SLACK_REDIRECT_URI,
+            },
+        )
         resp.raise_for_status()
         data: Dict[str, Any] = resp.json()
         if not data.get("ok"):
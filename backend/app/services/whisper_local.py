@@ -1,20 +1,73 @@
 """
 Free local Whisper transcription service.
-Uses OpenAI's open-source Whisper model running locally - no API key required!
+Uses OpenAI's open-source Whisper model running locally via faster-whisper
+(CTranslate2) - no API key required!
 """
 import os
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
-# Try to import whisper - gracefully handle if not installed
+# Try to import faster-whisper - gracefully handle if not installed.
+# CTranslate2 runs the same Whisper weights with fused, int8-quantized kernels:
+# roughly 4x faster on CPU than openai-whisper at about half the memory.
 try:
-    import whisper
+    from faster_whisper import WhisperModel
+    import ctranslate2
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
-    logger.warning("openai-whisper not installed. Install with: pip install openai-whisper")
+    logger.warning("faster-whisper not installed. Install with: pip install faster-whisper")
+
+# Batched GPU inference (faster-whisper >= 1.1)
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+# Chunks decoded together per GPU forward pass; fits a 16GB card with large-v3
+GPU_BATCH_SIZE = 16
+
+# English-only checkpoints (CTranslate2 builds ship with faster-whisper),
+# used when language is "en". The distilled ones are several times faster
+# than the multilingual model they replace at about the same English WER;
+# "base" has no smaller distilled model (distil-small.en is ~166M parameters
+# against base's ~74M), so it keeps its size and only drops to base.en.
+_ENGLISH_DISTIL_MODELS = {
+    "base": "base.en",
+    "small": "distil-small.en",
+    "medium": "distil-medium.en",
+    "large-v3": "distil-large-v3",
+}
+
+# Loaded models by size; loading takes seconds, so keep them for the process.
+# Each entry stays resident until the process exits: roughly 75MB for int8
+# "base" up to ~1.5GB for "large-v3", per process (so per Celery child too).
+_models: Dict[str, "WhisperModel"] = {}
+_models_lock = threading.Lock()
+
+
+def _cuda_available() -> bool:
+    return WHISPER_AVAILABLE and ctranslate2.get_cuda_device_count() > 0
+
+
+def _get_model(model_size: str) -> "WhisperModel":
+    """Load a Whisper model once per process (downloads on first use)."""
+    model = _models.get(model_size)
+    if model is None:
+        with _models_lock:
+            model = _models.get(model_size)
+            if model is None:
+                logger.info(f"Loading Whisper model: {model_size}")
+                model = WhisperModel(
+                    model_size,
+                    device="auto",
+                    compute_type="int8_float16" if _cuda_available() else "int8",
+                )
+                _models[model_size] = model
+    return model
 
 
 def transcribe_audio_local(
@@ -23,18 +76,21 @@ def transcribe_audio_local(
     language: str = "en"
 ) -> dict:
     """
-    Transcribe audio using FREE local Whisper model.
+    Transcribe audio using FREE local Whisper model (faster-whisper).
 
     Model sizes (from fastest to most accurate):
-    - tiny: Fastest, least accurate (~1GB VRAM)
-    - base: Good balance (~1GB VRAM) [DEFAULT]
-    - small: Better accuracy (~2GB VRAM)
-    - medium: High accuracy (~5GB VRAM)
-    - large: Best accuracy (~10GB VRAM)
+    - tiny: Fastest, least accurate (~1GB RAM)
+    - base: Good balance (~1GB RAM) [DEFAULT]
+    - small: Better accuracy (~2GB RAM)
+    - medium: High accuracy (~5GB RAM)
+    - large-v3: Best accuracy (~10GB RAM)
+
+    For English, small/medium/large-v3 run as the matching
+    distil-whisper model and base as base.en.
 
     Args:
         audio_file_path: Path to audio file
-        model_size: Whisper model size (tiny, base, small, medium, large)
+        model_size: Whisper model size (tiny, base, small, medium, large-v3)
         language: Language code (en, es, fr, etc.)
 
     Returns:
@@ -44,52 +100,62 @@ def transcribe_audio_local(
         - segments: List of timestamped segments
 
     Raises:
-        RuntimeError: If whisper is not installed
+        RuntimeError: If faster-whisper is not installed
         Exception: If transcription fails
     """
     if not WHISPER_AVAILABLE:
         raise RuntimeError(
-            "openai-whisper package not installed. "
-            "Install with: pip install openai-whisper"
+            "faster-whisper package not installed. "
+            "Install with: pip install faster-whisper"
         )
 
     if not os.path.exists(audio_file_path):
         raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
 
     try:
-        logger.info(f"Loading Whisper model: {model_size}")
-
-        # Load model (will download on first use, then cache locally)
-        model = whisper.load_model(model_size)
+        if language == "en":
+            model_size = _ENGLISH_DISTIL_MODELS.get(model_size, model_size)
+        model = _get_model(model_size)
 
         logger.info(f"Transcribing audio file: {audio_file_path}")
 
-        # Transcribe with word-level timestamps
-        result = model.transcribe(
-            audio_file_path,
-            language=language,
-            verbose=False,
-            word_timestamps=True
-        )
+        if _cuda_available() and BatchedInferencePipeline is not None:
+            # On GPU, decode VAD-split chunks of the recording in batches
+            # instead of one 30s window at a time
+            segments_iter, info = BatchedInferencePipeline(model=model).transcribe(
+                audio_file_path,
+                language=language,
+                beam_size=1,
+                batch_size=GPU_BATCH_SIZE,
+            )
+        else:
+            # Greedy decoding; VAD skips silence instead of decoding it
+            segments_iter, info = model.transcribe(
+                audio_file_path,
+                language=language,
+                beam_size=1,
+                vad_filter=True,
+            )
+        # segments_iter is lazy: decoding happens while iterating
+        segments = [
+            {"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text}
+            for seg in segments_iter
+        ]
 
         # Format transcript with timestamps
-        formatted_transcript = format_transcript_with_timestamps(result.get("segments", []))
+        formatted_transcript = format_transcript_with_timestamps(segments)
 
-        # Calculate duration
-        duration_seconds = 0
-        if result.get("segments"):
-            last_segment = result["segments"][-1]
-            duration_seconds = last_segment.get("end", 0)
+        duration_seconds = info.duration
 
         logger.info(f"Transcription complete. Duration: {duration_seconds:.1f}s, Length: {len(formatted_transcript)} chars")
 
         return {
             "transcript": formatted_transcript,
-            "plain_text": result.get("text", "").strip(),
+            "plain_text": "".join(seg["text"] for seg in segments).strip(),
             "duration_seconds": duration_seconds,
             "duration_minutes": int(duration_seconds / 60),
-            "segments": result.get("segments", []),
-            "language": result.get("language", language)
+            "segments": segments,
+            "language": info.language or language
         }
 
     except Exception as e:
@@ -140,26 +206,15 @@ def check_whisper_availability() -> dict:
     if not WHISPER_AVAILABLE:
         return {
             "available": False,
-            "message": "openai-whisper not installed",
-            "install_command": "pip install openai-whisper"
+            "message": "faster-whisper not installed",
+            "install_command": "pip install faster-whisper"
         }
 
-    try:
-        import torch
-        has_cuda = torch.cuda.is_available()
-
-        return {
-            "available": True,
-            "message": "Whisper is ready",
-            "cuda_available": has_cuda,
-            "device": "GPU (CUDA)" if has_cuda else "CPU",
-            "recommended_model": "base" if not has_cuda else "small"
-        }
-    except ImportError:
-        return {
-            "available": True,
-            "message": "Whisper is ready (CPU only)",
-            "cuda_available": False,
-            "device": "CPU",
-            "recommended_model": "base"
-        }
+    has_cuda = _cuda_available()
+    return {
+        "available": True,
+        "message": "Whisper is ready",
+        "cuda_available": has_cuda,
+        "device": "GPU (CUDA)" if has_cuda else "CPU",
+        "recommended_model": "small" if has_cuda else "base"
+    }
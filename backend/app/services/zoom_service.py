@@ -20,6 +20,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from app.config import settings
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -89,16 +90,16 @@ class ZoomService:
         Raises:
             ValueError: If Zoom returns an error.
         """
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.post(
-                f"{_ZOOM_OAUTH_BASE}/token",
-                params={
-                    "grant_type": "authorization_code",
-                    "code": code,
-                    "redirect_uri": settings.ZOOM_REDIRECT_URI,
-                },
-                auth=(settings.ZOOM_CLIENT_ID, settings.ZOOM_CLIENT_SECRET),
-            )
+        resp = await get_http_client().post(
+            f"{_ZOOM_OAUTH_BASE}/token",
+            params={
+                "grant_type": "authorization_code",
+                "code": code,
+                "redirect_uri": settings.ZOOM_REDIRECT_URI,
+            },
+            auth=(settings.ZOOM_CLIENT_ID, settings.ZOOM_CLIENT_SECRET),
+            timeout=15,
+        )
         if resp.status_code != 200:
             raise ValueError(f"Zoom token exchange failed: {resp.text}")
         data = resp.json()
@@ -116,15 +117,15 @@ class ZoomService:
         Raises:
             ValueError: If Zoom returns an error.
         """
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.post(
-                f"{_ZOOM_OAUTH_BASE}/token",
-                params={
-                    "grant_type": "refresh_token",
-                    "refresh_token": refresh_token,
-                },
-                auth=(settings.ZOOM_CLIENT_ID, settings.ZOOM_CLIENT_SECRET),
-            )
+        resp = await get_http_client().post(
+            f"{_ZOOM_OAUTH_BASE}/token",
+            params={
+                "grant_type": "refresh_token",
+                "refresh_token": refresh_token,
+            },
+            auth=(settings.ZOOM_CLIENT_ID, settings.ZOOM_CLIENT_SECRET),
+            timeout=15,
+        )
         if resp.status_code != 200:
             raise ValueError(f"Zoom token refresh failed: {resp.text}")
         data = resp.json()
@@ -25,18 +25,15 @@ from typing import Optional
 
 import httpx
 from sqlalchemy import select
-from sqlalchemy.engine import create_engine
 from sqlalchemy.orm import Session
 
 from app.celery_app import celery_app
 from app.config import settings
+from app.database import get_sync_engine
 from app.models import Integration, IntegrationPlatform, Task
 
 logger = logging.getLogger(__name__)
 
-# Synchronous SQLAlchemy engine for Celery tasks (Celery does not support asyncio)
-_sync_engine = create_engine(settings.database_url_sync, pool_pre_ping=True)
-
 
 # ── Jira sync ──────────────────────────────────────────────────────────────────
 
@@ -66,7 +63,7 @@ def sync_task_to_jira(self, task_id: str, user_id: str) -> dict:
     """
     from app.services.jira_service import JiraService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         task: Optional[Task] = db.execute(
             select(Task).where(Task.id == task_id)
         ).scalar_one_or_none()
@@ -192,7 +189,7 @@ def notify_slack_task_created(
     """
     from app.services.slack_service import SlackService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         task: Optional[Task] = db.execute(
             select(Task).where(Task.id == task_id)
         ).scalar_one_or_none()
@@ -318,7 +315,7 @@ def sync_task_to_calendar(self, task_id: str, user_id: str) -> dict:
     from app.models.user import User as UserModel
     from app.services.google_calendar_service import GoogleCalendarService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         task = db.execute(select(Task).where(Task.id == task_id)).scalar_one_or_none()
         if not task:
             return {"error": "task_not_found", "task_id": task_id}
@@ -386,7 +383,7 @@ def delete_calendar_event(self, calendar_event_id: str, user_id: str, task_id: O
     """Delete a Google Calendar event and clear calendar_event_id on the task."""
     from app.services.google_calendar_service import GoogleCalendarService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         gcal_int = db.execute(
             select(Integration).where(
                 Integration.user_id == user_id,
@@ -434,7 +431,7 @@ def sync_meeting_to_calendar(self, meeting_id: str, user_id: str) -> dict:
     from app.models.meeting import Meeting
     from app.services.google_calendar_service import GoogleCalendarService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         meeting = db.execute(select(Meeting).where(Meeting.id == meeting_id)).scalar_one_or_none()
         if not meeting:
             return {"error": "meeting_not_found"}
@@ -524,7 +521,7 @@ def sync_action_item_to_calendar(self, action_item_id: str, user_id: str) -> dic
     from app.models.action_item import ActionItem
     from app.services.google_calendar_service import GoogleCalendarService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         item = db.execute(select(ActionItem).where(ActionItem.id == action_item_id)).scalar_one_or_none()
         if not item:
             return {"error": "action_item_not_found"}
@@ -597,7 +594,7 @@ def reschedule_overdue_tasks(self) -> dict:
     moved = 0
     skipped = 0
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         opted_in = db.execute(
             select(CalendarPreferences).where(CalendarPreferences.auto_reschedule_overdue == True)
         ).scalars().all()
@@ -672,7 +669,7 @@ def generate_meet_link_for_task(self, task_id: str, user_id: str) -> dict:
     from app.models.user import User as UserModel
     from app.services.google_calendar_service import GoogleCalendarService
 
-    with Session(_sync_engine) as db:
+    with Session(get_sync_engine()) as db:
         task = db.execute(select(Task).where(Task.id == task_id)).scalar_one_or_none()
         if not task:
             logger.error("generate_meet_link_for_task: task %s not found", task_id)
@@ -2,22 +2,22 @@
 Celery tasks for meeting processing.
 Handles transcription, summarization, and action item extraction.
 """
+import asyncio
 import os
 import tempfile
 import logging
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 from sqlalchemy.orm import Session
-from sqlalchemy.engine import create_engine
 
 from app.celery_app import celery_app
-from app.config import settings
+from app.database import get_sync_engine
 from app.models import Meeting, ActionItem, MeetingStatus, ActionItemStatus
 from app.services.ai_service import (
     transcribe_meeting,
     summarize_meeting,
     extract_action_items_from_summary
 )
-from app.utils.storage import get_storage
+from app.utils.storage import get_storage, extract_key
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,9 +27,36 @@ logging.basicConfig(
 )
 
 
-# Create sync engine for Celery tasks (Celery doesn't support async)
-sync_database_url = settings.database_url_sync
-engine = create_engine(sync_database_url, pool_pre_ping=True)
+def _mark_failed(db: Session, meeting_id: str) -> None:
+    """Set a meeting to FAILED with one UPDATE, discarding the failed transaction."""
+    db.rollback()
+    db.execute(
+        update(Meeting).where(Meeting.id == meeting_id).values(status=MeetingStatus.FAILED)
+    )
+    db.commit()
+
+
+@celery_app.task(name="app.tasks.meeting_tasks.process_meeting_task")
+def process_meeting_task(meeting_id: str):
+    """
+    Run the full upload pipeline (transcribe → diarize → analyse → summarise)
+    on a worker, so the CPU-heavy stages never share the API's event loop.
+
+    Args:
+        meeting_id: UUID of the meeting to process
+    """
+    from app.database import engine as async_engine
+    from app.routers.meetings import process_meeting_background
+
+    async def _run():
+        try:
+            await process_meeting_background(meeting_id)
+        finally:
+            # Pooled asyncpg connections belong to this loop; close them
+            # before asyncio.run tears it down
+            await async_engine.dispose()
+
+    asyncio.run(_run())
 
 
 @celery_app.task(bind=True, name="app.tasks.meeting_tasks.transcribe_meeting_task")
@@ -52,7 +79,7 @@ def transcribe_meeting_task(self, meeting_id: str):
     logger.info(f"Starting transcription for meeting {meeting_id}")
     tmp_file_path = None
 
-    with Session(engine) as db:
+    with Session(get_sync_engine()) as db:
         try:
             # Fetch meeting
             result = db.execute(select(Meeting).where(Meeting.id == meeting_id))
@@ -76,62 +103,49 @@ def transcribe_meeting_task(self, meeting_id: str):
             # Download audio file from storage
             storage = get_storage()
 
-            # Extract key from URL based on storage type
-            recording_url = meeting.recording_url
-            if recording_url.startswith('local://'):
-                # Local storage format: local://meetings/filename.mp3
-                key = recording_url.replace('local://', '')
-                logger.info(f"Meeting {meeting_id}: Using local storage, key = {key}")
-            elif '.amazonaws.com/' in recording_url:
-                # S3 format: https://bucket.s3.region.amazonaws.com/meetings/filename.mp3
-                key = recording_url.split('.amazonaws.com/')[-1]
-                logger.info(f"Meeting {meeting_id}: Using S3 storage, key = {key}")
-            elif 'cloudinary.com' in recording_url:
-                # Cloudinary format: extract path after /upload/
-                key = recording_url.split('/upload/')[-1]
-                logger.info(f"Meeting {meeting_id}: Using Cloudinary storage, key = {key}")
-            else:
-                # Fallback: try to extract path after last .com/
-                key = recording_url.split('.com/')[-1] if '.com/' in recording_url else recording_url
-                logger.warning(f"Meeting {meeting_id}: Unknown storage format, using fallback key = {key}")
+            key = extract_key(meeting.recording_url)
+            logger.info(f"Meeting {meeting_id}: Storage key = {key}")
 
             # Create temp file for download
             file_ext = os.path.splitext(key)[1]
             with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp_file:
                 tmp_file_path = tmp_file.name
 
-            logger.info(f"Meeting {meeting_id}: Downloading audio to {tmp_file_path}")
+            async def _fetch_and_transcribe() -> str:
+                # Storage download and Whisper call share one event loop
+                # instead of spinning up a fresh loop for each
+                logger.info(f"Meeting {meeting_id}: Downloading audio to {tmp_file_path}")
 
-            # Download file
-            import asyncio
-            asyncio.run(storage.download_file(key, tmp_file_path))
+                # Download file
+                await storage.download_file(key, tmp_file_path)
 
-            # Check file size
-            file_size_mb = os.path.getsize(tmp_file_path) / (1024 * 1024)
-            logger.info(f"Meeting {meeting_id}: Downloaded file size = {file_size_mb:.2f}MB")
+                # Check file size
+                file_size_mb = os.path.getsize(tmp_file_path) / (1024 * 1024)
+                logger.info(f"Meeting {meeting_id}: Downloaded file size = {file_size_mb:.2f}MB")
 
-            if file_size_mb > 25:
-                logger.error(f"Meeting {meeting_id}: File size {file_size_mb:.2f}MB exceeds Whisper API limit of 25MB")
-                raise ValueError(f"File size {file_size_mb:.2f}MB exceeds Whisper API limit of 25MB")
+                if file_size_mb > 25:
+                    logger.error(f"Meeting {meeting_id}: File size {file_size_mb:.2f}MB exceeds Whisper API limit of 25MB")
+                    raise ValueError(f"File size {file_size_mb:.2f}MB exceeds Whisper API limit of 25MB")
 
-            # Calculate duration
-            try:
-                from mutagen import File as MutagenFile
-                audio = MutagenFile(tmp_file_path)
-                if audio is not None and hasattr(audio.info, 'length'):
-                    duration_seconds = audio.info.length
-                    duration_minutes = int(duration_seconds / 60)
-                    meeting.duration_minutes = duration_minutes
-                    logger.info(f"Meeting {meeting_id}: Duration = {duration_minutes} minutes ({duration_seconds:.1f} seconds)")
-                else:
-                    logger.warning(f"Meeting {meeting_id}: Could not determine audio duration")
-            except Exception as duration_error:
-                logger.warning(f"Meeting {meeting_id}: Failed to calculate duration: {str(duration_error)}")
-
-            # Transcribe using Whisper
-            logger.info(f"Meeting {meeting_id}: Starting Whisper API transcription")
-            import asyncio
-            transcript = asyncio.run(transcribe_meeting(tmp_file_path))
+                # Calculate duration
+                try:
+                    from mutagen import File as MutagenFile
+                    audio = MutagenFile(tmp_file_path)
+                    if audio is not None and hasattr(audio.info, 'length'):
+                        duration_seconds = audio.info.length
+                        duration_minutes = int(duration_seconds / 60)
+                        meeting.duration_minutes = duration_minutes
+                        logger.info(f"Meeting {meeting_id}: Duration = {duration_minutes} minutes ({duration_seconds:.1f} seconds)")
+                    else:
+                        logger.warning(f"Meeting {meeting_id}: Could not determine audio duration")
+                except Exception as duration_error:
+                    logger.warning(f"Meeting {meeting_id}: Failed to calculate duration: {str(duration_error)}")
+
+                # Transcribe using Whisper
+                logger.info(f"Meeting {meeting_id}: Starting Whisper API transcription")
+                return await transcribe_meeting(tmp_file_path)
+
+            transcript = asyncio.run(_fetch_and_transcribe())
             logger.info(f"Meeting {meeting_id}: Transcription complete, length = {len(transcript)} characters")
 
             # Clean up temp file
@@ -161,12 +175,8 @@ def transcribe_meeting_task(self, meeting_id: str):
 
             # Mark meeting as failed
             try:
-                result = db.execute(select(Meeting).where(Meeting.id == meeting_id))
-                meeting = result.scalar_one_or_none()
-                if meeting:
-                    meeting.status = MeetingStatus.FAILED
-                    db.commit()
-                    logger.info(f"Meeting {meeting_id}: Status updated to FAILED")
+                _mark_failed(db, meeting_id)
+                logger.info(f"Meeting {meeting_id}: Status updated to FAILED")
             except Exception as db_error:
                 logger.error(f"Meeting {meeting_id}: Failed to update status to FAILED: {str(db_error)}")
 
@@ -199,7 +209,7 @@ def summarize_meeting_task(self, meeting_id: str):
     """
     logger.info(f"Starting summarization for meeting {meeting_id}")
 
-    with Session(engine) as db:
+    with Session(get_sync_engine()) as db:
         try:
             # Fetch meeting
             result = db.execute(select(Meeting).where(Meeting.id == meeting_id))
@@ -217,7 +227,6 @@ def summarize_meeting_task(self, meeting_id: str):
 
             # Summarize using GPT-4
             logger.info(f"Meeting {meeting_id}: Calling GPT-4 for summarization")
-            import asyncio
             summary_data = asyncio.run(
                 summarize_meeting(meeting.transcript, meeting.title)
             )
@@ -232,7 +241,7 @@ def summarize_meeting_task(self, meeting_id: str):
             action_items_data = summary_data.get("action_items", [])
             logger.info(f"Meeting {meeting_id}: Found {len(action_items_data)} action items")
 
-            created_count = 0
+            action_item_rows = []
             skipped_count = 0
 
             for item_data in action_items_data:
@@ -241,21 +250,24 @@ def summarize_meeting_task(self, meeting_id: str):
 
                 # Only create action items with sufficient confidence
                 if confidence >= 0.6:
-                    action_item = ActionItem(
-                        meeting_id=meeting_id,
-                        description=description,
-                        assignee_mentioned=item_data.get("assignee"),
-                        deadline_mentioned=item_data.get("deadline"),
-                        confidence_score=confidence,
-                        status=ActionItemStatus.PENDING
-                    )
-                    db.add(action_item)
-                    created_count += 1
+                    action_item_rows.append({
+                        "meeting_id": meeting_id,
+                        "description": description,
+                        "assignee_mentioned": item_data.get("assignee"),
+                        "deadline_mentioned": item_data.get("deadline"),
+                        "confidence_score": confidence,
+                        "status": ActionItemStatus.PENDING,
+                    })
                     logger.info(f"Meeting {meeting_id}: Created action item: {description[:50]}... (confidence: {confidence:.2f})")
                 else:
                     skipped_count += 1
                     logger.info(f"Meeting {meeting_id}: Skipped low-confidence action item: {description[:50]}... (confidence: {confidence:.2f})")
 
+            # One multi-row INSERT instead of a flush per ORM object
+            if action_item_rows:
+                db.execute(insert(ActionItem), action_item_rows)
+            created_count = len(action_item_rows)
+
             logger.info(f"Meeting {meeting_id}: Created {created_count} action items, skipped {skipped_count} low-confidence items")
 
             # Update meeting status
@@ -296,12 +308,8 @@ def summarize_meeting_task(self, meeting_id: str):
 
             # Mark meeting as failed
             try:
-                result = db.execute(select(Meeting).where(Meeting.id == meeting_id))
-                meeting = result.scalar_one_or_none()
-                if meeting:
-                    meeting.status = MeetingStatus.FAILED
-                    db.commit()
-                    logger.info(f"Meeting {meeting_id}: Status updated to FAILED")
+                _mark_failed(db, meeting_id)
+                logger.info(f"Meeting {meeting_id}: Status updated to FAILED")
             except Exception as db_error:
                 logger.error(f"Meeting {meeting_id}: Failed to update status to FAILED: {str(db_error)}")
 
@@ -320,7 +328,7 @@ def process_message_for_intent(message_id: str):
     """
     from app.models import Message
 
-    with Session(engine) as db:
+    with Session(get_sync_engine()) as db:
         try:
             # Fetch message
             result = db.execute(select(Message).where(Message.id == message_id))
@@ -330,15 +338,20 @@ def process_message_for_intent(message_id: str):
                 raise ValueError(f"Message {message_id} not found")
 
             # Classify intent
-            import asyncio
             from app.services.ai_service import classify_intent, extract_task_entities
 
-            intent_data = asyncio.run(classify_intent(message.content))
+            async def _classify():
+                # Both LLM calls on one event loop; entities only for task requests
+                intent = await classify_intent(message.content)
+                if intent["intent"] != "task_request":
+                    return intent, None
+                return intent, await extract_task_entities(message.content)
+
+            intent_data, entities = asyncio.run(_classify())
             message.intent = intent_data["intent"]
 
             # If it's a task request, extract entities and create a real task
             if intent_data["intent"] == "task_request":
-                entities = asyncio.run(extract_task_entities(message.content))
                 message.entities = entities
 
                 # create internal Task record from entities (Slack messages only)
@@ -0,0 +1,97 @@
+"""
+Audio helpers: upload content sniffing and preprocessing for transcription.
+
+Whisper works on 16 kHz mono internally, so a 44.1/48 kHz stereo WAV upload
+carries 5-6x more samples than the model ever sees. Downmixing it before the
+pipeline shrinks what gets sent to the transcription API, diarization and
+AssemblyAI alike. Compressed uploads (mp3, m4a, webm) are already smaller
+than 16 kHz FLAC and are passed through untouched.
+"""
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+ASR_SAMPLE_RATE = 16000
+
+# Bytes needed by looks_like_audio
+SNIFF_BYTES = 12
+
+# Uncompressed PCM containers, the only uploads that shrink as 16 kHz FLAC
+UNCOMPRESSED_EXTENSIONS = {".wav", ".wave"}
+
+
+def looks_like_audio(header: bytes) -> bool:
+    """
+    Check the leading bytes of a file against the containers uploads may use
+    (MP3/MPGA, WAV, M4A/MP4, WebM, MPEG), regardless of its file name.
+    """
+    if header.startswith(b"ID3"):  # MP3 with ID3v2 tag
+        return True
+    if len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:  # MPEG audio frame sync
+        return True
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return True
+    if header[4:8] == b"ftyp":  # ISO base media: m4a, mp4
+        return True
+    if header.startswith(b"\x1a\x45\xdf\xa3"):  # EBML: webm
+        return True
+    if header[:4] in (b"\x00\x00\x01\xba", b"\x00\x00\x01\xb3"):  # MPEG program/video stream
+        return True
+    return False
+
+
+def is_uncompressed_audio(filename: str) -> bool:
+    """Whether a recording is raw PCM and worth re-encoding before transcription."""
+    return os.path.splitext(filename)[1].lower() in UNCOMPRESSED_EXTENSIONS
+
+
+async def transcode_for_asr(source: str, source_size: int) -> Optional[str]:
+    """
+    Re-encode audio as 16 kHz mono FLAC (lossless, accepted by Groq/OpenAI).
+
+    source is anything ffmpeg can open: a local path or a (presigned) URL,
+    which ffmpeg streams from directly, so download and decode are a single
+    pass and the original never lands on disk.
+
+    Only worth calling for uncompressed input (see is_uncompressed_audio):
+    16 kHz mono FLAC runs at roughly 150-250 kbps, more than most mp3/m4a/webm
+    recordings.
+
+    Returns the path of the new file, owned by the caller, or None when
+    ffmpeg is unavailable, fails, or the re-encode would be larger than the
+    original - the caller then uses the original file.
+    """
+    if shutil.which("ffmpeg") is None:
+        logger.warning("ffmpeg not found, transcribing original audio")
+        return None
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".flac") as tmp_file:
+        out_path = tmp_file.name
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+            "-i", source,
+            "-vn", "-ac", "1", "-ar", str(ASR_SAMPLE_RATE), "-c:a", "flac",
+            out_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+    except (OSError, NotImplementedError) as e:  # NotImplementedError: Windows selector loop
+        logger.warning(f"ffmpeg preprocessing failed: {e}")
+        os.unlink(out_path)
+        return None
+
+    if proc.returncode != 0 or os.path.getsize(out_path) >= source_size:
+        if proc.returncode != 0:
+            logger.warning(f"ffmpeg preprocessing failed: {stderr.decode(errors='replace').strip()}")
+        os.unlink(out_path)
+        return None
+
+    return out_path
@@ -0,0 +1,82 @@
+"""
+Small JSON response cache backed by Redis.
+
+Shared by every API worker process, so a dashboard polled by several team
+members is computed once per TTL window. Redis is an optimisation only: if it
+is unreachable, reads miss and writes are dropped.
+"""
+import logging
+from typing import Any, Optional
+
+import orjson
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Lazy singleton
+_redis_client = None
+
+
+def _get_client():
+    """Get async Redis client instance (lazy initialization)"""
+    global _redis_client
+    if _redis_client is None:
+        import redis.asyncio as aioredis
+        _redis_client = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25,
+        )
+    return _redis_client
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """
+    Read a cached JSON value.
+
+    Args:
+        key: Redis key
+
+    Returns:
+        The decoded value, or None on a miss or if Redis is unavailable
+    """
+    try:
+        raw = await _get_client().get(key)
+    except Exception as e:
+        logger.debug("cache get %s failed: %s", key, e)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl: int) -> bool:
+    """
+    Store a JSON-serializable value with an expiry.
+
+    Args:
+        key: Redis key
+        value: Value to cache
+        ttl: Seconds until the entry expires
+
+    Returns:
+        False if Redis is unavailable and the value was dropped
+    """
+    try:
+        await _get_client().set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.debug("cache set %s failed: %s", key, e)
+        return False
+    return True
+
+
+async def cache_delete(key: str) -> None:
+    """
+    Drop a cached value so the next read recomputes it.
+
+    Args:
+        key: Redis key
+    """
+    try:
+        await _get_client().delete(key)
+    except Exception as e:
+        logger.debug("cache delete %s failed: %s", key, e)
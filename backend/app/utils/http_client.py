@@ -0,0 +1,33 @@
+"""
+Shared outbound HTTP client for one-off provider calls.
+
+OAuth code exchanges and token refreshes used to open a fresh AsyncClient per
+call, paying a TCP + TLS handshake every time. One pooled client per worker
+keeps connections to the provider token endpoints warm between callbacks.
+
+Only for code running on the API server's event loop: Celery tasks start a new
+loop per job and must keep using their own short-lived clients.
+"""
+import httpx
+
+# Lazy singleton
+_http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient (lazy initialization)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -0,0 +1,27 @@
+"""
+Opaque keyset-pagination cursors.
+
+A cursor encodes the (timestamp, id) position of the last row on a page;
+the next page resumes strictly after it in (timestamp DESC, id DESC) order.
+"""
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def encode_cursor(ts: Optional[datetime], row_id: str) -> str:
+    """Cursor for the (ts, id) position of a row."""
+    raw = f"{ts.isoformat() if ts else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """Inverse of encode_cursor; raises 400 on a malformed cursor."""
+    try:
+        ts_raw, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        ts = datetime.fromisoformat(ts_raw) if ts_raw else None
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return ts, row_id
@@ -0,0 +1,24 @@
+"""
+Response classes shared by routers.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that writes naive datetimes as UTC with a trailing "Z".
+
+    Timestamps are stored as naive UTC. Returning this response directly with
+    datetime values skips FastAPI's jsonable_encoder pass and lets orjson
+    format them in C, matching the ``isoformat() + "Z"`` strings built by hand
+    elsewhere.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        )
@@ -2,20 +2,28 @@
 Security utilities for password hashing and JWT token management.
 """
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 import jwt
+from fastapi.concurrency import run_in_threadpool
 from jwt.exceptions import InvalidTokenError
 from passlib.context import CryptContext
 
 from app.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. New hashes use argon2; existing bcrypt hashes
+# still verify and are upgraded on the user's next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,  # KiB
+    argon2__parallelism=2,
+)
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a plain password using bcrypt.
+    Hash a plain password using argon2.
 
     Args:
         password: Plain text password
@@ -40,6 +48,33 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if its hash uses a deprecated scheme, rehash it.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database
+
+    Returns:
+        (matches, new_hash) - new_hash is None unless the stored hash should be replaced
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# Hashing is deliberately CPU-heavy; the async variants run it on the thread
+# pool so one login doesn't stall every other request on the event loop.
+
+async def get_password_hash_async(password: str) -> str:
+    """Async wrapper for :func:`get_password_hash`."""
+    return await run_in_threadpool(get_password_hash, password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Async wrapper for :func:`verify_and_update_password`."""
+    return await run_in_threadpool(verify_and_update_password, plain_password, hashed_password)
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: Optional[timedelta] = None
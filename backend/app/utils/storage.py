@@ -2,10 +2,12 @@
 File storage utilities supporting AWS S3 and local filesystem fallback.
 Automatically chooses based on configuration.
 """
+import asyncio
 import os
+import re
 import uuid
 import shutil
-from typing import Optional, BinaryIO
+from typing import Optional, BinaryIO, Tuple
 from pathlib import Path
 
 from app.config import settings
@@ -13,6 +15,25 @@ from app.config import settings
 # Local uploads directory (fallback when no cloud storage configured)
 LOCAL_UPLOAD_DIR = Path(__file__).resolve().parent.parent.parent / "uploads"
 
+# Storage key inside a recording URL, one alternative per backend:
+#   local://meetings/x.mp3                            -> meetings/x.mp3
+#   https://bucket.s3.region.amazonaws.com/meetings/x -> meetings/x
+#   https://res.cloudinary.com/.../upload/v1/x        -> v1/x
+#   anything else on a .com host                      -> path after the last .com/
+_KEY_RE = re.compile(
+    r"local://(?P<local>.*)"
+    r"|.*\.amazonaws\.com/(?P<s3>.*)"
+    r"|.*cloudinary\.com.*/upload/(?P<cloudinary>.*)"
+    r"|.*\.com/(?P<other>.*)",
+    re.DOTALL,
+)
+
+
+def extract_key(url: str) -> str:
+    """Storage key for a recording URL; unrecognised URLs are returned as-is."""
+    match = _KEY_RE.match(url)
+    return match.group(match.lastgroup) if match else url
+
 
 class LocalStorageService:
     """Local filesystem storage for development (no S3/Cloudinary needed)"""
@@ -60,12 +81,18 @@ class LocalStorageService:
         shutil.copy2(str(src), local_path)
         return local_path
 
+    async def get_read_source(self, key: str) -> Tuple[str, int]:
+        """Path a subprocess (ffmpeg) can read the file from, and its size."""
+        path = LOCAL_UPLOAD_DIR / key.replace("local://", "")
+        return str(path), path.stat().st_size
+
 
 class S3StorageService:
     """AWS S3 storage service"""
 
     def __init__(self):
         import boto3
+        from boto3.s3.transfer import TransferConfig
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
@@ -73,6 +100,14 @@ class S3StorageService:
             region_name=settings.AWS_REGION
         )
         self.bucket_name = settings.AWS_BUCKET_NAME
+        # Recordings above 8MB move as 8MB parts over up to 8 connections
+        # in parallel, both ways
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        )
 
     async def upload_file(
         self,
@@ -92,7 +127,12 @@ class S3StorageService:
             extra_args['ContentType'] = content_type
 
         try:
-            self.s3_client.upload_fileobj(file_obj, self.bucket_name, key, ExtraArgs=extra_args)
+            # boto3 blocks; run the transfer off the event loop
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                file_obj, self.bucket_name, key,
+                ExtraArgs=extra_args, Config=self.transfer_config,
+            )
             return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{key}"
         except ClientError as e:
             raise Exception(f"S3 upload failed: {str(e)}")
@@ -125,9 +165,18 @@ class S3StorageService:
             return False
 
     async def download_file(self, key: str, local_path: str) -> str:
-        self.s3_client.download_file(self.bucket_name, key, local_path)
+        await asyncio.to_thread(
+            self.s3_client.download_file,
+            self.bucket_name, key, local_path,
+            Config=self.transfer_config,
+        )
         return local_path
 
+    async def get_read_source(self, key: str) -> Tuple[str, int]:
+        """Presigned URL a subprocess (ffmpeg) can stream the object from, and its size."""
+        head = await asyncio.to_thread(self.s3_client.head_object, Bucket=self.bucket_name, Key=key)
+        return await self.get_file_url(key), head["ContentLength"]
+
 
 # Lazy singleton
 _storage_instance = None
@@ -11,6 +11,7 @@ from sqlalchemy.pool import NullPool
 from app.main import app
 from app.database import Base, get_db
 from app.models import User, Team
+from app.models.user import UserRole
 from app.utils.security import get_password_hash, create_access_token
 
 # Test database URL
@@ -129,6 +130,24 @@ async def test_admin(test_db, test_team):
     return admin
 
 
+@pytest_asyncio.fixture
+async def test_developer(test_db, test_team):
+    """Create a non-admin user with a role the users.role enum accepts."""
+    developer = User(
+        email="developer@example.com",
+        password_hash=get_password_hash("devpass123"),
+        full_name="Developer User",
+        team_id=test_team.id,
+        is_active=True,
+        is_verified=True,
+        role=UserRole.DEVELOPER
+    )
+    test_db.add(developer)
+    await test_db.commit()
+    await test_db.refresh(developer)
+    return developer
+
+
 @pytest.fixture
 def auth_headers(test_user):
     """Generate auth headers for test user."""
@@ -141,3 +160,57 @@ def admin_headers(test_admin):
     """Generate auth headers for admin user."""
     token = create_access_token(data={"sub": test_admin.id})
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def developer_headers(test_developer):
+    """Generate auth headers for developer user."""
+    token = create_access_token(data={"sub": test_developer.id})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """
+    Replace the Redis cache helpers imported by the given modules.
+
+    Call as fake_cache("app.routers.tasks", ...) for a dict-backed cache,
+    returned so tests can inspect or edit entries, or with available=False
+    to behave as if Redis were unreachable (reads miss, writes are dropped).
+    """
+    def install(*modules: str, available: bool = True) -> dict:
+        store = {}
+
+        async def cache_get_json(key):
+            return store.get(key) if available else None
+
+        async def cache_set_json(key, value, ttl):
+            if available:
+                store[key] = value
+            return available
+
+        async def cache_delete(key):
+            store.pop(key, None)
+
+        for module in modules:
+            monkeypatch.setattr(f"{module}.cache_get_json", cache_get_json)
+            monkeypatch.setattr(f"{module}.cache_set_json", cache_set_json)
+            monkeypatch.setattr(f"{module}.cache_delete", cache_delete, raising=False)
+        return store
+
+    return install
+
+
+async def collect_pages(client: AsyncClient, url: str, headers: dict, key: str, limit: int) -> list:
+    """Follow next_cursor from the first page to the last and return every item."""
+    items = []
+    cursor = None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(url, headers=headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        items.extend(data[key])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return items
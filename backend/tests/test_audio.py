@@ -0,0 +1,41 @@
+"""
+Unit tests for app/utils/audio.py
+
+Covers looks_like_audio and is_uncompressed_audio — no ffmpeg involved.
+"""
+from app.utils.audio import is_uncompressed_audio, looks_like_audio
+
+
+class TestLooksLikeAudio:
+    def test_mp3_id3(self):
+        assert looks_like_audio(b"ID3\x04\x00\x00\x00\x00\x00\x00\x00\x00")
+
+    def test_mp3_frame_sync(self):
+        assert looks_like_audio(b"\xff\xfb\x90\x64\x00\x00\x00\x00\x00\x00\x00\x00")
+
+    def test_wav(self):
+        assert looks_like_audio(b"RIFF\x24\x08\x00\x00WAVE")
+
+    def test_m4a(self):
+        assert looks_like_audio(b"\x00\x00\x00\x20ftypM4A ")
+
+    def test_webm(self):
+        assert looks_like_audio(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\xf7\x81")
+
+    def test_renamed_executable_rejected(self):
+        assert not looks_like_audio(b"MZ\x90\x00\x03\x00\x00\x00\x04\x00\x00\x00")
+
+    def test_empty_rejected(self):
+        assert not looks_like_audio(b"")
+
+
+class TestIsUncompressedAudio:
+    def test_wav(self):
+        assert is_uncompressed_audio("team/abc/recording.WAV")
+
+    def test_compressed_formats_skipped(self):
+        for name in ("a.mp3", "a.m4a", "a.webm", "a.mp4", "a.mpga"):
+            assert not is_uncompressed_audio(name)
+
+    def test_no_extension(self):
+        assert not is_uncompressed_audio("recording")
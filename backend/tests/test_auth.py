@@ -106,6 +106,79 @@ async def test_update_profile(client: AsyncClient, auth_headers):
     assert data["timezone"] == "America/New_York"
 
 
+@pytest.mark.asyncio
+async def test_profile_update_visible_on_next_request(client: AsyncClient, developer_headers):
+    """Test cached user is invalidated after a profile update."""
+    await client.get("/api/auth/me", headers=developer_headers)
+    await client.patch(
+        "/api/auth/me",
+        headers=developer_headers,
+        json={"full_name": "Renamed User"}
+    )
+
+    response = await client.get("/api/auth/me", headers=developer_headers)
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed User"
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_repeat_token(client: AsyncClient, developer_headers, test_developer):
+    """Test the same token authenticates on a cold and a warm token cache."""
+    for _ in range(2):
+        response = await client.get("/api/auth/me", headers=developer_headers)
+
+        assert response.status_code == 200
+        assert response.json()["id"] == test_developer.id
+
+
+@pytest.mark.asyncio
+async def test_deactivation_in_other_worker_evicts_cached_user(
+    client: AsyncClient, developer_headers, test_db, test_developer, fake_cache
+):
+    """Test a version bump from another process stops the cached snapshot being served."""
+    from sqlalchemy import update
+    from app.dependencies import invalidate_cached_user
+    from app.models import User
+
+    user_versions = fake_cache("app.dependencies")
+    response = await client.get("/api/auth/me", headers=developer_headers)
+    assert response.status_code == 200
+
+    # Written behind the API's back: the snapshot still answers
+    await test_db.execute(update(User).where(User.id == test_developer.id).values(is_active=False))
+    await test_db.commit()
+    response = await client.get("/api/auth/me", headers=developer_headers)
+    assert response.status_code == 200
+
+    # Another worker's invalidation only reaches this one through the token
+    user_versions[f"user_version:{test_developer.id}"] = "bumped"
+    test_db.expire_all()  # requests share test_db; a real request gets a fresh session
+    response = await client.get("/api/auth/me", headers=developer_headers)
+    assert response.status_code == 403
+
+    await invalidate_cached_user(test_developer.id)
+    assert user_versions[f"user_version:{test_developer.id}"] != "bumped"
+
+
+def test_dummy_password_hash_matches_legacy_scheme():
+    """Test unknown-email logins verify against a bcrypt hash, like pre-migration accounts."""
+    from app.routers.auth import _DUMMY_PASSWORD_HASH
+    from app.utils.security import pwd_context
+
+    assert pwd_context.identify(_DUMMY_PASSWORD_HASH) == "bcrypt"
+    assert not pwd_context.verify("wrong-password", _DUMMY_PASSWORD_HASH)
+
+
+def test_verify_access_token_rejects_refresh_token():
+    """Test memoized verification still checks the token type."""
+    from app.dependencies import _verify_access_token
+    from app.utils.security import create_access_token, create_refresh_token
+
+    assert _verify_access_token(create_access_token(data={"sub": "user-1"}))["sub"] == "user-1"
+    assert _verify_access_token(create_refresh_token(data={"sub": "user-1"})) is None
+
+
 @pytest.mark.asyncio
 async def test_unauthorized_access(client: AsyncClient):
     """Test access without authentication."""
@@ -0,0 +1,127 @@
+"""
+Tests for email endpoints.
+"""
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import Email, Integration, IntegrationPlatform
+from tests.conftest import collect_pages
+
+
+@pytest.fixture
+def redis_down(fake_cache):
+    """Make every Redis helper the email paths use behave as if Redis were unreachable."""
+    fake_cache("app.routers.emails", "app.services.gmail_service", available=False)
+
+
+@pytest.fixture
+def sync_session(monkeypatch, test_engine):
+    """Point the background sync's own sessions at the test database."""
+    monkeypatch.setattr(
+        "app.database.AsyncSessionLocal",
+        async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False),
+    )
+
+
+@pytest_asyncio.fixture
+async def gmail_integration(test_db, test_developer):
+    """Connect Gmail for the developer user."""
+    integration = Integration(
+        platform=IntegrationPlatform.GMAIL,
+        access_token="app-password",
+        platform_metadata={"email": "developer@example.com"},
+        user_id=test_developer.id,
+    )
+    test_db.add(integration)
+    await test_db.commit()
+    return integration
+
+
+@pytest.mark.asyncio
+async def test_sync_emails_without_redis(
+    client: AsyncClient, developer_headers, test_db, gmail_integration, redis_down, sync_session, monkeypatch
+):
+    """Test a sync is accepted and pollable when Redis is unavailable."""
+    monkeypatch.setattr("app.routers.emails.fetch_emails", lambda **kwargs: [])
+
+    response = await client.post("/api/emails/sync", headers=developer_headers)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    response = await client.get(f"/api/emails/sync/{job_id}", headers=developer_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["new_count"] == 0
+    assert "user_id" not in data
+
+    await test_db.refresh(gmail_integration)
+    assert gmail_integration.last_synced_at is not None
+    assert gmail_integration.last_synced_at.tzinfo is None
+    assert abs(datetime.utcnow() - gmail_integration.last_synced_at).total_seconds() < 60
+
+
+@pytest.mark.asyncio
+async def test_sync_emails_fetch_failure(
+    client: AsyncClient, developer_headers, gmail_integration, redis_down, sync_session, monkeypatch
+):
+    """Test a failed Gmail fetch is reported through the status endpoint."""
+    def fetch_emails(**kwargs):
+        raise ConnectionError("IMAP login failed")
+
+    monkeypatch.setattr("app.routers.emails.fetch_emails", fetch_emails)
+
+    response = await client.post("/api/emails/sync", headers=developer_headers)
+    assert response.status_code == 202
+
+    response = await client.get(f"/api/emails/sync/{response.json()['job_id']}", headers=developer_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "failed"
+    assert "IMAP login failed" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_sync_status_other_user(
+    client: AsyncClient, developer_headers, admin_headers, gmail_integration, redis_down, sync_session, monkeypatch
+):
+    """Test a sync job is not visible to another user."""
+    monkeypatch.setattr("app.routers.emails.fetch_emails", lambda **kwargs: [])
+
+    response = await client.post("/api/emails/sync", headers=developer_headers)
+    job_id = response.json()["job_id"]
+
+    response = await client.get(f"/api/emails/sync/{job_id}", headers=admin_headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sync_emails_not_connected(client: AsyncClient, developer_headers, redis_down):
+    """Test sync without a Gmail integration is an immediate 404."""
+    response = await client.post("/api/emails/sync", headers=developer_headers)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_emails_keyset_pages(client: AsyncClient, developer_headers, test_db, test_developer):
+    """Test next_cursor walks every email once across NULL and equal received_at values."""
+    older = datetime(2026, 1, 1, 9, 0)
+    newer = datetime(2026, 1, 2, 9, 0)
+    received = [None, None, None, newer, newer, older, older]
+    test_db.add_all([
+        Email(gmail_message_id=f"<msg-{i}@example.com>", subject=f"Email {i}",
+              received_at=ts, user_id=test_developer.id)
+        for i, ts in enumerate(received)
+    ])
+    await test_db.commit()
+
+    seen = await collect_pages(client, "/api/emails", developer_headers, "emails", limit=2)
+
+    assert len(seen) == len(received)
+    assert len({e["id"] for e in seen}) == len(received)
+    # NULLs first, then newest first
+    assert [e["received_at"] for e in seen] == [None] * 3 + [newer.isoformat() + "Z"] * 2 + [older.isoformat() + "Z"] * 2
@@ -0,0 +1,42 @@
+"""
+Tests for meeting endpoints.
+"""
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+
+from app.models import Meeting
+from app.utils.pagination import encode_cursor
+from tests.conftest import collect_pages
+
+
+@pytest.mark.asyncio
+async def test_get_meetings_keyset_pages(client: AsyncClient, developer_headers, test_db, test_developer):
+    """Test next_cursor walks every meeting once across equal created_at values."""
+    older = datetime(2026, 1, 1, 9, 0)
+    newer = datetime(2026, 1, 2, 9, 0)
+    created = [newer, newer, newer, older, older]
+    test_db.add_all([
+        Meeting(title=f"Meeting {i}", created_at=ts, team_id=test_developer.team_id,
+                created_by_id=test_developer.id)
+        for i, ts in enumerate(created)
+    ])
+    await test_db.commit()
+
+    seen = await collect_pages(client, "/api/meetings", developer_headers, "meetings", limit=2)
+
+    assert len(seen) == len(created)
+    assert len({m["id"] for m in seen}) == len(created)
+    # Newest first
+    assert sorted(m["title"] for m in seen[:3]) == ["Meeting 0", "Meeting 1", "Meeting 2"]
+
+
+@pytest.mark.asyncio
+async def test_get_meetings_cursor_without_timestamp(client: AsyncClient, developer_headers):
+    """Test a cursor with no created_at is rejected."""
+    response = await client.get(
+        "/api/meetings", headers=developer_headers, params={"cursor": encode_cursor(None, "some-id")}
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,25 @@
+"""
+Unit tests for app/utils/storage.py
+
+Covers extract_key — pure string parsing, no storage backend involved.
+"""
+from app.utils.storage import extract_key
+
+
+class TestExtractKey:
+    def test_local(self):
+        assert extract_key("local://meetings/abc.mp3") == "meetings/abc.mp3"
+
+    def test_s3(self):
+        url = "https://bucket.s3.us-east-1.amazonaws.com/meetings/abc.mp3"
+        assert extract_key(url) == "meetings/abc.mp3"
+
+    def test_cloudinary(self):
+        url = "https://res.cloudinary.com/demo/video/upload/v1700000000/meetings/abc.mp3"
+        assert extract_key(url) == "v1700000000/meetings/abc.mp3"
+
+    def test_other_dot_com_host(self):
+        assert extract_key("https://cdn.example.com/meetings/abc.mp3") == "meetings/abc.mp3"
+
+    def test_unrecognised_returned_as_is(self):
+        assert extract_key("meetings/abc.mp3") == "meetings/abc.mp3"
@@ -174,3 +174,102 @@ async def test_get_task_stats(client: AsyncClient, auth_headers, test_db, test_u
     assert data["in_progress"] == 1
     assert data["done"] == 3
     assert data["completion_rate"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_keyset_pages(client: AsyncClient, admin_headers, test_db, test_admin):
+    """Test the X-Next-Cursor header walks every task exactly once."""
+    test_db.add_all([
+        Task(title=f"Task {i}", status="todo", priority="medium",
+             team_id=test_admin.team_id, created_by_id=test_admin.id, source_type="manual")
+        for i in range(5)
+    ])
+    await test_db.commit()
+
+    first = await client.get("/api/tasks", headers=admin_headers, params={"limit": 3})
+    assert first.status_code == 200
+    assert len(first.json()) == 3
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = await client.get("/api/tasks", headers=admin_headers, params={"limit": 3, "cursor": cursor})
+    assert second.status_code == 200
+    assert len(second.json()) == 2
+    assert "X-Next-Cursor" not in second.headers
+
+    ids = [t["id"] for t in first.json() + second.json()]
+    assert len(set(ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_invalid_cursor(client: AsyncClient, admin_headers):
+    """Test a malformed cursor is rejected."""
+    response = await client.get("/api/tasks", headers=admin_headers, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_stats_cached_until_task_changes(
+    client: AsyncClient, admin_headers, test_db, test_admin, fake_cache
+):
+    """Test stats are served from cache and dropped when a task is created or deleted."""
+    fake_cache("app.routers.tasks")
+    test_db.add(Task(title="Existing", status="todo", priority="medium",
+                     team_id=test_admin.team_id, created_by_id=test_admin.id, source_type="manual"))
+    await test_db.commit()
+
+    response = await client.get("/api/tasks/stats", headers=admin_headers)
+    assert response.json()["total"] == 1
+
+    # Written behind the API's back: the cached entry still answers
+    test_db.add(Task(title="Direct", status="todo", priority="medium",
+                     team_id=test_admin.team_id, created_by_id=test_admin.id, source_type="manual"))
+    await test_db.commit()
+    response = await client.get("/api/tasks/stats", headers=admin_headers)
+    assert response.json()["total"] == 1
+
+    created = await client.post("/api/tasks", headers=admin_headers, json={"title": "Via API"})
+    assert created.status_code == 201
+    response = await client.get("/api/tasks/stats", headers=admin_headers)
+    assert response.json()["total"] == 3
+
+    deleted = await client.delete(f"/api/tasks/{created.json()['id']}", headers=admin_headers)
+    assert deleted.status_code == 204
+    response = await client.get("/api/tasks/stats", headers=admin_headers)
+    assert response.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_task_removes_row(client: AsyncClient, admin_headers, test_db, test_admin):
+    """Test deletion removes the task and a second delete is a 404."""
+    task = Task(title="Task to Delete", status="todo", priority="medium",
+                team_id=test_admin.team_id, created_by_id=test_admin.id, source_type="manual")
+    test_db.add(task)
+    await test_db.commit()
+
+    response = await client.delete(f"/api/tasks/{task.id}", headers=admin_headers)
+    assert response.status_code == 204
+
+    response = await client.get(f"/api/tasks/{task.id}", headers=admin_headers)
+    assert response.status_code == 404
+
+    response = await client.delete(f"/api/tasks/{task.id}", headers=admin_headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_task_other_team(client: AsyncClient, admin_headers, test_db, test_admin):
+    """Test a task of another team cannot be deleted."""
+    from app.models import Team
+
+    other_team = Team(name="Other Team", plan="free", settings={})
+    test_db.add(other_team)
+    await test_db.commit()
+    task = Task(title="Not yours", status="todo", priority="medium",
+                team_id=other_team.id, source_type="manual")
+    test_db.add(task)
+    await test_db.commit()
+
+    response = await client.delete(f"/api/tasks/{task.id}", headers=admin_headers)
+
+    assert response.status_code == 404
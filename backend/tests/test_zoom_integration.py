@@ -12,6 +12,8 @@ import time
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import BackgroundTasks
+
 from app.services.zoom_service import ZoomService, token_needs_refresh
 
 
@@ -160,7 +162,7 @@ async def test_recording_completed_dedup_guard():
     }
 
     # Should return early without creating a new meeting or downloading anything
-    await _handle_recording_completed(obj, mock_db)
+    await _handle_recording_completed(obj, mock_db, BackgroundTasks())
 
     # db.execute called once (for dedup check), then no further inserts
     assert mock_db.execute.call_count == 1
@@ -181,7 +183,7 @@ async def test_recording_completed_skips_when_no_recording_files():
         "recording_files": [],
     }
 
-    await _handle_recording_completed(obj, mock_db)
+    await _handle_recording_completed(obj, mock_db, BackgroundTasks())
 
     # Nothing committed — no files to process
     mock_db.commit.assert_not_called()
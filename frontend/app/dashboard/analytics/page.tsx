@@ -17,39 +17,19 @@ import {
 } from 'lucide-react'
 
 export default function AnalyticsPage() {
-  const { data: workload, isLoading: workloadLoading } = useQuery({
-    queryKey: ['analytics', 'workload'],
+  // One request for the whole dashboard; the backend computes the sections concurrently
+  const { data: summary, isLoading } = useQuery({
+    queryKey: ['analytics', 'summary'],
     queryFn: async () => {
-      const { data } = await api.get('/api/analytics/workload?days=30')
+      const { data } = await api.get('/api/analytics/summary?days=30&trend_days=14')
       return data
     },
   })
 
-  const { data: teamWorkload, isLoading: teamLoading } = useQuery({
-    queryKey: ['analytics', 'team-workload'],
-    queryFn: async () => {
-      const { data } = await api.get('/api/analytics/team-workload')
-      return data
-    },
-  })
-
-  const { data: meetingInsights, isLoading: meetingsLoading } = useQuery({
-    queryKey: ['analytics', 'meeting-insights'],
-    queryFn: async () => {
-      const { data } = await api.get('/api/analytics/meeting-insights?days=30')
-      return data
-    },
-  })
-
-  const { data: trend, isLoading: trendLoading } = useQuery({
-    queryKey: ['analytics', 'productivity-trend'],
-    queryFn: async () => {
-      const { data } = await api.get('/api/analytics/productivity-trend?days=14')
-      return data
-    },
-  })
-
-  const isLoading = workloadLoading || teamLoading || meetingsLoading || trendLoading
+  const workload = summary?.workload
+  const teamWorkload = summary?.team_workload
+  const meetingInsights = summary?.meeting_insights
+  const trend = summary?.productivity_trend
 
   if (isLoading) {
     return (
@@ -89,7 +89,21 @@ export default function EmailsPage() {
 
   // Sync mutation
   const syncMutation = useMutation({
-    mutationFn: () => emailApi.syncEmails({ limit: 30, days: 7 }),
+    // Sync runs in the background on the server; poll the job until it finishes
+    mutationFn: async () => {
+      const { job_id } = (await emailApi.syncEmails({ limit: 30, days: 7 })).data
+      // Give up after ~3 minutes of "queued"/"running"
+      for (let attempt = 0; attempt < 120; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 1500))
+        const job = (await emailApi.getSyncStatus(job_id)).data
+        if (job.status === 'completed') return job
+        if (job.status === 'failed') {
+          throw Object.assign(new Error(job.detail), { response: { data: { detail: job.detail } } })
+        }
+      }
+      const detail = 'Sync is taking longer than expected. Refresh in a minute to see new emails.'
+      throw Object.assign(new Error(detail), { response: { data: { detail } } })
+    },
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['emails'] })
       queryClient.invalidateQueries({ queryKey: ['email-stats'] })
@@ -116,7 +130,7 @@ export default function EmailsPage() {
     },
   })
 
-  const emails: EmailItem[] = emailsData || []
+  const emails: EmailItem[] = emailsData?.emails || []
   const stats = statsData || { total: 0, unread: 0, flagged: 0 }
 
   return (
@@ -159,8 +173,8 @@ export default function EmailsPage() {
       {/* Sync result message */}
       {syncMutation.isSuccess && (
         <div className="rounded-md bg-green-50 dark:bg-green-950 p-3 text-sm text-green-800 dark:text-green-400">
-          {(syncMutation.data as any)?.data?.message || 'Sync complete!'}
-          {(syncMutation.data as any)?.data?.tasks_created > 0 && (
+          {(syncMutation.data as any)?.message || 'Sync complete!'}
+          {(syncMutation.data as any)?.tasks_created > 0 && (
             <span className="ml-1 font-medium">
               Check your Tasks dashboard for newly extracted tasks.
             </span>
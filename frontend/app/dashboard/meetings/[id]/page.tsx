@@ -104,12 +104,27 @@ export default function MeetingDetailPage() {
       const { data } = await meetingApi.getMeeting(meetingId)
       return data
     },
-    refetchInterval: (query) => {
-      const m = query.state.data
-      return m?.status === 'processing' || m?.status === 'awaiting_upload' ? 5000 : false
+  })
+
+  // While the pipeline runs, poll the lightweight status endpoint and only
+  // refetch the full meeting once its status moves on
+  const inFlight = meeting?.status === 'processing' || meeting?.status === 'awaiting_upload'
+  const { data: liveStatus } = useQuery<string>({
+    queryKey: ['meeting-status', meetingId],
+    queryFn: async () => {
+      const { data } = await meetingApi.getMeetingStatus(meetingId)
+      return data.status
     },
+    enabled: inFlight,
+    refetchInterval: 5000,
   })
 
+  useEffect(() => {
+    if (inFlight && liveStatus && liveStatus !== meeting?.status) {
+      queryClient.invalidateQueries({ queryKey: ['meeting', meetingId] })
+    }
+  }, [inFlight, liveStatus, meeting?.status, meetingId, queryClient])
+
   const { data: teamMembers } = useQuery<{ id: string; full_name: string; email: string }[]>({
     queryKey: ['team-members'],
     queryFn: async () => {
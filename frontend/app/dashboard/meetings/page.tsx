@@ -25,7 +25,7 @@ export default function MeetingsPage() {
   const [uploadError, setUploadError] = useState('')
 
   // Fetch meetings
-  const { data, isLoading } = useQuery<{ data: Meeting[] }>({
+  const { data, isLoading } = useQuery<{ data: { meetings: Meeting[]; next_cursor: string | null } }>({
     queryKey: ['meetings'],
     queryFn: () => meetingApi.getMeetings({ limit: 20 }),
     refetchInterval: 5000,
@@ -113,7 +113,7 @@ export default function MeetingsPage() {
     uploadMutation.mutate(formData)
   }
 
-  const meetings = data?.data || []
+  const meetings = data?.data?.meetings || []
 
   return (
     <div className="space-y-6">
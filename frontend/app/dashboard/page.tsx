@@ -61,7 +61,7 @@ export default function DashboardPage() {
   })
 
   // Recent meetings
-  const { data: meetingsResponse } = useQuery<{ data: Meeting[] }>({
+  const { data: meetingsResponse } = useQuery<{ data: { meetings: Meeting[]; next_cursor: string | null } }>({
     queryKey: ['recent-meetings'],
     queryFn: () => meetingApi.getMeetings({ limit: 3 }),
   })
@@ -75,7 +75,7 @@ export default function DashboardPage() {
 
   const taskStats = stats?.data
   const recentTasks = tasksResponse?.data || []
-  const recentMeetings = meetingsResponse?.data || []
+  const recentMeetings = meetingsResponse?.data?.meetings || []
   const userStats = userCountData?.data
 
   // Notification: tasks assigned in the last 7 days that are still todo/blocked
@@ -155,6 +155,7 @@ export const taskApi = {
 export const meetingApi = {
   getMeetings: (params?: Record<string, any>) => api.get('/api/meetings', { params }),
   getMeeting: (id: string) => api.get(`/api/meetings/${id}`),
+  getMeetingStatus: (id: string) => api.get(`/api/meetings/${id}/status`),
   uploadMeeting: (formData: FormData) =>
     api.post('/api/meetings/upload', formData, {
       headers: { 'Content-Type': 'multipart/form-data' },
@@ -189,6 +190,7 @@ export const emailApi = {
   getEmail: (id: string) => api.get(`/api/emails/${id}`),
   syncEmails: (params?: { limit?: number; days?: number }) =>
     api.post('/api/emails/sync', null, { params }),
+  getSyncStatus: (jobId: string) => api.get(`/api/emails/sync/${jobId}`),
   getStats: () => api.get('/api/emails/stats'),
   seedDemo: () => api.post('/api/emails/seed-demo'),
 }
@@ -274,6 +276,8 @@ export const analyticsApi = {
   getTeamWorkload: () => api.get('/api/analytics/team-workload'),
   getMeetingInsights: (days = 30) => api.get(`/api/analytics/meeting-insights?days=${days}`),
   getProductivityTrend: (days = 14) => api.get(`/api/analytics/productivity-trend?days=${days}`),
+  getSummary: (days = 30, trendDays = 14) =>
+    api.get('/api/analytics/summary', { params: { days, trend_days: trendDays } }),
 }
 
 export const notificationsApi = {